@@ -0,0 +1,28 @@
+"""Hot-path benchmarks compared against ``benchmarks/baseline.json``.
+
+Run with ``pytest -m benchmark``; refresh the baseline with
+``python -m vct.benchmarks --save``.
+"""
+
+import pytest
+
+from vct.benchmarks import (
+    BENCHMARKS,
+    DEFAULT_BASELINE_PATH,
+    DEFAULT_THRESHOLD,
+    compare,
+    load_baseline,
+    run_benchmark,
+)
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.parametrize("name", sorted(BENCHMARKS))
+def test_benchmark_within_baseline(name, request):
+    threshold = request.config.getoption("--benchmark-threshold") or DEFAULT_THRESHOLD
+    result = run_benchmark(name)
+    if not DEFAULT_BASELINE_PATH.exists():
+        pytest.skip("no stored baseline")
+    regressions = compare({name: result}, load_baseline(DEFAULT_BASELINE_PATH), threshold)
+    assert not regressions, f"{name} regressed x{regressions[0].ratio:.2f} (threshold {threshold:.0%})"
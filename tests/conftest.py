@@ -1,5 +1,49 @@
 
+import logging
 import sys, pathlib, os
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmark-threshold",
+        type=float,
+        default=None,
+        help="Allowed slowdown vs. benchmarks/baseline.json as a fraction (default: suite default)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    # Benchmarks are opt-in: run them with ``pytest -m benchmark``.
+    if "benchmark" in (config.getoption("markexpr") or ""):
+        return
+    skip = pytest.mark.skip(reason="benchmarks run only with -m benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def quiet_brain():
+    """Factory for silent brains on virtual time; each one is closed after the test."""
+
+    from vct.robodog.dog_bot_brain import RoboDogBrain
+
+    logger = logging.getLogger("RoboDogBrain")
+    level = logger.level
+    logger.setLevel(logging.WARNING)
+    brains = []
+
+    def build(config_overrides=None, **kwargs):
+        brain = RoboDogBrain.for_simulation(config_overrides=config_overrides, **kwargs)
+        brains.append(brain)
+        return brain
+
+    yield build
+    for brain in brains:
+        brain.close()
+    logger.setLevel(level)
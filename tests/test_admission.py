@@ -0,0 +1,52 @@
+from fastapi.testclient import TestClient
+
+from vct.api import app as api_module
+from vct.api.admission import AdmissionController
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_sheds_beyond_in_flight_limit_but_reserves_priority_slots():
+    ctl = AdmissionController(300, max_in_flight=2, priority_reserve=1, clock=_Clock())
+    tokens = [ctl.admit(), ctl.admit()]
+    assert None not in tokens
+    assert ctl.admit() is None
+    assert ctl.admit(priority=True) is not None
+    assert ctl.admit(priority=True) is None
+    stats = ctl.stats()
+    assert (stats.accepted, stats.shed, stats.accepted_priority, stats.shed_priority) == (2, 1, 1, 1)
+
+
+def test_sheds_when_latency_exceeds_budget_until_idle():
+    clock = _Clock()
+    ctl = AdmissionController(100, max_in_flight=10, ewma_alpha=1.0, clock=clock)
+    slow = ctl.admit()
+    busy = ctl.admit()
+    clock.now = 0.5
+    ctl.release(slow)
+    assert ctl.stats().latency_ewma_ms == 500.0
+    assert ctl.admit() is None  # over budget while work is in flight
+    assert ctl.admit(priority=True) is not None
+    assert ctl.retry_after_s() >= 1
+    ctl.release(busy)
+    ctl.release(clock.now)
+    assert ctl.admit() is not None  # idle server re-samples latency
+
+
+def test_act_returns_503_with_retry_after_when_shedding(monkeypatch):
+    runtime = api_module.get_runtime()
+    admission = AdmissionController(300, max_in_flight=1, priority_reserve=1)
+    monkeypatch.setattr(runtime, "admission", admission)
+    admission.in_flight = 1
+    c = TestClient(api_module.app)
+    r = c.post("/robot/act", json={"text": "сидіти"})
+    assert r.status_code == 503 and int(r.headers["retry-after"]) >= 1
+    assert c.post("/robot/act", json={"text": "голос"}).status_code == 200  # BARK is never rewarded
+    stats = c.get("/admission").json()
+    assert stats["shed"] == 1 and stats["accepted_priority"] == 1
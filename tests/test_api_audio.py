@@ -0,0 +1,101 @@
+import io
+import wave
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from vct.api import app as api_module
+from vct.engines.audio import load_audio
+from vct.robodog.dog_bot_brain import RoboDogBrain
+
+
+class _DecodingSTT:
+    """Decodes like WhisperSTT and records what the model would receive."""
+
+    def __init__(self):
+        self.samples = None
+
+    def transcribe(self, wav_path=None, use_mic=False, *, audio=None):
+        self.samples = load_audio(audio)
+        return "сидіти" if self.samples.size else ""
+
+
+def _pcm(n=1600):
+    return (np.arange(n, dtype=np.int16) % 100).tobytes()
+
+
+def _wav(rate=16000):
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(_pcm())
+    return buf.getvalue()
+
+
+def test_audio_upload_wav_and_pcm(monkeypatch):
+    stt = _DecodingSTT()
+    monkeypatch.setattr(api_module.brain, "stt", stt)
+    c = TestClient(api_module.app)
+    r = c.post("/robot/act/audio?dog_id=rex", content=_wav(), headers={"content-type": "audio/wav"})
+    assert r.status_code == 200
+    assert r.json()["text"] == "сидіти" and r.json()["result"]["action"] == "SIT"
+    assert stt.samples.size == 1600
+
+    r = c.post("/robot/act/audio", content=_pcm(), headers={"content-type": "audio/L16; rate=8000"})
+    assert r.status_code == 200
+    assert stt.samples.size == 3200  # resampled 8 kHz -> 16 kHz
+
+
+def test_audio_upload_limits(monkeypatch):
+    monkeypatch.setattr(api_module.brain, "stt", _DecodingSTT())
+    c = TestClient(api_module.app)
+    monkeypatch.setattr(api_module.brain.config.api, "max_audio_kb", 1)
+    assert c.post("/robot/act/audio", content=_wav()).status_code == 413
+    monkeypatch.setattr(api_module.brain.config.api, "max_audio_kb", 64)
+    assert c.post("/robot/act/audio", content=b"not a wav").status_code == 415
+    limit = api_module.get_runtime().stt_limit
+    monkeypatch.setattr(limit, "in_flight", limit.limit)
+    r = c.post("/robot/act/audio", content=_wav())
+    assert r.status_code == 503 and r.headers["retry-after"] == "1"
+
+
+def test_audio_upload_rejects_malformed_rate(monkeypatch):
+    monkeypatch.setattr(api_module.brain, "stt", _DecodingSTT())
+    c = TestClient(api_module.app)
+    r = c.post("/robot/act/audio", content=_pcm(), headers={"content-type": "audio/L16; rate=fast"})
+    assert r.status_code == 415 and "rate" in r.json()["detail"]
+
+
+def test_audio_upload_rejects_malformed_content_length(monkeypatch):
+    stt = _DecodingSTT()
+    monkeypatch.setattr(api_module.brain, "stt", stt)
+    c = TestClient(api_module.app)
+    r = c.post("/robot/act/audio", content=_wav(), headers={"Content-Length": "abc"})
+    assert r.status_code == 400 and r.json()["detail"] == "Invalid Content-Length header"
+    assert stt.samples is None
+
+
+def test_audio_upload_goes_through_admission(monkeypatch):
+    from vct.api.admission import AdmissionController
+
+    monkeypatch.setattr(api_module.brain, "stt", _DecodingSTT())
+    admission = AdmissionController(300, max_in_flight=1, priority_reserve=0)
+    monkeypatch.setattr(api_module.get_runtime(), "admission", admission)
+    c = TestClient(api_module.app)
+    admission.in_flight = 1
+    r = c.post("/robot/act/audio", content=_wav())
+    assert r.status_code == 503 and int(r.headers["retry-after"]) >= 1
+    assert api_module.get_runtime().stt_limit.in_flight == 0
+    admission.in_flight = 0
+    assert c.post("/robot/act/audio", content=_wav()).status_code == 200
+    stats = admission.stats()
+    assert (stats.shed, stats.accepted, stats.in_flight) == (1, 1, 0)
+
+
+def test_run_once_from_audio_uses_memory_buffer():
+    brain = RoboDogBrain(simulate=True)
+    brain.stt = _DecodingSTT()
+    assert brain.run_once_from_audio(_wav())["action"] == "SIT"
+    assert brain.run_once_from_audio(_pcm(), sample_rate=16000)["action"] == "SIT"
@@ -0,0 +1,52 @@
+from fastapi.testclient import TestClient
+
+from vct.api import app as api_module
+from vct.robodog.dog_bot_brain import RoboDogBrain
+from vct.utils.clock import VirtualClock
+
+
+def test_batch_returns_results_in_order_with_item_errors():
+    c = TestClient(api_module.app)
+    r = c.post(
+        "/robot/act/batch",
+        json=[
+            {"text": "сидіти", "confidence": 0.9},
+            {"confidence": 0.5},
+            {"text": "до мене", "dog_id": "rex"},
+        ],
+    )
+    assert r.status_code == 200
+    data = r.json()
+    assert data["ok"] is False
+    first, bad, third = data["results"]
+    assert first["ok"] and first["result"]["action"] == "SIT"
+    assert bad == {"ok": False, "error": "text: Field required"}
+    assert third["ok"] and "score" in third["result"]
+
+
+def test_batch_rejects_oversized_and_malformed_bodies(monkeypatch):
+    c = TestClient(api_module.app)
+    monkeypatch.setattr(api_module.brain.config.api, "max_batch_items", 2)
+    assert c.post("/robot/act/batch", json=[{"text": "сидіти"}] * 3).status_code == 413
+    assert c.post("/robot/act/batch", json={"text": "сидіти"}).status_code == 422
+    assert c.post("/robot/act/batch", content=b"[{").status_code == 400
+    malformed = c.post("/robot/act/batch", content=b"[]", headers={"Content-Length": "abc"})
+    assert malformed.status_code == 400
+    assert malformed.json()["detail"] == "Invalid Content-Length header"
+
+
+def test_decide_batch_matches_single_decisions():
+    texts = ["сидіти", "лежати", "щось інше"]
+    single = RoboDogBrain(simulate=True, clock=VirtualClock(start=1e6))
+    batch = RoboDogBrain(simulate=True, clock=VirtualClock(start=1e6))
+    expected = [single.decide(t, 0.9, 0.5, 0.0, dog_id=f"d{i}")[0] for i, t in enumerate(texts)]
+    got = [result for result, _ in batch.decide_batch(texts, 0.9, 0.5, 0.0, ["d0", "d1", "d2"])]
+    assert [g["action"] for g in got] == [e["action"] for e in expected]
+    for g, e in zip(got, expected):
+        assert abs(g["score"] - e["score"]) < 1e-9 and g["rewarded"] == e["rewarded"]
+
+
+def test_decide_batch_applies_cooldown_within_batch():
+    brain = RoboDogBrain(simulate=True, clock=VirtualClock(start=1e6), config_overrides={"ethics": {"min_score": 0.0}})
+    results = [r for r, _ in brain.decide_batch(["сидіти", "сидіти"], dog_ids=["rex", "rex"])]
+    assert [r["rewarded"] for r in results] == [True, False]
@@ -0,0 +1,49 @@
+import time
+
+from fastapi.testclient import TestClient
+
+from vct.api import app as api_module
+from vct.api.runtime import ApiRuntime
+from vct.robodog.dog_bot_brain import RoboDogBrain
+
+
+def test_lifespan_builds_runtime_and_reports_readiness():
+    previous = getattr(api_module.app.state, "runtime", None)
+    api_module.app.state.runtime = None
+    try:
+        with TestClient(api_module.app) as c:
+            runtime = api_module.app.state.runtime
+            assert runtime is not None
+            assert runtime.ready.wait(10.0)
+            r = c.get("/ready")
+            assert r.status_code == 200
+            assert set(r.json()["warmup_s"]) == {"matcher", "policy", "tts", "stt"}
+            assert c.post("/robot/act", json={"text": "сидіти"}).status_code == 200
+        assert api_module.app.state.runtime is None
+    finally:
+        api_module.app.state.runtime = previous
+
+
+def test_ready_is_503_until_warm_up_completes(monkeypatch):
+    runtime = ApiRuntime(RoboDogBrain(simulate=True, defer_warmup=True))
+    monkeypatch.setattr(api_module.app.state, "runtime", runtime, raising=False)
+    c = TestClient(api_module.app)
+    assert c.get("/ready").status_code == 503
+    runtime.warm_up()
+    assert c.get("/ready").json()["ready"] is True
+
+
+def test_failed_warm_up_stays_unready():
+    brain = RoboDogBrain(simulate=True, defer_warmup=True)
+
+    def boom():
+        raise RuntimeError("no policy")
+
+    brain.warm_up = boom
+    runtime = ApiRuntime(brain)
+    runtime.start_warm_up().join(5.0)
+    assert not runtime.ready.is_set() and runtime.warmup_error == "no policy"
+
+
+def test_brain_attribute_is_resolved_lazily():
+    assert api_module.brain is api_module.get_runtime().brain
@@ -0,0 +1,145 @@
+import io
+import wave
+
+from fastapi.testclient import TestClient
+
+from vct.api import app as api_module
+
+
+def _wav_bytes() -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(16000)
+        w.writeframes(b"\x00\x01" * 1600)
+    return buf.getvalue()
+
+
+class _FakeSTT:
+    def transcribe(self, wav_path=None, use_mic=False, *, audio=None):
+        return "сидіти" if audio else ""
+
+
+def test_session_streams_decisions_and_cleans_up(monkeypatch):
+    brain = api_module.brain
+    ended = []
+    monkeypatch.setattr(brain.guard, "end_session", ended.append)
+    c = TestClient(api_module.app)
+    with c.websocket_connect("/robot/session/rex") as ws:
+        assert ws.receive_json() == {"type": "ready", "dog_id": "rex"}
+        ws.send_json({"type": "command", "text": "сидіти", "confidence": 0.9, "id": 1})
+        decision = ws.receive_json()
+        assert decision["type"] == "decision" and decision["id"] == 1
+        assert decision["result"]["action"] == "SIT"
+        ws.send_json({"type": "ping"})
+        while (event := ws.receive_json())["type"] == "reward":
+            pass
+        assert event == {"type": "pong"}
+        assert api_module.sessions.active("rex") == 1
+    # Disconnecting must not reset cooldowns or session limits for the dog.
+    assert ended == []
+    assert api_module.sessions.active("rex") == 0
+
+
+def test_reconnecting_does_not_bypass_reward_cooldown(monkeypatch):
+    monkeypatch.setattr(api_module.brain.guard.cfg, "min_score", 0.0)
+    c = TestClient(api_module.app)
+    rewarded = []
+    for _ in range(3):
+        with c.websocket_connect("/robot/session/cooldown-dog") as ws:
+            ws.receive_json()
+            ws.send_json({"type": "command", "text": "сидіти", "confidence": 0.99, "reward_bias": 1.0})
+            rewarded.append(ws.receive_json()["result"]["rewarded"])
+    assert rewarded == [True, False, False]
+    r = c.post("/robot/act", json={"text": "сидіти", "confidence": 0.99, "reward_bias": 1.0, "dog_id": "cooldown-dog"})
+    assert r.json()["result"]["rewarded"] is False
+
+
+def test_session_transcribes_audio_chunks(monkeypatch):
+    monkeypatch.setattr(api_module.brain, "stt", _FakeSTT())
+    audio = _wav_bytes()
+    c = TestClient(api_module.app)
+    with c.websocket_connect("/robot/session/bella") as ws:
+        ws.receive_json()
+        ws.send_bytes(audio[:100])
+        ws.send_bytes(audio[100:])
+        ws.send_json({"type": "audio_end", "id": "a1"})
+        assert ws.receive_json() == {"type": "transcript", "id": "a1", "text": "сидіти"}
+        assert ws.receive_json()["type"] == "decision"
+
+
+def test_session_audio_rejects_bad_fields_and_respects_stt_limit(monkeypatch):
+    monkeypatch.setattr(api_module.brain, "stt", _FakeSTT())
+    limit = api_module.get_runtime().stt_limit
+    c = TestClient(api_module.app)
+    with c.websocket_connect("/robot/session/luna") as ws:
+        ws.receive_json()
+        ws.send_bytes(_wav_bytes())
+        ws.send_json({"type": "audio_end", "id": "a2", "confidence": "high"})
+        error = ws.receive_json()
+        assert error["type"] == "error" and error["id"] == "a2"
+        monkeypatch.setattr(limit, "in_flight", limit.limit)
+        ws.send_bytes(_wav_bytes())
+        ws.send_json({"type": "audio_end", "id": "a3"})
+        assert ws.receive_json() == {"type": "error", "id": "a3", "error": "Speech recognition is busy"}
+        monkeypatch.setattr(limit, "in_flight", 0)
+        ws.send_json({"type": "ping"})  # the socket is still usable
+        assert ws.receive_json() == {"type": "pong"}
+
+
+def test_session_commands_go_through_admission(monkeypatch):
+    from vct.api.admission import AdmissionController
+
+    monkeypatch.setattr(api_module.brain, "stt", _FakeSTT())
+    admission = AdmissionController(300, max_in_flight=1, priority_reserve=1)
+    monkeypatch.setattr(api_module.get_runtime(), "admission", admission)
+    admission.in_flight = 1
+    c = TestClient(api_module.app)
+    with c.websocket_connect("/robot/session/nova") as ws:
+        ws.receive_json()
+        ws.send_json({"type": "command", "text": "сидіти", "id": 1})
+        shed = ws.receive_json()
+        assert shed["type"] == "error" and shed["id"] == 1 and shed["retry_after"] >= 1
+        ws.send_json({"type": "command", "text": "голос", "id": 2})  # BARK is never rewarded: priority
+        assert ws.receive_json()["type"] == "decision"
+        ws.send_bytes(_wav_bytes())
+        ws.send_json({"type": "audio_end", "id": 3})
+        assert ws.receive_json()["error"] == "Server is over its latency budget"
+    stats = admission.stats()
+    assert (stats.shed, stats.accepted_priority, stats.in_flight) == (2, 1, 1)
+
+
+def test_session_reports_bad_messages():
+    c = TestClient(api_module.app)
+    with c.websocket_connect("/robot/session/max") as ws:
+        ws.receive_json()
+        ws.send_text("not json")
+        assert ws.receive_json()["type"] == "error"
+        ws.send_json({"type": "command", "id": 3})
+        assert ws.receive_json() == {"type": "error", "id": 3, "error": "Field required"}
+        ws.send_json({"type": "dance"})
+        assert "Unknown message type" in ws.receive_json()["error"]
+
+
+def test_send_blocks_when_client_falls_behind():
+    import asyncio
+
+    from vct.api.sessions import CommandSession, SessionRegistry
+
+    class _StalledSocket:
+        async def send_json(self, event):
+            await asyncio.Event().wait()  # client never reads
+
+    async def scenario():
+        session = CommandSession(_StalledSocket(), api_module.brain, "slow", registry=SessionRegistry(), queue_size=2)
+        session._sender = asyncio.create_task(session._send_loop())
+        for i in range(3):  # one in flight in the sender, two queued
+            await session._send({"n": i})
+        blocked = asyncio.ensure_future(session._send({"n": 3}))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+        blocked.cancel()
+        session._sender.cancel()
+
+    asyncio.run(scenario())
@@ -0,0 +1,66 @@
+import asyncio
+import threading
+
+from vct.benchmarks.load import build_app, measure, run_load
+from vct.ethics.guard import EthicsConfig, EthicsGuard
+from vct.utils.clock import VirtualClock
+
+
+def test_try_reward_is_atomic_across_threads():
+    guard = EthicsGuard(EthicsConfig(min_inter_reward_s=10.0), clock=VirtualClock(start=1000.0))
+    barrier = threading.Barrier(16)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(guard.try_reward(1000.0, "SIT", 0.9, 3.0).allowed)
+
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results.count(True) == 1
+
+
+_EAGER = {"ethics": {"min_score": 0.0}}
+
+
+def test_handle_command_async_matches_sync_decision(quiet_brain):
+    sync_out = quiet_brain(_EAGER).handle_command("сидіти", 0.9, 0.5, 0.1)
+    async_out = asyncio.run(quiet_brain(_EAGER).handle_command_async("сидіти", 0.9, 0.5, 0.1))
+    assert async_out == sync_out
+    assert async_out["rewarded"] is True
+
+
+def test_contended_sqlite_state_does_not_block_the_event_loop(tmp_path, quiet_brain):
+    import sqlite3
+
+    path = tmp_path / "state.sqlite"
+    brain = quiet_brain({**_EAGER, "state": {"backend": "sqlite", "path": str(path)}})
+    other_worker = sqlite3.connect(path, isolation_level=None)
+    other_worker.execute("BEGIN IMMEDIATE")  # holds the write lock like a busy worker
+
+    async def scenario():
+        command = asyncio.ensure_future(brain.handle_command_async("сидіти", 0.9, 0.5, 0.1))
+        ticks = 0
+        for _ in range(20):
+            await asyncio.sleep(0.01)
+            ticks += 1
+        assert not command.done()  # still waiting for the lock, but the loop kept running
+        other_worker.execute("COMMIT")
+        return ticks, await command
+
+    ticks, result = asyncio.run(scenario())
+    other_worker.close()
+    assert ticks == 20 and result["rewarded"] is True
+
+
+def test_async_app_serves_concurrent_requests(quiet_brain):
+    elapsed, latencies = asyncio.run(run_load(build_app("async", quiet_brain(_EAGER)), requests=20, concurrency=5))
+    assert len(latencies) == 20 and elapsed > 0
+
+
+def test_measure_reports_throughput():
+    result = measure("sync", requests=10, concurrency=2, speech_delay_s=0.0)
+    assert result.requests == 10 and result.requests_per_s > 0
@@ -0,0 +1,76 @@
+
+import io
+import struct
+import wave
+
+import numpy as np
+import pytest
+
+from vct.engines.audio import AudioDecodeError, load_audio, resample
+from vct.engines.stt import WhisperSTT
+
+
+def _wav_bytes(rate=44100, channels=2, frames=4410):
+    t = np.arange(frames) / rate
+    mono = (np.sin(2 * np.pi * 440 * t) * 0.5 * 32767).astype("<i2")
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(np.repeat(mono, channels).tobytes())
+    return buf.getvalue()
+
+def test_load_audio_from_bytes_resamples_and_downmixes():
+    samples = load_audio(_wav_bytes())
+    assert samples.dtype == np.float32
+    assert samples.shape == (1600,)
+    assert abs(float(samples.max()) - 0.5) < 0.01
+
+def test_load_audio_from_path_matches_bytes(tmp_path):
+    payload = _wav_bytes(rate=16000, channels=1)
+    path = tmp_path / "clip.wav"
+    path.write_bytes(payload)
+    assert np.array_equal(load_audio(path), load_audio(payload))
+
+def test_load_audio_rejects_non_wav():
+    with pytest.raises(AudioDecodeError):
+        load_audio(b"not a wav file")
+
+def _patched_header(payload, offset, fmt, value):
+    data = bytearray(payload)
+    struct.pack_into(fmt, data, offset, value)
+    return bytes(data)
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda wav: wav[:12] + wav[36:],  # fmt chunk removed
+        lambda wav: _patched_header(wav, 22, "<H", 0),  # zero channels
+        lambda wav: _patched_header(wav, 24, "<I", 0),  # zero sample rate
+        lambda wav: wav[:30],  # truncated inside fmt
+    ],
+    ids=["no-fmt", "zero-channels", "zero-rate", "truncated"],
+)
+def test_load_audio_from_corrupt_path_raises_decode_error(tmp_path, corrupt):
+    path = tmp_path / "broken.wav"
+    path.write_bytes(corrupt(_wav_bytes(rate=16000, channels=1)))
+    with pytest.raises(AudioDecodeError):
+        load_audio(path)
+
+def test_resample_identity():
+    x = np.linspace(-1, 1, 100, dtype=np.float32)
+    assert np.array_equal(resample(x, 16000, 16000), x)
+
+def test_whisper_receives_array_not_path():
+    seen = {}
+
+    class FakeModel:
+        def transcribe(self, audio):
+            seen["audio"] = audio
+            return {"text": " сидіти "}
+
+    stt = WhisperSTT(model_loader=lambda name, device: FakeModel())
+    assert stt.transcribe(audio=_wav_bytes()) == "сидіти"
+    assert isinstance(seen["audio"], np.ndarray)
+    assert seen["audio"].shape == (1600,)
@@ -0,0 +1,82 @@
+import io
+import json
+import threading
+
+from vct.batch import BatchRunner, iter_records
+from vct.cli import main
+from vct.robodog.dog_bot_brain import RoboDogBrain
+
+
+class _SlowSTT:
+    def __init__(self):
+        self.threads = set()
+
+    def transcribe(self, wav_path=None, use_mic=False, *, audio=None):
+        self.threads.add(threading.get_ident())
+        if wav_path == "missing.wav":
+            raise FileNotFoundError(wav_path)
+        return "лежати"
+
+
+def test_iter_records_reports_bad_lines():
+    rows = list(iter_records(['{"text": "сидіти"}', "", "oops", "[1]", '{"mood": 0.1}']))
+    assert [r[0] for r in rows] == [0, 1, 2, 3]
+    assert rows[0][1] == {"text": "сидіти"}
+    assert all(r[1] is None for r in rows[1:])
+
+
+def test_batch_runner_streams_results_with_parallel_stt():
+    brain = RoboDogBrain(simulate=True)
+    brain.stt = _SlowSTT()
+    out = io.StringIO()
+    lines = [
+        json.dumps({"text": "сидіти", "id": "a", "confidence": 0.9}),
+        json.dumps({"wav": "one.wav", "dog_id": "rex"}),
+        json.dumps({"wav": "missing.wav"}),
+        "not json",
+        json.dumps({"wav": "two.wav"}),
+    ]
+    summary = BatchRunner(brain, out, stt_workers=3).run(lines)
+    results = {r["index"]: r for r in map(json.loads, out.getvalue().splitlines())}
+    assert sorted(results) == [0, 1, 2, 3, 4]
+    assert results[0]["id"] == "a" and results[0]["result"]["action"] == "SIT"
+    assert results[1]["text"] == "лежати" and results[1]["result"]["action"] == "LIE_DOWN"
+    assert not results[2]["ok"] and not results[3]["ok"]
+    assert (summary.records, summary.errors, summary.transcribed) == (5, 2, 2)
+    assert threading.get_ident() not in brain.stt.threads
+
+
+def test_batch_runner_reports_bad_fields_and_brain_errors_per_record(monkeypatch):
+    brain = RoboDogBrain(simulate=True)
+    handle = brain.handle_command
+
+    def flaky(text, **kwargs):
+        if text == "boom":
+            raise RuntimeError("actuator jammed")
+        return handle(text, **kwargs)
+
+    monkeypatch.setattr(brain, "handle_command", flaky)
+    out = io.StringIO()
+    lines = [
+        json.dumps({"text": "сидіти", "confidence": "high"}),
+        json.dumps({"text": "boom"}),
+        json.dumps({"text": "лежати", "mood": None}),
+        json.dumps({"text": "сидіти"}),
+    ]
+    summary = BatchRunner(brain, out).run(lines)
+    results = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [r["ok"] for r in results] == [False, False, False, True]
+    assert "invalid numeric field" in results[0]["error"]
+    assert results[1]["error"] == "actuator jammed"
+    assert results[3]["result"]["action"] == "SIT"
+    assert summary.records == 4 and summary.errors == 3
+
+
+def test_cli_batch_reads_file_and_prints_summary(tmp_path, capsys):
+    path = tmp_path / "cmds.jsonl"
+    path.write_text('{"text": "сидіти"}\n{"text": "до мене"}\n', encoding="utf-8")
+    main(["--simulate", "--batch", str(path)])
+    captured = capsys.readouterr()
+    lines = [json.loads(line) for line in captured.out.splitlines()]
+    assert [line["index"] for line in lines] == [0, 1]
+    assert "processed 2 records" in captured.err
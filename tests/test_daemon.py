@@ -0,0 +1,109 @@
+import argparse
+import json
+import socket
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from vct import daemon
+from vct.cli import _brain_options, main
+from vct.robodog.dog_bot_brain import RoboDogBrain
+
+
+@pytest.fixture()
+def socket_path():
+    # AF_UNIX paths are limited to ~100 bytes, so avoid pytest's long tmp_path.
+    with tempfile.TemporaryDirectory(prefix="vct-") as tmp:
+        yield Path(tmp) / "vct.sock"
+
+
+@pytest.fixture()
+def server(socket_path):
+    brain = RoboDogBrain(simulate=True)
+    srv = daemon.BrainServer(brain, socket_path)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+    thread.join(timeout=5)
+    brain.close()
+
+
+def test_daemon_answers_commands_and_errors(server, socket_path):
+    assert daemon.request({"op": "ping"}, socket_path)["ok"] is True
+    reply = daemon.request({"cmd": "сидіти", "dog_id": "rex"}, socket_path)
+    assert reply["ok"] is True
+    assert reply["result"]["action"] == "SIT"
+    assert daemon.request({"mood": 1}, socket_path) == {
+        "ok": False,
+        "error": "request needs a 'cmd' or 'wav' field",
+    }
+    assert oct(socket_path.stat().st_mode & 0o777) == "0o600"
+
+
+def test_daemon_refuses_a_second_instance_and_cleans_up(server, socket_path):
+    with pytest.raises(RuntimeError):
+        daemon.BrainServer(RoboDogBrain(simulate=True), socket_path)
+    server.shutdown()
+    server.server_close()
+    assert not socket_path.exists()
+
+
+def test_stale_socket_is_replaced(socket_path):
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(socket_path))
+    stale.close()  # leaves the file behind with nobody listening
+    with pytest.raises(daemon.DaemonUnavailable):
+        daemon.request({"op": "ping"}, socket_path)
+    srv = daemon.BrainServer(RoboDogBrain(simulate=True), socket_path)
+    srv.server_close()
+
+
+def test_existing_non_socket_file_is_left_alone(socket_path):
+    socket_path.write_text("important")
+    with pytest.raises(RuntimeError, match="not a socket"):
+        daemon.BrainServer(RoboDogBrain(simulate=True), socket_path)
+    assert socket_path.read_text() == "important"
+
+
+def test_serve_closes_the_brain_when_setup_fails(socket_path, monkeypatch):
+    socket_path.write_text("important")
+    brain = RoboDogBrain(simulate=True)
+    closed = []
+    close = brain.close
+    monkeypatch.setattr(brain, "close", lambda: closed.append(True) or close())
+    with pytest.raises(RuntimeError, match="not a socket"):
+        daemon.serve(brain, socket_path)
+    assert closed == [True]
+
+
+def test_cli_client_runs_in_process_when_brain_options_differ(server, socket_path, capsys, monkeypatch):
+    calls = []
+    monkeypatch.setattr(server.brain, "handle_command", lambda text, **kw: calls.append(text) or {"action": "X"})
+    monkeypatch.setattr(server, "options", {"config": "/elsewhere.yaml", "simulate": True, "gpio_pin": None})
+    main(["--client", "--simulate", "--socket", str(socket_path), "--cmd", "сидіти"])
+    captured = capsys.readouterr()
+    assert calls == [] and "running in-process" in captured.err
+    assert json.loads(captured.out[captured.out.index("{") :])["action"] == "SIT"
+
+    matching = _brain_options(argparse.Namespace(config="vct/config.yaml", simulate=True, gpio_pin=None))
+    monkeypatch.setattr(server, "options", matching)
+    main(["--client", "--simulate", "--socket", str(socket_path), "--cmd", "лежати"])
+    assert calls == ["лежати"]
+
+
+def test_cli_client_uses_daemon(server, socket_path, capsys, monkeypatch):
+    calls = []
+    monkeypatch.setattr(server.brain, "handle_command", lambda text, **kw: calls.append(text) or {"action": "X"})
+    main(["--client", "--socket", str(socket_path), "--cmd", "лежати"])
+    assert calls == ["лежати"]
+    assert json.loads(capsys.readouterr().out) == {"action": "X"}
+
+
+def test_cli_client_falls_back_in_process(socket_path, capsys):
+    main(["--client", "--simulate", "--socket", str(socket_path), "--cmd", "сидіти"])
+    out = capsys.readouterr().out
+    assert json.loads(out[out.index("{") :])["action"] == "SIT"
@@ -0,0 +1,39 @@
+
+from vct.ethics.guard import EthicsConfig, EthicsGuard
+
+
+def test_dogs_do_not_throttle_each_other():
+    g = EthicsGuard(EthicsConfig(min_inter_reward_s=2.0))
+    assert g.can_reward(100.0, "SIT", 0.9, 0.0, dog_id="rex")
+    g.note_reward(100.0, "SIT", dog_id="rex")
+    assert not g.can_reward(100.5, "SIT", 0.9, 0.0, dog_id="rex")
+    assert g.can_reward(100.5, "SIT", 0.9, 0.0, dog_id="bim")
+
+
+def test_session_duration_is_enforced():
+    g = EthicsGuard(EthicsConfig(max_session_min=1, session_idle_s=600.0))
+    assert g.can_reward(100.0, "SIT", 0.9, 0.0)
+    decision = g.evaluate(100.0 + 61.0, "SIT", 0.9, 0.0)
+    assert not decision.allowed and decision.reason == "session_limit"
+
+
+def test_token_bucket_limits_rewards_per_action():
+    g = EthicsGuard(EthicsConfig(min_inter_reward_s=0.0, burst_rewards=2, burst_window_s=60.0))
+    for ts in (100.0, 101.0):
+        assert g.can_reward(ts, "SIT", 0.9, 0.0)
+        g.note_reward(ts, "SIT")
+    assert g.evaluate(102.0, "SIT", 0.9, 0.0).reason == "rate_limited"
+    assert g.can_reward(102.0, "COME", 0.9, 0.0)
+    assert g.can_reward(100.0 + 31.0, "SIT", 0.9, 0.0)
+
+
+def test_idle_sessions_are_evicted():
+    g = EthicsGuard(EthicsConfig(session_idle_s=10.0, max_sessions=100))
+    for i in range(50):
+        g.can_reward(100.0, "SIT", 0.9, 0.0, dog_id=f"dog-{i}")
+    assert g.session_count == 50
+    g.can_reward(200.0, "SIT", 0.9, 0.0, dog_id="late")
+    assert g.session_count == 1
+    for i in range(150):
+        g.can_reward(200.0, "SIT", 0.9, 0.0, dog_id=f"burst-{i}")
+    assert g.session_count == 100
@@ -0,0 +1,70 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from vct.configuration import load_config
+from vct.ethics.guard import EthicsConfig, EthicsGuard
+from vct.ethics.state import MemoryStateBackend, SQLiteStateBackend, create_state_backend
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryStateBackend()
+    else:
+        b = SQLiteStateBackend(tmp_path / "state.sqlite")
+        yield b
+        b.close()
+
+
+def test_backends_enforce_cooldown_and_buckets(backend):
+    g = EthicsGuard(EthicsConfig(min_inter_reward_s=2.0, burst_rewards=1, burst_window_s=60.0), backend=backend)
+    assert g.try_reward(100.0, "SIT", 0.9, 0.0, dog_id="rex").allowed
+    assert g.try_reward(101.0, "SIT", 0.9, 0.0, dog_id="rex").reason == "cooldown"
+    assert g.try_reward(103.0, "SIT", 0.9, 0.0, dog_id="rex").reason == "rate_limited"
+    assert g.try_reward(103.0, "COME", 0.9, 0.0, dog_id="rex").allowed
+    assert g.session_count == 1
+    g.end_session("rex")
+    assert g.session_count == 0
+
+
+def test_backends_evict_idle_and_excess_sessions(backend):
+    g = EthicsGuard(EthicsConfig(session_idle_s=10.0, max_sessions=5), backend=backend)
+    for i in range(5):
+        g.evaluate(100.0, "SIT", 0.9, 0.0, dog_id=f"dog-{i}")
+    g.evaluate(200.0, "SIT", 0.9, 0.0, dog_id="late")
+    assert g.session_count == 1
+    for i in range(8):
+        g.evaluate(200.0 + i, "SIT", 0.9, 0.0, dog_id=f"burst-{i}")
+    assert g.session_count == 5
+
+
+def test_sqlite_state_is_shared_between_guards(tmp_path):
+    path = tmp_path / "state.sqlite"
+    first = EthicsGuard(EthicsConfig(min_inter_reward_s=5.0), backend=SQLiteStateBackend(path))
+    second = EthicsGuard(EthicsConfig(min_inter_reward_s=5.0), backend=SQLiteStateBackend(path))
+    assert first.try_reward(100.0, "SIT", 0.9, 0.0, dog_id="rex").allowed
+    assert second.try_reward(101.0, "SIT", 0.9, 0.0, dog_id="rex").reason == "cooldown"
+
+
+def _race(path, worker):
+    guard = EthicsGuard(EthicsConfig(min_inter_reward_s=60.0), backend=SQLiteStateBackend(path))
+    return sum(guard.try_reward(100.0 + worker * 1e-3, "SIT", 0.9, 0.0, dog_id="rex").allowed for _ in range(20))
+
+
+def test_sqlite_books_one_reward_across_processes(tmp_path):
+    path = tmp_path / "state.sqlite"
+    SQLiteStateBackend(path).close()
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        granted = list(pool.map(_race, [path] * 4, range(4)))
+    assert sum(granted) == 1
+
+
+def test_state_backend_configuration(tmp_path):
+    assert isinstance(create_state_backend(None), MemoryStateBackend)
+    with pytest.raises(ValueError):
+        create_state_backend({"backend": "redis"})
+    with pytest.raises(ValueError):
+        load_config(overrides={"state": {"backend": "sqlite"}})
+    cfg = load_config(overrides={"state": {"backend": "sqlite", "path": str(tmp_path / "s.db")}})
+    assert isinstance(create_state_backend(cfg.state.model_dump()), SQLiteStateBackend)
@@ -0,0 +1,90 @@
+import random
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+import vct
+
+_COMMANDS = ["сидіти", "Лежати!", "до_мене", "голос", "що це?"]
+_PACKAGE = str(Path(vct.__file__).resolve().parent)
+
+
+@pytest.fixture
+def brains(quiet_brain):
+    """Regular and hot-path brains with otherwise identical configuration."""
+
+    return tuple(quiet_brain({"hot_path": hot_path, "ethics": {"min_score": 0.0}}) for hot_path in (False, True))
+
+
+def test_hot_path_matches_the_regular_path_exactly(brains):
+    regular, hot = brains
+    rng = random.Random(7)
+    for _ in range(2000):
+        args = (
+            rng.choice(_COMMANDS),
+            rng.uniform(-0.5, 1.5),
+            rng.uniform(-0.5, 1.5),
+            rng.choice([None, rng.uniform(-2.0, 2.0)]),
+            rng.choice([None, rng.uniform(-1.0, 2.0)]),
+        )
+        assert hot.decide(*args) == regular.decide(*args)
+        assert hot.last_features() == regular.last_features()
+
+
+def test_hot_path_follows_changed_context_and_reward_map(brains):
+    regular, hot = brains
+
+    def assert_in_sync():
+        for command in _COMMANDS:
+            assert hot.decide(command, 0.9, 0.5) == regular.decide(command, 0.9, 0.5)
+            assert hot.last_features() == regular.last_features()
+
+    assert_in_sync()
+    for brain in (regular, hot):  # legacy integrations edit the public dicts in place
+        brain.reward_map["SIT"] = False
+        brain.reward_map["BARK"] = True
+        brain.behavior_context["novelty"] = 0.9
+        brain.behavior_defaults["proximity"] = 0.1
+    assert_in_sync()
+    for brain in (regular, hot):
+        brain.reward_map = {**brain.reward_map, "SIT": True}
+        brain.behavior_defaults = {**brain.behavior_defaults, "threat_level": 0.7}
+    assert_in_sync()
+
+
+def test_feedback_table_matches_formatting(brains):
+    brain = brains[1]
+    rng = random.Random(3)
+    scores = [k / 100 for k in range(101)] + [k / 200 for k in range(201)] + [rng.random() for _ in range(5000)]
+    for score in scores:
+        for rewarded in (False, True):
+            expected = f"Дія: SIT score={score:.2f}" + (" — ✅ винагорода" if rewarded else "")
+            assert brain._feedback("SIT", score, rewarded) == expected
+
+
+def _retained_blocks(brain, calls):
+    before = tracemalloc.take_snapshot()
+    for _ in range(calls):
+        brain.handle_command("сидіти")
+    after = tracemalloc.take_snapshot()
+    diffs = after.compare_to(before, "filename")
+    return sum(diff.count_diff for diff in diffs if diff.traceback[0].filename.startswith(_PACKAGE))
+
+
+def test_hot_path_allocations_are_fixed_per_command(brains):
+    hot = brains[1]
+    for _ in range(200):
+        hot.handle_command("сидіти")
+
+    tracemalloc.start()
+    try:
+        counts = [(calls, _retained_blocks(hot, calls)) for calls in (250, 500, 250, 500)]
+    finally:
+        tracemalloc.stop()
+
+    # Objects that only hold the latest value (last score, last timing) may be swapped
+    # between snapshots, so count whole blocks per command.  The count is the same
+    # however many commands run: buffers, signals and phrases are reused.
+    per_call = {round(count / calls) for calls, count in counts}
+    assert per_call == {0}
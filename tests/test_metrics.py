@@ -0,0 +1,52 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from vct.api import app as api_module
+from vct.utils.metrics import MetricsRegistry
+
+
+def test_counter_gauge_and_histogram_exposition():
+    reg = MetricsRegistry()
+    reg.counter("jobs_total", "Jobs", ("kind",)).labels("a").inc(2)
+    reg.gauge("depth", "Queue depth").set(3)
+    hist = reg.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+    hist.observe(0.05)
+    hist.observe(0.5)
+    text = reg.render()
+    assert "# TYPE jobs_total counter" in text
+    assert 'jobs_total{kind="a"} 2.0' in text
+    assert "depth 3.0" in text
+    assert 'latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 2' in text
+    assert "latency_seconds_count 2" in text
+
+
+def test_disabled_registry_ignores_updates():
+    reg = MetricsRegistry(enabled=False)
+    counter = reg.counter("c_total", "C")
+    counter.inc()
+    reg.histogram("h", "H").observe(1.0)
+    text = reg.render()
+    assert "c_total 0.0" in text and "h_count 0.0" in text
+
+
+def test_registry_rejects_conflicting_definitions():
+    reg = MetricsRegistry()
+    reg.counter("x_total", "X")
+    with pytest.raises(ValueError):
+        reg.gauge("x_total", "X")
+    with pytest.raises(ValueError):
+        reg.counter("x_total", "X", ("kind",))
+
+
+def test_metrics_endpoint_reports_requests_and_stages(monkeypatch):
+    c = TestClient(api_module.app)
+    c.post("/robot/act", json={"text": "сидіти"})
+    r = c.get("/metrics")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/plain")
+    assert 'vct_http_requests_total{path="/robot/act",status="200"}' in r.text
+    assert 'vct_stage_seconds_count{stage="decide"}' in r.text
+    assert 'vct_decisions_total{action="SIT"}' in r.text
+    monkeypatch.setattr(api_module.REGISTRY, "enabled", False)
+    assert c.get("/metrics").status_code == 404
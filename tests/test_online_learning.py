@@ -0,0 +1,37 @@
+
+import numpy as np
+
+from vct.behavior.learning import OnlineTrainer, ReplayBuffer
+from vct.behavior.policy import BehaviorPolicy
+from vct.simulation.dog_env import DogEnv
+
+
+def test_replay_buffer_wraps_around():
+    buf = ReplayBuffer(3, feature_dim=2)
+    for i in range(5):
+        buf.add([i, i], float(i))
+    assert len(buf) == 3
+    assert sorted(buf.targets.tolist()) == [2.0, 3.0, 4.0]
+    X, y = buf.sample(8, np.random.default_rng(0))
+    assert X.shape == (8, 2) and set(y.tolist()) <= {2.0, 3.0, 4.0}
+
+
+def test_train_batch_reduces_loss():
+    bp = BehaviorPolicy(learning_rate=0.5)
+    rng = np.random.default_rng(1)
+    X = rng.random((256, 9))
+    y = (X[:, 1] > 0.5).astype(float)
+    first = bp.train_batch(X, y)
+    for _ in range(200):
+        last = bp.train_batch(X, y)
+    assert last < first
+
+
+def test_online_trainer_updates_policy(quiet_brain):
+    brain = quiet_brain()
+    before = [row[:] for row in brain.policy.W1]
+    trainer = OnlineTrainer(brain, DogEnv(seed=3), ["сидіти", "до_мене"], buffer_size=64, update_every=8)
+    report = trainer.run(64)
+    assert report.updates == 8 and len(trainer.buffer) == 64
+    assert report.steps_per_s > 0
+    assert brain.policy.W1 != before
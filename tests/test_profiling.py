@@ -0,0 +1,67 @@
+from vct import profiling
+from vct.cli import main
+
+
+def test_stage_profiler_attributes_calls_time_and_allocations(tmp_path, quiet_brain):
+    brain = quiet_brain()
+    brain.guard.cfg.min_score = 0.0  # let SIT through so the actuator stage runs
+    profiler = profiling.StageProfiler(top=5, alloc_samples=3, sample_interval_s=0.0005)
+    profiler.attach(brain)
+    try:
+        report = profiler.run(profiling.command_workload(brain, ["сидіти", "гавкай"], 400))
+    finally:
+        profiler.detach()
+
+    assert "_action_from_text" not in vars(brain) and "decide" not in vars(brain.policy)
+    assert set(report.stages) >= {"matching", "policy", "guard", "actuator", "tts", "other"}
+    assert "stt" not in report.stages
+    assert report.stages["policy"].calls == 400
+    assert report.stages["actuator"].calls >= 1
+    assert any("_forward" in fn.location for fn in report.stages["policy"].hot)
+    assert all("profiling.py" not in fn.location for stage in report.stages.values() for fn in stage.hot)
+    assert report.stages["policy"].peak_bytes > 0
+    assert report.overhead_s > 0
+
+    text = report.describe()
+    assert "== policy: hot functions ==" in text
+    assert "retained allocations (first 3 calls)" in text
+
+    out = tmp_path / "stacks.txt"
+    report.write_collapsed(out)
+    for line in out.read_text().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert stack.split(";")[0] in profiling.STAGES + (profiling.OTHER,)
+        assert int(count) > 0
+        assert "StageProfiler._exit" not in stack and "StageProfiler._enter" not in stack
+
+
+def test_session_workload_drives_dog_env(quiet_brain):
+    brain = quiet_brain()
+    profiler = profiling.StageProfiler(alloc_samples=0)
+    profiler.attach(brain)
+    report = profiler.run(profiling.session_workload(brain, ["сидіти"], 20))
+    profiler.detach()
+    assert report.stages["matching"].calls == 20
+    assert report.stages["policy"].allocations == []
+
+
+def test_cli_profile_prints_stage_tables(tmp_path, capsys):
+    collapsed = tmp_path / "stacks.txt"
+    main(
+        [
+            "profile",
+            "--simulate",
+            "--iterations",
+            "30",
+            "--commands",
+            "сидіти, лежати",
+            "--top",
+            "3",
+            "--collapsed",
+            str(collapsed),
+        ]
+    )
+    out = capsys.readouterr().out
+    assert out.splitlines()[1].split() == ["stage", "calls", "total", "ms", "mean", "ms", "peak", "KiB"]
+    assert "matching" in out and "== guard: hot functions ==" in out
+    assert collapsed.exists()
@@ -0,0 +1,96 @@
+
+import time
+
+from vct.hardware.gpio_reward import GPIOActuator, RewardActuatorBase
+from vct.hardware.scheduler import PulseScheduler
+
+
+class RecordingActuator(RewardActuatorBase):
+    def __init__(self):
+        self.edges = []
+
+    def on(self):
+        self.edges.append(("on", time.monotonic()))
+
+    def off(self):
+        self.edges.append(("off", time.monotonic()))
+
+
+def test_trigger_returns_immediately_and_pulses():
+    sched = PulseScheduler()
+    dev = RecordingActuator()
+    act = sched.register("left", dev)
+    start = time.monotonic()
+    act.trigger(0.2)
+    assert time.monotonic() - start < 0.05
+    assert sched.wait_idle(2.0)
+    assert [e for e, _ in dev.edges] == ["on", "off"]
+    assert dev.edges[1][1] - dev.edges[0][1] >= 0.19
+    stats = sched.stats("left")
+    assert stats.edges == 2 and stats.max_jitter_s >= stats.mean_jitter_s >= 0.0
+    sched.close()
+
+
+def test_overlapping_pulses_merge_per_pin():
+    sched = PulseScheduler()
+    left, right = RecordingActuator(), RecordingActuator()
+    sched.register("left", left)
+    sched.register("right", right)
+    sched.pulse("left", 0.05)
+    sched.pulse("left", 0.1)
+    sched.pulse("right", 0.05)
+    assert sched.wait_idle(2.0)
+    assert [e for e, _ in left.edges] == ["on", "off"]
+    assert left.edges[1][1] - left.edges[0][1] >= 0.09
+    assert [e for e, _ in right.edges] == ["on", "off"]
+    assert sched.stats().merged == 1
+    sched.close()
+
+
+def test_close_switches_outputs_off():
+    sched = PulseScheduler()
+    dev = RecordingActuator()
+    sched.register("left", dev)
+    sched.pulse("left", 60.0)
+    time.sleep(0.05)
+    sched.close()
+    assert [e for e, _ in dev.edges] == ["on", "off"]
+
+
+def test_on_stays_on_until_off():
+    sched = PulseScheduler()
+    dev = RecordingActuator()
+    act = sched.register("left", dev)
+    act.on()
+    time.sleep(0.05)
+    assert sched.is_on("left") and [e for e, _ in dev.edges] == ["on"]
+    act.off()
+    assert sched.wait_idle(2.0)
+    assert [e for e, _ in dev.edges] == ["on", "off"]
+    act.trigger(0.05)  # the timer thread survived the endless pulse
+    assert sched.wait_idle(2.0)
+    assert [e for e, _ in dev.edges] == ["on", "off", "on", "off"]
+    sched.close()
+
+
+def test_gpio_fallback_is_reused():
+    gpio = GPIOActuator(pin=17)
+    fallback = gpio._fallback
+    gpio.on()
+    gpio.off()
+    assert gpio._fallback is fallback and not fallback.is_on
+
+
+def test_brain_uses_shared_scheduler():
+    from vct.robodog.dog_bot_brain import RoboDogBrain
+
+    sched = PulseScheduler()
+    brain = RoboDogBrain(simulate=True, scheduler=sched, config_overrides={"hardware.pulse_s": 0.2})
+    brain.guard.cfg.min_score = 0.0
+    start = time.monotonic()
+    out = brain.handle_command("сидіти", dog_id="rex")
+    assert out["rewarded"] and time.monotonic() - start < 0.15
+    assert sched.channels == ("dispenser0",)
+    assert sched.wait_idle(2.0)
+    brain.close()
+    sched.close()
@@ -0,0 +1,60 @@
+
+import numpy as np
+import pytest
+
+from vct.robodog.dog_bot_brain import RoboDogBrain
+from vct.simulation.dog_env import DogEnv
+from vct.simulation.recorder import EpisodeReader, EpisodeRecorder, replay
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_recorder_roundtrip_and_aggregate(tmp_path, compress):
+    brain = RoboDogBrain(simulate=True)
+    with EpisodeRecorder(tmp_path, chunk_size=7, compress=compress) as rec:
+        env = DogEnv(seed=5, recorder=rec)
+        for i in range(20):
+            env.interact(brain, ("сидіти", "голос")[i % 2], confidence=0.9)
+    reader = EpisodeReader(tmp_path)
+    assert len(reader) == 20 and len(reader.chunks) == 3
+    assert reader.column("score").dtype == np.float64
+    if not compress:
+        assert isinstance(reader.column("fatigue"), np.ndarray)
+    assert reader.labels("action")[:2] == ["SIT", "BARK"]
+    assert int(reader.mask(action="BARK").sum()) == 10
+    summary = reader.aggregate()
+    assert summary["SIT"]["steps"] == 10 and 0.0 <= summary["SIT"]["success_rate"] <= 1.0
+
+
+def test_live_recording_replays_identically(tmp_path):
+    with EpisodeRecorder(tmp_path) as rec:
+        brain = RoboDogBrain(simulate=True, recorder=rec)
+        for mood in (0.1, -0.3, 0.5):
+            brain.handle_command("лежати", 0.8, 0.4, mood)
+    reader = EpisodeReader(tmp_path)
+    assert list(reader.column("success")) == [-1, -1, -1]
+    report = replay(reader, RoboDogBrain(simulate=True))
+    assert report.steps == 3 and report.identical
+
+    changed = RoboDogBrain(simulate=True, config_overrides={"commands_map": {"лежати": "SIT"}})
+    assert replay(reader, changed).action_mismatches == 3
+
+
+def test_dog_env_recording_replays_identically(tmp_path):
+    with EpisodeRecorder(tmp_path) as rec:
+        env = DogEnv(seed=3, recorder=rec)
+        brain = RoboDogBrain(simulate=True)
+        for i in range(10):
+            env.interact(brain, ("сидіти", "лежати")[i % 2], confidence=0.9)
+    reader = EpisodeReader(tmp_path)
+    assert reader.column("energy_level")[-1] < 1.0  # fatigue built up during the session
+    report = replay(reader, RoboDogBrain(simulate=True))
+    assert report.steps == 10 and report.identical and report.max_score_delta == 0.0
+
+
+def test_reader_fills_columns_missing_from_older_chunks(tmp_path):
+    with EpisodeRecorder(tmp_path) as rec:
+        rec.record("сидіти", {"action": "SIT", "score": 0.5}, confidence=0.9)
+    (tmp_path / "chunk-000000" / "energy_level.npy").unlink()
+    reader = EpisodeReader(tmp_path)
+    assert np.isnan(reader.column("energy_level")).all()
+    assert replay(reader, RoboDogBrain(simulate=True)).steps == 1
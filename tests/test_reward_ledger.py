@@ -0,0 +1,71 @@
+
+import time
+
+from vct.configuration import load_config
+from vct.ethics.ledger import RewardLedger, aggregate, read_ledger, replay
+from vct.robodog.dog_bot_brain import RoboDogBrain
+
+
+def test_ledger_group_commit_and_replay(tmp_path):
+    path = tmp_path / "rewards.ledger"
+    ledger = RewardLedger(path, commit_every=3, commit_interval_s=3600.0)
+    ledger.append(1.0, "rex", "SIT", 0.9, True, "ok")
+    ledger.append(2.0, "rex", "SIT", 0.8, False, "cooldown")
+    assert read_ledger(path).shape == (0,)
+    ledger.append(3.0, "bim", "BARK", 0.7, False, "bark_blocked")
+    assert read_ledger(path).shape == (3,)
+    ledger.close()
+
+    events = list(replay(path, since=2.0))
+    assert [e.reason for e in events] == ["cooldown", "bark_blocked"]
+    assert events[1].dog_id == "bim" and not events[1].rewarded
+
+    summary = aggregate(read_ledger(path))
+    assert summary["SIT"]["decisions"] == 2 and summary["SIT"]["rewards"] == 1
+
+
+def test_ledger_commits_on_interval_without_further_appends(tmp_path):
+    path = tmp_path / "rewards.ledger"
+    ledger = RewardLedger(path, commit_every=100, commit_interval_s=0.05)
+    ledger.append(1.0, "rex", "SIT", 0.9, True, "ok")
+    deadline = time.monotonic() + 2.0
+    while read_ledger(path).shape == (0,) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert read_ledger(path).shape == (1,)
+    ledger.close()
+
+
+def test_cli_command_flushes_ledger(tmp_path, capsys):
+    from vct.cli import main
+
+    path = tmp_path / "cli.ledger"
+    main(["--simulate", "--cmd", "сидіти", "--set", f"ledger.path={path}", "--set", "ledger.commit_interval_s=3600"])
+    assert read_ledger(path).shape == (1,)
+
+
+def test_ledger_ignores_torn_trailing_record(tmp_path):
+    path = tmp_path / "rewards.ledger"
+    with RewardLedger(path, commit_every=1) as ledger:
+        ledger.append(1.0, "rex", "SIT", 0.9, True, "ok")
+    with path.open("ab") as handle:
+        handle.write(b"\x00" * 10)
+    assert read_ledger(path).shape == (1,)
+    with RewardLedger(path, commit_every=1) as ledger:
+        ledger.append(2.0, "rex", "SIT", 0.9, True, "ok")
+    assert list(read_ledger(path)["ts"]) == [1.0, 2.0]
+
+
+def test_brain_logs_decisions_and_restores_guard(tmp_path):
+    path = tmp_path / "rewards.ledger"
+    cfg = load_config(overrides={"ledger.path": str(path), "tts.provider": "print"})
+    brain = RoboDogBrain(cfg, simulate=True)
+    brain.guard.cfg.min_score = 0.0
+    out = brain.handle_command("сидіти", dog_id="rex")
+    brain.close()
+    assert out["rewarded"] is True
+    events = list(replay(path))
+    assert events[0].dog_id == "rex" and events[0].rewarded
+
+    restarted = RoboDogBrain(cfg, simulate=True)
+    assert not restarted.guard.can_reward(time.time(), "SIT", 1.0, 0.0, dog_id="rex")
+    restarted.close()
@@ -0,0 +1,44 @@
+
+import math
+
+from vct.configuration import load_config
+from vct.simulation.rollout import RolloutRunner, episode_seed
+
+
+def test_episode_seeds_are_stable_and_distinct():
+    assert episode_seed(0, 3) == episode_seed(0, 3)
+    assert len({episode_seed(0, i) for i in range(100)}) == 100
+
+
+def test_results_do_not_depend_on_worker_count():
+    kwargs = dict(
+        steps_per_episode=20,
+        base_seed=11,
+        chunk_size=2,
+        config_overrides={"ethics.min_score": 0.0, "ethics.max_session_min": 0},
+    )
+    serial = RolloutRunner(["сидіти", "до_мене"], workers=1, **kwargs).run(6)
+    parallel = RolloutRunner(["сидіти", "до_мене"], workers=2, **kwargs).run(6)
+    assert [e.to_dict() for e in serial.episodes] == [e.to_dict() for e in parallel.episodes]
+    rate = serial.metrics["success_rate"]
+    assert 0.0 <= rate.ci_low <= rate.mean <= rate.ci_high <= 1.5
+    assert serial.metrics["rewards"].mean > 0
+    assert serial.to_dict()["episodes"] == 6
+
+
+def test_rewards_respect_default_cooldowns_across_workers():
+    config = load_config()
+    spacing = max(config.ethics.min_inter_reward_s, config.reward_cooldown_s)
+    steps, interval_s = 40, 0.5
+    most = math.floor((steps - 1) * interval_s / spacing) + 1
+    summaries = []
+    # The default guard first, then with only the score gate opened so every
+    # command is eligible and the default cooldowns alone limit the rewards.
+    for overrides in ({}, {"ethics.min_score": 0.0}):
+        kwargs = dict(steps_per_episode=steps, interval_s=interval_s, base_seed=3, chunk_size=2)
+        serial = RolloutRunner(["сидіти", "до_мене"], workers=1, config_overrides=overrides, **kwargs).run(4)
+        parallel = RolloutRunner(["сидіти", "до_мене"], workers=2, config_overrides=overrides, **kwargs).run(4)
+        assert [e.to_dict() for e in serial.episodes] == [e.to_dict() for e in parallel.episodes]
+        assert all(e.rewards <= most for e in serial.episodes)
+        summaries.append(serial)
+    assert [e.rewards for e in summaries[1].episodes] == [most] * 4
@@ -0,0 +1,102 @@
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from vct.api import app as api_module
+from vct.cli import main
+from vct.utils.tracing import Tracer
+
+
+class _FakeSTT:
+    def transcribe(self, wav_path=None, use_mic=False, *, audio=None):
+        return "" if wav_path == "silence.wav" else "сидіти"
+
+
+@pytest.fixture
+def traced_brain(quiet_brain):
+    brain = quiet_brain({"ethics": {"min_score": 0.0}, "tracing": {"enabled": True, "capacity": 8}})
+    brain.stt = _FakeSTT()
+    return brain
+
+
+def _names(span):
+    return [child["name"] for child in span.get("children", [])]
+
+
+def test_disabled_tracer_is_a_shared_noop():
+    tracer = Tracer()
+    with tracer.trace("root") as span:
+        assert span is None
+        assert tracer.span("child") is tracer.trace("other")
+        tracer.annotate("key", 1)
+    assert len(tracer) == 0
+
+
+def test_tracer_nests_spans_and_keeps_the_slowest():
+    ticks = iter(range(100))
+    tracer = Tracer(capacity=3, enabled=True, clock=lambda: float(next(ticks)))
+    for i in range(5):
+        with tracer.trace(f"t{i}") as root:
+            with tracer.span("child"):
+                tracer.annotate("i", i)
+                for _ in range(i):
+                    with tracer.span("leaf"):
+                        pass
+    assert tracer.span("outside") is tracer.span("again")  # no open trace: no-op
+    assert len(tracer) == 3
+    slowest = [span.to_dict() for span in tracer.slowest(2)]
+    assert [span["name"] for span in slowest] == ["t4", "t3"]
+    child = slowest[0]["children"][0]
+    assert child["attrs"] == {"i": 4}
+    assert len(child["children"]) == 4
+    assert root.duration_s > 0
+
+    with pytest.raises(RuntimeError):
+        with tracer.trace("boom"):
+            raise RuntimeError("x")
+    assert tracer.slowest(10)[-1].attrs["error"] == "RuntimeError"
+
+
+def test_handle_command_records_stage_spans(traced_brain):
+    brain = traced_brain
+    brain.handle_command("сидіти", dog_id="rex")
+    (trace,) = [span.to_dict() for span in brain.tracer.slowest(1)]
+    assert trace["name"] == "handle_command"
+    assert trace["attrs"] == {"text": "сидіти", "dog_id": "rex", "action": "SIT", "rewarded": True}
+    assert _names(trace) == ["matching", "features", "policy", "guard", "actuator", "tts"]
+
+
+def test_run_once_from_wav_nests_the_command_trace(traced_brain):
+    brain = traced_brain
+    brain.run_once_from_wav("cmd.wav")
+    brain.run_once_from_wav("silence.wav")
+    traces = {span.attrs["wav"]: span.to_dict() for span in brain.tracer.slowest(5)}
+    assert _names(traces["cmd.wav"]) == ["stt", "handle_command"]
+    assert _names(traces["cmd.wav"]["children"][1])[:2] == ["matching", "features"]
+    assert _names(traces["silence.wav"]) == ["stt", "tts"]
+
+
+def test_async_actuator_span_joins_the_trace(traced_brain):
+    brain = traced_brain
+    asyncio.run(brain.handle_command_async("сидіти"))
+    (trace,) = brain.tracer.slowest(1)
+    assert trace.name == "handle_command_async"
+    assert [c.name for c in trace.children][-1] == "actuator"
+
+
+def test_traces_endpoint_and_cli(monkeypatch, capsys):
+    c = TestClient(api_module.app)
+    runtime = api_module.get_runtime()
+    monkeypatch.setattr(runtime.brain.tracer, "enabled", False)
+    assert c.get("/traces").status_code == 404
+    monkeypatch.setattr(runtime.brain.tracer, "enabled", True)
+    c.post("/robot/act", json={"text": "лежати"})
+    body = c.get("/traces", params={"limit": 1}).json()
+    assert body["recorded"] >= 1
+    assert body["traces"][0]["name"] == "handle_command_async"
+
+    main(["--simulate", "--cmd", "лежати", "--traces", "1"])
+    (line,) = capsys.readouterr().err.strip().splitlines()[-1:]
+    assert json.loads(line)["name"] == "handle_command"
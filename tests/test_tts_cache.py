@@ -0,0 +1,58 @@
+
+from vct.engines.tts import GTTSTTS, create_tts_engine
+from vct.engines.tts_cache import PhraseAudioCache
+
+
+class FakeGTTS:
+    calls = 0
+
+    def __init__(self, text, lang, tld, slow):
+        FakeGTTS.calls += 1
+        self.payload = f"{lang}:{tld}:{slow}:{text}".encode("utf-8")
+
+    def write_to_fp(self, fp):
+        fp.write(self.payload)
+
+
+def test_repeat_phrase_skips_synthesis(tmp_path):
+    FakeGTTS.calls = 0
+    played = []
+    cache = PhraseAudioCache(tmp_path)
+    tts = GTTSTTS("uk", "com.ua", cache=cache, gtts_factory=FakeGTTS, player=played.append)
+    tts.speak("Дія: SIT")
+    tts.speak("Дія: SIT")
+    assert FakeGTTS.calls == 1
+    assert played[0] == played[1]
+    assert cache.hits == 1 and cache.misses == 1
+
+
+def test_cache_key_covers_voice_settings():
+    base = PhraseAudioCache.make_key("hi", "uk", "com.ua", False, "gtts")
+    assert base != PhraseAudioCache.make_key("hi", "uk", "com.ua", True, "gtts")
+    assert base != PhraseAudioCache.make_key("hi", "en", "com.ua", False, "gtts")
+    assert base != PhraseAudioCache.make_key("hi", "uk", "com.ua", False, "pyttsx3")
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = PhraseAudioCache(tmp_path, max_bytes=10)
+    write = lambda data: (lambda p: p.write_bytes(data))
+    cache.get_or_render("a", write(b"12345"), ".bin")
+    cache.get_or_render("b", write(b"12345"), ".bin")
+    cache.get("a")
+    cache.get_or_render("c", write(b"12345"), ".bin")
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.total_bytes <= 10
+    assert len(PhraseAudioCache(tmp_path, max_bytes=10)) == 2
+
+
+def test_prerender_populates_cache(tmp_path):
+    FakeGTTS.calls = 0
+    tts = GTTSTTS(cache=PhraseAudioCache(tmp_path), gtts_factory=FakeGTTS, player=lambda p: None)
+    assert tts.prerender(["Команду не розпізнано", "Дія: SIT"]) == 2
+    tts.speak("Команду не розпізнано")
+    assert FakeGTTS.calls == 2
+
+
+def test_factory_accepts_cache_options(tmp_path):
+    engine = create_tts_engine({"provider": "print", "cache_dir": str(tmp_path), "prerender": ["x"]})
+    engine.speak("ok")
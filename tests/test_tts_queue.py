@@ -0,0 +1,101 @@
+
+import threading
+
+import pytest
+
+from vct.engines.tts import BackgroundTTS, TTSEngineBase, create_tts_engine
+
+
+class GatedEngine(TTSEngineBase):
+    def __init__(self):
+        self.spoken = []
+        self.gate = threading.Event()
+        self.started = threading.Event()
+
+    def speak(self, text):
+        self.started.set()
+        self.gate.wait(2.0)
+        self.spoken.append(text)
+
+
+def test_latest_policy_coalesces_per_key():
+    engine = GatedEngine()
+    tts = BackgroundTTS(engine, max_queue=8, coalesce="latest")
+    tts.enqueue("first", key="rex")
+    assert engine.started.wait(1.0)
+    tts.enqueue("rex stale", key="rex")
+    tts.enqueue("bim", key="bim")
+    tts.enqueue("rex fresh", key="rex")
+    assert tts.stats().depth == 2
+    engine.gate.set()
+    assert tts.wait_idle(2.0)
+    tts.close()
+    assert engine.spoken == ["first", "bim", "rex fresh"]
+    stats = tts.stats()
+    assert stats.coalesced == 1 and stats.played == 3
+    assert stats.max_lag_s >= stats.last_lag_s >= 0.0
+
+
+def test_latest_policy_keeps_keyless_utterances():
+    engine = GatedEngine()
+    tts = BackgroundTTS(engine, max_queue=8, coalesce="latest")
+    tts.speak("busy")
+    assert engine.started.wait(1.0)
+    tts.speak("hello")
+    tts.enqueue("unrelated")
+    engine.gate.set()
+    assert tts.wait_idle(2.0)
+    tts.close()
+    assert engine.spoken == ["busy", "hello", "unrelated"]
+    assert tts.stats().coalesced == 0
+
+
+def test_prerender_runs_on_the_worker_after_current_speech():
+    engine = GatedEngine()
+    rendered = []
+
+    def prerender(phrases):
+        rendered.append((threading.current_thread().name, list(engine.spoken), list(phrases)))
+        return len(phrases)
+
+    engine.prerender = prerender
+    tts = BackgroundTTS(engine)
+    tts.speak("busy")
+    assert engine.started.wait(1.0)
+    threading.Timer(0.05, engine.gate.set).start()
+    assert tts.prerender(["a", "b"]) == 2
+    tts.close()
+    assert rendered == [("vct-tts", ["busy"], ["a", "b"])]
+
+
+def test_prerender_errors_reach_the_caller():
+    engine = GatedEngine()
+    engine.prerender = lambda phrases: 1 / 0
+    tts = BackgroundTTS(engine)
+    with pytest.raises(ZeroDivisionError):
+        tts.prerender(["a"])
+    tts.close()
+    with pytest.raises(RuntimeError):
+        tts.prerender(["a"])
+
+
+def test_bounded_queue_drops_oldest():
+    engine = GatedEngine()
+    tts = BackgroundTTS(engine, max_queue=2, coalesce="none")
+    tts.speak("busy")
+    assert engine.started.wait(1.0)
+    for text in ("a", "b", "c"):
+        tts.speak(text)
+    engine.gate.set()
+    assert tts.wait_idle(2.0)
+    tts.close()
+    assert engine.spoken == ["busy", "b", "c"]
+    assert tts.stats().dropped == 1
+
+
+def test_factory_wraps_engine_in_background_worker():
+    engine = create_tts_engine({"provider": "print", "background": True, "queue_size": 4})
+    assert isinstance(engine, BackgroundTTS)
+    engine.speak("ok")
+    assert engine.wait_idle(2.0)
+    engine.close()
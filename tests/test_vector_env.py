@@ -0,0 +1,45 @@
+
+import numpy as np
+
+from vct.behavior.policy import BehaviorInputs, BehaviorPolicy, feature_matrix
+from vct.robodog.dog_bot_brain import RoboDogBrain
+from vct.simulation.vector_env import VectorDogEnv
+
+
+def test_score_batch_matches_scalar_decide():
+    bp = BehaviorPolicy()
+    rng = np.random.default_rng(0)
+    rows = rng.random((32, 4))
+    inputs = [BehaviorInputs(1.0, c, r, mood=m * 2 - 1, energy_level=e) for c, r, m, e in rows]
+    X = feature_matrix(1.0, rows[:, 0], rows[:, 1], rows[:, 2] * 2 - 1, rows[:, 3])
+    expected = [bp.decide("SIT", inp).score for inp in inputs]
+    assert np.allclose(bp.score_batch(X), expected, atol=1e-12)
+
+
+def test_brain_score_batch_matches_handle_command():
+    brain = RoboDogBrain(simulate=True)
+    actions, scores = brain.score_batch(["сидіти", "невідомо"], confidence=0.9, mood=[0.2, -0.4])
+    assert actions == ["SIT", "NONE"]
+    out = brain.handle_command("сидіти", 0.9, 0.5, 0.2)
+    assert abs(out["score"] - scores[0]) < 1e-12
+
+
+def test_vector_env_is_seeded_and_resettable():
+    a, b = VectorDogEnv(1000, seed=3), VectorDogEnv(1000, seed=3)
+    out_a, out_b = a.step(0.8), b.step(0.8)
+    assert np.array_equal(out_a["success"], out_b["success"])
+    assert 0.6 < out_a["success"].mean() < 0.95
+    mask = np.zeros(1000, dtype=bool)
+    mask[:10] = True
+    state = a.reset(mask)
+    assert np.all(state["fatigue"][:10] == 0.0) and np.all(state["fatigue"][10:] > 0.0)
+
+
+def test_vector_env_interact_advances_population():
+    brain = RoboDogBrain(simulate=True)
+    env = VectorDogEnv(500, seed=1)
+    for _ in range(5):
+        out = env.interact(brain, "сидіти", confidence=0.9)
+    assert out["action"] == "SIT"
+    assert out["score"].shape == (500,)
+    assert np.all(env.fatigue > 0.0)
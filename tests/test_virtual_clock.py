@@ -0,0 +1,59 @@
+
+import time
+
+from vct.ethics.ledger import replay
+from vct.hardware.gpio_reward import RewardActuatorBase
+from vct.hardware.scheduler import PulseScheduler
+from vct.robodog.dog_bot_brain import RoboDogBrain
+from vct.simulation.dog_env import DogEnv
+from vct.utils.clock import VirtualClock
+
+
+def test_virtual_clock_sleep_is_instant():
+    clock = VirtualClock(start=100.0)
+    started = time.monotonic()
+    clock.sleep(3600.0)
+    assert clock.time() == 3700.0
+    assert time.monotonic() - started < 0.1
+
+
+def test_hour_long_session_keeps_cooldowns(tmp_path, capsys):
+    clock = VirtualClock(start=1_000.0)
+    ledger = tmp_path / "session.ledger"
+    brain = RoboDogBrain(
+        simulate=True,
+        clock=clock,
+        config_overrides={"ledger.path": str(ledger), "ethics.max_session_min": 0},
+    )
+    brain.guard.cfg.min_score = 0.0
+    started = time.monotonic()
+    summary = DogEnv(seed=7).run_session(brain, ["сидіти"], steps=3600, interval_s=1.0)
+    brain.close()
+    assert time.monotonic() - started < 10.0
+    assert summary["elapsed_s"] >= 3600.0
+
+    reward_ts = [e.ts for e in replay(ledger) if e.rewarded]
+    assert len(reward_ts) == summary["rewards"] > 0
+    gaps = [b - a for a, b in zip(reward_ts, reward_ts[1:])]
+    assert min(gaps) >= brain.cooldown_s
+
+
+def test_scheduler_fires_edges_on_virtual_advance():
+    class Recorder(RewardActuatorBase):
+        def __init__(self):
+            self.edges = []
+
+        def on(self):
+            self.edges.append(("on", clock.time()))
+
+        def off(self):
+            self.edges.append(("off", clock.time()))
+
+    clock = VirtualClock()
+    sched = PulseScheduler(clock)
+    dev = Recorder()
+    sched.register("left", dev).trigger(0.5)
+    assert dev.edges == [("on", 0.0)]
+    clock.advance(1.0)
+    assert dev.edges == [("on", 0.0), ("off", 1.0)]
+    assert sched.stats("left").max_jitter_s == 0.5
@@ -0,0 +1,113 @@
+"""Admission control for the command endpoints.
+
+Requests are admitted while fewer than ``max_in_flight`` are running and the
+recent latency (an exponentially weighted moving average) is within the
+latency budget.  Everything else is shed immediately with a retry hint, so
+accepted requests still finish inside the budget instead of all of them
+queueing and arriving too late for training.
+
+Priority requests — commands that cannot trigger a reward, such as unknown
+commands or ``STOP`` — ignore the latency check and may use
+``priority_reserve`` extra slots, so safety-relevant commands keep getting
+through under load.
+
+The controller is meant to be used from the event loop thread and keeps no
+lock.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from ..utils.metrics import REGISTRY
+
+ADMISSIONS = REGISTRY.counter(
+    "vct_admission_total", "Admission decisions for command requests", ("decision", "priority")
+)
+
+
+@dataclass(frozen=True)
+class AdmissionStats:
+    in_flight: int
+    accepted: int
+    shed: int
+    accepted_priority: int
+    shed_priority: int
+    latency_ewma_ms: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        latency_budget_ms: float,
+        *,
+        max_in_flight: int = 64,
+        priority_reserve: int = 16,
+        ewma_alpha: float = 0.2,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.latency_budget_s = latency_budget_ms / 1000.0
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.priority_reserve = max(0, int(priority_reserve))
+        self.ewma_alpha = ewma_alpha
+        self._clock = clock
+        self.in_flight = 0
+        self.latency_ewma_s = 0.0
+        self._counts = {(True, False): 0, (False, False): 0, (True, True): 0, (False, True): 0}
+
+    def admit(self, priority: bool = False) -> float | None:
+        """Return a start token when admitted, ``None`` when the request is shed."""
+
+        limit = self.max_in_flight + (self.priority_reserve if priority else 0)
+        over_budget = (
+            not priority
+            and self.latency_budget_s > 0
+            and self.in_flight > 0  # an idle server always re-samples latency
+            and self.latency_ewma_s > self.latency_budget_s
+        )
+        admitted = self.in_flight < limit and not over_budget
+        self._counts[(admitted, priority)] += 1
+        ADMISSIONS.labels("accepted" if admitted else "shed", "true" if priority else "false").inc()
+        if not admitted:
+            return None
+        self.in_flight += 1
+        return self._clock()
+
+    def restart(self) -> float:
+        """A fresh token for an admitted request whose earlier work (speech
+        recognition) should stay out of the latency average."""
+
+        return self._clock()
+
+    def release(self, token: float) -> None:
+        """Finish a request admitted with ``token`` and fold its latency into the average."""
+
+        self.in_flight -= 1
+        latency = self._clock() - token
+        if self.latency_ewma_s == 0.0:
+            self.latency_ewma_s = latency
+        else:
+            self.latency_ewma_s += self.ewma_alpha * (latency - self.latency_ewma_s)
+
+    def retry_after_s(self) -> int:
+        """Whole seconds a shed client should wait, scaled by the current backlog."""
+
+        backlog = self.latency_ewma_s * self.in_flight / self.max_in_flight
+        return max(1, math.ceil(backlog))
+
+    def stats(self) -> AdmissionStats:
+        return AdmissionStats(
+            in_flight=self.in_flight,
+            accepted=self._counts[(True, False)],
+            shed=self._counts[(False, False)],
+            accepted_priority=self._counts[(True, True)],
+            shed_priority=self._counts[(False, True)],
+            latency_ewma_ms=self.latency_ewma_s * 1000.0,
+        )
@@ -1,27 +1,275 @@
-from fastapi import FastAPI
-from pydantic import BaseModel
-from ..robodog.dog_bot_brain import RoboDogBrain
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager
+from functools import partial
+from fastapi import FastAPI, HTTPException, Query, Request, Response, WebSocket
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ValidationError
+from ..engines.audio import AudioDecodeError
+from ..ethics.guard import DEFAULT_DOG_ID
+from .admission import AdmissionController
+from .runtime import ApiRuntime
+from .sessions import CommandSession, SessionRegistry
 from ..utils.logging import get_logger
+from ..utils.metrics import CONTENT_TYPE, REGISTRY
+import json
 import os
 
 log = get_logger("API")
-CFG = os.getenv("VCT_CONFIG", "vct/config.yaml")
-SIM = os.getenv("VCT_SIMULATE", "1") == "1"
-GPIO_PIN = int(os.getenv("VCT_GPIO_PIN", "0")) or None
-brain = RoboDogBrain(cfg_path=CFG, gpio_pin=GPIO_PIN, simulate=SIM)
+_runtime_lock = threading.Lock()
 
-app = FastAPI(title="VCT API", version="0.14.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    runtime = await asyncio.to_thread(ApiRuntime.from_env)
+    app.state.runtime = runtime
+    runtime.start_warm_up()
+    try:
+        yield
+    finally:
+        app.state.runtime = None
+        runtime.close()
+
+app = FastAPI(title="VCT API", version="0.14.0", lifespan=lifespan)
+sessions = SessionRegistry()
+
+def get_runtime() -> ApiRuntime:
+    """Return the lifespan-managed runtime, creating it lazily when the app runs without lifespan events."""
+    runtime = getattr(app.state, "runtime", None)
+    if runtime is None:
+        with _runtime_lock:
+            runtime = getattr(app.state, "runtime", None)
+            if runtime is None:
+                runtime = app.state.runtime = ApiRuntime.from_env()
+                runtime.start_warm_up()
+    return runtime
+
+def __getattr__(name: str):
+    # ``vct.api.app.brain`` used to be a module global built at import time.
+    if name == "brain":
+        return get_runtime().brain
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+HTTP_REQUESTS = REGISTRY.counter("vct_http_requests_total", "HTTP requests served", ("path", "status"))
+HTTP_SECONDS = REGISTRY.histogram("vct_http_request_seconds", "HTTP request latency", ("path",))
+REGISTRY.gauge("vct_ws_sessions", "Open WebSocket sessions").set_function(lambda: sessions.total)
+REGISTRY.gauge("vct_stt_in_flight", "Audio uploads transcribing or queued").set_function(
+    lambda: runtime.stt_limit.in_flight if (runtime := getattr(app.state, "runtime", None)) else 0)
+
+class RequestMetrics:
+    """Pure ASGI middleware timing HTTP requests per route template."""
+    def __init__(self, app): self.app = app
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not REGISTRY.enabled:
+            return await self.app(scope, receive, send)
+        status = [500]
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start": status[0] = message["status"]
+            await send(message)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path", "unmatched")
+            HTTP_SECONDS.labels(path).observe(time.perf_counter() - started)
+            HTTP_REQUESTS.labels(path, str(status[0])).inc()
+
+app.add_middleware(RequestMetrics)
 
 @app.get("/health")
-def health(): return {"status": "ok", "simulate": SIM}
+async def health(): return {"status": "ok", "simulate": os.getenv("VCT_SIMULATE", "1") == "1"}
+
+@app.get("/ready")
+async def ready():
+    """Readiness probe: 503 until the background warm-up has finished."""
+    runtime = getattr(app.state, "runtime", None)
+    if runtime is None or not runtime.ready.is_set():
+        error = runtime.warmup_error if runtime is not None else None
+        return JSONResponse({"ready": False, "error": error}, status_code=503)
+    return {"ready": True, "warmup_s": runtime.warmup_s}
+
+@app.get("/metrics")
+async def metrics():
+    if not REGISTRY.enabled:
+        raise HTTPException(404, "Metrics are disabled")
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+@app.get("/traces")
+async def traces(limit: int = Query(10, ge=1, le=1000)):
+    """Slowest recent command traces with their stage spans."""
+    tracer = get_runtime().brain.tracer
+    if not tracer.enabled:
+        raise HTTPException(404, "Tracing is disabled")
+    return {"recorded": len(tracer), "traces": [span.to_dict() for span in tracer.slowest(limit)]}
 
 class ActIn(BaseModel):
     text: str
     confidence: float = 0.85
     reward_bias: float = 0.5
     mood: float = 0.0
+    dog_id: str = DEFAULT_DOG_ID
+
+def _admit(admission: AdmissionController | None, priority: bool) -> float | None:
+    """Take an admission slot, failing fast with 503 when shedding; ``None`` without admission control."""
+    if admission is None:
+        return None
+    token = admission.admit(priority)
+    if token is None:
+        raise HTTPException(503, "Server is over its latency budget", headers={"Retry-After": str(admission.retry_after_s())})
+    return token
+
+@asynccontextmanager
+async def admitted(runtime: ApiRuntime, priority: bool):
+    """Run the body under admission control."""
+    admission = runtime.admission
+    token = _admit(admission, priority)
+    try:
+        yield
+    finally:
+        if token is not None:
+            admission.release(token)
 
 @app.post("/robot/act")
-def act(inp: ActIn):
-    out = brain.handle_command(inp.text, inp.confidence, inp.reward_bias, inp.mood)
-    return {"ok": True, "result": out}
\ No newline at end of file
+async def act(inp: ActIn):
+    runtime = get_runtime()
+    async with admitted(runtime, runtime.is_priority(inp.text)):
+        # Decision runs on the loop; dispensing and speech go to the default executor.
+        out = await runtime.brain.handle_command_async(inp.text, inp.confidence, inp.reward_bias, inp.mood, dog_id=inp.dog_id)
+    return {"ok": True, "result": out}
+
+@app.get("/admission")
+async def admission_stats():
+    admission = get_runtime().admission
+    return {"enabled": admission is not None, **(admission.stats().to_dict() if admission else {})}
+
+
+def _content_length(request: Request) -> int:
+    """Declared body size, 0 when absent; a malformed header is a client error."""
+    header = request.headers.get("content-length")
+    if not header:
+        return 0
+    try:
+        length = int(header)
+    except ValueError:
+        raise HTTPException(400, "Invalid Content-Length header")
+    if length < 0:
+        raise HTTPException(400, "Invalid Content-Length header")
+    return length
+
+def _item_error(exc: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, e['loc'])) or 'item'}: {e['msg']}" for e in exc.errors())
+
+@app.post("/robot/act/batch")
+async def act_batch(request: Request):
+    """Score a JSON array of ``ActIn`` items in one vectorised pass.
+
+    Items are validated one by one, so a bad item yields an error entry in
+    its slot instead of failing the whole batch.
+    """
+    runtime = get_runtime()
+    brain = runtime.brain
+    limits = brain.config.api
+    max_bytes = limits.max_batch_kb * 1024
+    if _content_length(request) > max_bytes:
+        raise HTTPException(413, f"Batch body exceeds {limits.max_batch_kb} KB")
+    raw = await request.body()
+    if len(raw) > max_bytes:
+        raise HTTPException(413, f"Batch body exceeds {limits.max_batch_kb} KB")
+    try:
+        payload = json.loads(raw)
+    except ValueError:
+        raise HTTPException(400, "Body is not valid JSON")
+    if not isinstance(payload, list):
+        raise HTTPException(422, "Body must be a JSON array of commands")
+    if len(payload) > limits.max_batch_items:
+        raise HTTPException(413, f"Batch has {len(payload)} items, limit is {limits.max_batch_items}")
+
+    items: list[ActIn | None] = []
+    errors: dict[int, str] = {}
+    for idx, entry in enumerate(payload):
+        try:
+            items.append(ActIn.model_validate(entry))
+        except ValidationError as exc:
+            items.append(None); errors[idx] = _item_error(exc)
+    valid = [item for item in items if item is not None]
+    async with admitted(runtime, False):
+        outputs = iter(await brain.handle_batch_async(
+            [i.text for i in valid], [i.confidence for i in valid], [i.reward_bias for i in valid],
+            [i.mood for i in valid], [i.dog_id for i in valid],
+        ) if valid else [])
+    results = [
+        {"ok": False, "error": errors[idx]} if item is None else {"ok": True, "result": next(outputs)}
+        for idx, item in enumerate(items)
+    ]
+    return {"ok": not errors, "results": results}
+
+PCM_TYPES = ("audio/l16", "audio/pcm", "audio/x-raw")
+
+@app.post("/robot/act/audio")
+async def act_audio(
+    request: Request, dog_id: str = DEFAULT_DOG_ID, confidence: float = 0.85, reward_bias: float = 0.5,
+    mood: float = 0.0, sample_rate: int | None = None, channels: int = 1,
+):
+    """Transcribe a raw WAV (or 16-bit PCM) request body in memory and act on it.
+
+    PCM is selected by an ``audio/L16``-style content type or a ``sample_rate``
+    query parameter (``rate=`` in the content type is honoured too).  The
+    command is unknown until transcribed, so uploads are admitted as regular
+    requests; only the decision counts toward the latency average.
+    """
+    runtime = get_runtime()
+    brain = runtime.brain
+    max_bytes = brain.config.api.max_audio_kb * 1024
+    if _content_length(request) > max_bytes:
+        raise HTTPException(413, f"Audio exceeds {brain.config.api.max_audio_kb} KB")
+    content_type = request.headers.get("content-type", "").lower()
+    if sample_rate is None and content_type.startswith(PCM_TYPES):
+        rate = [p.split("=", 1)[1] for p in content_type.replace(" ", "").split(";") if p.startswith("rate=")]
+        try:
+            sample_rate = int(rate[0]) if rate else 16000
+        except ValueError:
+            raise HTTPException(415, f"Invalid PCM sample rate: {rate[0]!r}")
+    if not runtime.stt_limit.try_acquire():
+        raise HTTPException(503, "Speech recognition is busy", headers={"Retry-After": "1"})
+    admission = runtime.admission
+    try:
+        token = _admit(admission, False)
+    except HTTPException:
+        runtime.stt_limit.release()
+        raise
+    try:
+        try:
+            audio = bytearray()
+            async for chunk in request.stream():
+                audio += chunk
+                if len(audio) > max_bytes:
+                    raise HTTPException(413, f"Audio exceeds {brain.config.api.max_audio_kb} KB")
+            loop = asyncio.get_running_loop()
+            text = await loop.run_in_executor(
+                runtime.stt_pool, partial(brain.transcribe_audio, audio, sample_rate=sample_rate, channels=channels)
+            )
+        except AudioDecodeError as exc:
+            raise HTTPException(415, str(exc))
+        finally:
+            runtime.stt_limit.release()
+        if not text:
+            return {"ok": True, "text": "", "result": {"action": "NONE", "score": 0.0, "rewarded": False}}
+        if admission is not None:
+            token = admission.restart()
+        out = await brain.handle_command_async(text, confidence, reward_bias, mood, dog_id=dog_id)
+    finally:
+        if token is not None:
+            admission.release(token)
+    return {"ok": True, "text": text, "result": out}
+
+@app.websocket("/robot/session/{dog_id}")
+async def robot_session(websocket: WebSocket, dog_id: str):
+    runtime = get_runtime()
+    limits = runtime.brain.config.api
+    await CommandSession(
+        websocket, runtime.brain, dog_id, registry=sessions,
+        queue_size=limits.ws_queue_size, max_audio_bytes=limits.max_audio_kb * 1024,
+        stt_executor=runtime.stt_pool, stt_limit=runtime.stt_limit,
+        admission=runtime.admission, is_priority=runtime.is_priority,
+    ).run()
@@ -0,0 +1,99 @@
+"""Process-wide API state: the brain, its STT pool and warm-up status."""
+
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from ..robodog.dog_bot_brain import RoboDogBrain
+from ..utils.logging import get_logger
+from ..utils.metrics import REGISTRY
+from .admission import AdmissionController
+
+log = get_logger("API")
+
+
+class ConcurrencyLimit:
+    """Non-blocking counter of in-flight work; callers fail fast when it is full."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.in_flight = 0
+
+    def try_acquire(self) -> bool:
+        if self.in_flight >= self.limit:
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self) -> None:
+        self.in_flight -= 1
+
+
+class ApiRuntime:
+    """Everything the endpoints share, created once per worker process.
+
+    Construction is cheap (the TTS phrase cache is not filled); the slow
+    parts run in :meth:`warm_up`, normally on a background thread, and
+    :attr:`ready` is set once they have finished.
+    """
+
+    def __init__(self, brain: RoboDogBrain, *, simulate: bool = True) -> None:
+        self.brain = brain
+        self.simulate = simulate
+        limits = brain.config.api
+        # Dedicated STT threads so transcription never starves the default
+        # executor; running plus queued uploads are capped so the pool is
+        # never oversubscribed.
+        self.stt_pool = ThreadPoolExecutor(max_workers=limits.stt_workers, thread_name_prefix="vct-stt")
+        self.stt_limit = ConcurrencyLimit(limits.stt_workers + limits.stt_queue)
+        options = limits.admission
+        self.admission: AdmissionController | None = None
+        if options.enabled:
+            self.admission = AdmissionController(
+                brain.config.latency_budget_ms,
+                max_in_flight=options.max_in_flight,
+                priority_reserve=options.priority_reserve,
+                ewma_alpha=options.ewma_alpha,
+            )
+        self._priority_actions = frozenset(options.priority_actions)
+        self.ready = threading.Event()
+        self.warmup_s: dict[str, float] = {}
+        self.warmup_error: str | None = None
+        REGISTRY.enabled = brain.config.metrics.enabled and os.getenv("VCT_METRICS", "1") == "1"
+
+    @classmethod
+    def from_env(cls) -> ApiRuntime:
+        """Build the runtime from ``VCT_CONFIG``, ``VCT_SIMULATE`` and ``VCT_GPIO_PIN``."""
+
+        cfg = os.getenv("VCT_CONFIG", "vct/config.yaml")
+        simulate = os.getenv("VCT_SIMULATE", "1") == "1"
+        gpio_pin = int(os.getenv("VCT_GPIO_PIN", "0")) or None
+        brain = RoboDogBrain(cfg_path=cfg, gpio_pin=gpio_pin, simulate=simulate, defer_warmup=True)
+        return cls(brain, simulate=simulate)
+
+    def is_priority(self, text: str) -> bool:
+        """Commands that cannot be rewarded (unknown, STOP, ...) bypass latency shedding."""
+
+        action = self.brain._action_from_text(text)
+        return action in self._priority_actions or not self.brain.reward_map.get(action, False)
+
+    def warm_up(self) -> None:
+        try:
+            self.warmup_s = self.brain.warm_up()
+        except Exception as exc:
+            self.warmup_error = str(exc)
+            log.error("Warm-up failed: %s", exc)
+            return
+        self.ready.set()
+        log.info("Warm-up finished: %s", ", ".join(f"{k}={v:.3f}s" for k, v in self.warmup_s.items()))
+
+    def start_warm_up(self) -> threading.Thread:
+        thread = threading.Thread(target=self.warm_up, name="vct-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def close(self) -> None:
+        self.stt_pool.shutdown(wait=False, cancel_futures=True)
+        self.brain.close()
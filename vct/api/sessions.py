@@ -0,0 +1,261 @@
+"""WebSocket command sessions bound to one dog.
+
+A client opens ``/robot/session/{dog_id}`` and streams JSON text frames::
+
+    {"type": "command", "text": "сидіти", "confidence": 0.9, "id": 7}
+    {"type": "audio_end", "id": 8}     # after one or more binary WAV chunks
+    {"type": "ping"}
+
+and receives ``decision``, ``reward``, ``transcript``, ``error`` and ``pong``
+events.  Outgoing events pass through a bounded queue drained by a sender
+task; when the client stops reading, the queue fills and the session stops
+reading new frames until it catches up, so a slow client throttles itself
+instead of growing server memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Callable
+from concurrent.futures import Executor
+from typing import Any
+
+from fastapi import WebSocket, WebSocketDisconnect
+from pydantic import BaseModel, ValidationError
+
+from ..engines.audio import AudioDecodeError
+from ..utils.logging import get_logger
+from .admission import AdmissionController
+from .runtime import ConcurrencyLimit
+
+log = get_logger("API")
+
+
+class SessionCommand(BaseModel):
+    text: str
+    confidence: float = 0.85
+    reward_bias: float = 0.5
+    mood: float = 0.0
+    id: int | str | None = None
+
+
+class SessionRegistry:
+    """Count open sessions per dog.
+
+    Closing the last session leaves the dog's guard state alone: cooldowns
+    and session limits must survive reconnects, and other workers may share
+    that state.  Idle sessions expire through the guard's own eviction.
+    """
+
+    def __init__(self) -> None:
+        self._open: dict[str, int] = {}
+
+    def acquire(self, dog_id: str) -> None:
+        self._open[dog_id] = self._open.get(dog_id, 0) + 1
+
+    def release(self, dog_id: str) -> bool:
+        """Return ``True`` when no session for ``dog_id`` remains open."""
+
+        remaining = self._open.get(dog_id, 1) - 1
+        if remaining <= 0:
+            self._open.pop(dog_id, None)
+            return True
+        self._open[dog_id] = remaining
+        return False
+
+    def active(self, dog_id: str) -> int:
+        return self._open.get(dog_id, 0)
+
+    @property
+    def total(self) -> int:
+        return sum(self._open.values())
+
+
+class CommandSession:
+    """Serve one WebSocket connection for ``dog_id`` until it disconnects."""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        brain: Any,
+        dog_id: str,
+        *,
+        registry: SessionRegistry,
+        queue_size: int = 32,
+        max_audio_bytes: int = 2 * 1024 * 1024,
+        executor: Executor | None = None,
+        stt_executor: Executor | None = None,
+        stt_limit: ConcurrencyLimit | None = None,
+        admission: AdmissionController | None = None,
+        is_priority: Callable[[str], bool] | None = None,
+    ) -> None:
+        self.websocket = websocket
+        self.brain = brain
+        self.dog_id = dog_id
+        self.registry = registry
+        self.max_audio_bytes = max_audio_bytes
+        self.executor = executor
+        self.stt_executor = stt_executor
+        self.stt_limit = stt_limit
+        self.admission = admission
+        self.is_priority = is_priority
+        self._outbox: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=max(1, queue_size))
+        self._audio = bytearray()
+        self._sender: asyncio.Task[None] | None = None
+
+    async def run(self) -> None:
+        await self.websocket.accept()
+        self.registry.acquire(self.dog_id)
+        self._sender = asyncio.create_task(self._send_loop())
+        try:
+            await self._send({"type": "ready", "dog_id": self.dog_id})
+            while True:
+                message = await self.websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                if message.get("bytes") is not None:
+                    await self._on_audio_chunk(message["bytes"])
+                elif message.get("text") is not None:
+                    await self._on_text(message["text"])
+        except WebSocketDisconnect:
+            pass
+        finally:
+            self._cleanup()
+
+    def _cleanup(self) -> None:
+        # Synchronous on purpose: the server may be cancelling this task, and
+        # any await here could be interrupted before state is released.
+        if self._sender is not None:
+            self._sender.cancel()
+        self._audio.clear()
+        self.registry.release(self.dog_id)
+        log.info("Session for %s closed", self.dog_id)
+
+    async def _send_loop(self) -> None:
+        while True:
+            event = await self._outbox.get()
+            await self.websocket.send_json(event)
+
+    async def _send(self, event: dict[str, Any]) -> None:
+        """Queue ``event``; waits while the client is behind on reading."""
+
+        assert self._sender is not None
+        if self._sender.done():
+            raise WebSocketDisconnect()
+        put = asyncio.ensure_future(self._outbox.put(event))
+        done, _ = await asyncio.wait({put, self._sender}, return_when=asyncio.FIRST_COMPLETED)
+        if put not in done:
+            put.cancel()
+            raise WebSocketDisconnect()
+
+    async def _on_audio_chunk(self, chunk: bytes) -> None:
+        if len(self._audio) + len(chunk) > self.max_audio_bytes:
+            self._audio.clear()
+            await self._send({"type": "error", "error": f"Audio exceeds {self.max_audio_bytes} bytes"})
+            return
+        self._audio += chunk
+
+    async def _on_text(self, raw: str) -> None:
+        try:
+            message = json.loads(raw)
+        except ValueError:
+            await self._send({"type": "error", "error": "Message is not valid JSON"})
+            return
+        kind = message.get("type", "command") if isinstance(message, dict) else None
+        if kind == "command":
+            try:
+                command = SessionCommand.model_validate(message)
+            except ValidationError as exc:
+                await self._send({"type": "error", "id": message.get("id"), "error": str(exc.errors()[0]["msg"])})
+                return
+            await self._act(command)
+        elif kind == "audio_end":
+            await self._transcribe_and_act(message)
+        elif kind == "ping":
+            await self._send({"type": "pong"})
+        else:
+            await self._send({"type": "error", "error": f"Unknown message type: {kind!r}"})
+
+    async def _transcribe_and_act(self, message: dict[str, Any]) -> None:
+        audio, self._audio = bytes(self._audio), bytearray()
+        msg_id = message.get("id")
+        fields = {k: message[k] for k in ("confidence", "reward_bias", "mood") if k in message}
+        try:
+            # Validate before transcribing so a bad frame costs no STT time.
+            command = SessionCommand(text="", id=msg_id, **fields)
+        except ValidationError as exc:
+            await self._send({"type": "error", "id": msg_id, "error": str(exc.errors()[0]["msg"])})
+            return
+        if self.stt_limit is not None and not self.stt_limit.try_acquire():
+            await self._send({"type": "error", "id": msg_id, "error": "Speech recognition is busy"})
+            return
+        # The command is unknown until transcribed, so audio is admitted as a regular request.
+        token = self.admission.admit(False) if self.admission is not None else None
+        if self.admission is not None and token is None:
+            if self.stt_limit is not None:
+                self.stt_limit.release()
+            await self._shed(msg_id)
+            return
+        try:
+            loop = asyncio.get_running_loop()
+            try:
+                text = await loop.run_in_executor(self.stt_executor, self.brain.transcribe_audio, audio)
+            except AudioDecodeError as exc:
+                await self._send({"type": "error", "id": msg_id, "error": str(exc)})
+                return
+            finally:
+                if self.stt_limit is not None:
+                    self.stt_limit.release()
+            await self._send({"type": "transcript", "id": msg_id, "text": text})
+            if not text:
+                return
+            command.text = text
+            if self.admission is not None:
+                token = self.admission.restart()  # only the decision counts toward latency
+            result = await self._decide(command)
+        finally:
+            if token is not None:
+                self.admission.release(token)
+        await self._publish(command, result)
+
+    async def _act(self, command: SessionCommand) -> None:
+        token = None
+        if self.admission is not None:
+            priority = self.is_priority(command.text) if self.is_priority is not None else False
+            token = self.admission.admit(priority)
+            if token is None:
+                await self._shed(command.id)
+                return
+        try:
+            result = await self._decide(command)
+        finally:
+            if token is not None:
+                self.admission.release(token)
+        await self._publish(command, result)
+
+    async def _shed(self, msg_id: Any) -> None:
+        assert self.admission is not None
+        await self._send(
+            {
+                "type": "error",
+                "id": msg_id,
+                "error": "Server is over its latency budget",
+                "retry_after": self.admission.retry_after_s(),
+            }
+        )
+
+    async def _decide(self, command: SessionCommand) -> dict[str, Any]:
+        return await self.brain.handle_command_async(
+            command.text,
+            command.confidence,
+            command.reward_bias,
+            command.mood,
+            dog_id=self.dog_id,
+            executor=self.executor,
+        )
+
+    async def _publish(self, command: SessionCommand, result: dict[str, Any]) -> None:
+        await self._send({"type": "decision", "id": command.id, "result": result})
+        if result["rewarded"]:
+            await self._send({"type": "reward", "id": command.id, "action": result["action"], "ts": self.brain.clock.time()})
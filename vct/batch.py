@@ -0,0 +1,161 @@
+"""Streaming JSONL batch processing for the command line interface.
+
+Each input line is a JSON object with either ``text`` or ``wav`` plus
+optional ``confidence``, ``reward_bias``, ``mood``, ``dog_id`` and ``id``.
+One brain handles every record and a JSON line is written per record as
+soon as it completes, tagged with its zero-based input ``index``.  With
+``stt_workers > 1`` WAV files are transcribed on a thread pool while the
+decisions themselves stay on the calling thread, so results for WAV inputs
+may be emitted out of input order.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, TextIO
+
+from .ethics.guard import DEFAULT_DOG_ID
+
+_COMMAND_FIELDS = ("confidence", "reward_bias", "mood")
+
+
+@dataclass
+class BatchSummary:
+    records: int = 0
+    errors: int = 0
+    transcribed: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def records_per_s(self) -> float:
+        return self.records / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def describe(self) -> str:
+        return (
+            f"processed {self.records} records ({self.errors} errors, {self.transcribed} transcribed) "
+            f"in {self.elapsed_s:.2f}s — {self.records_per_s:.1f} records/s"
+        )
+
+
+def iter_records(lines: Iterable[str]) -> Iterator[tuple[int, dict[str, Any] | None, str | None]]:
+    """Yield ``(index, record, error)`` for each non-blank input line."""
+
+    index = 0
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield index, None, f"invalid JSON: {exc}"
+        else:
+            if not isinstance(record, dict):
+                yield index, None, "record must be a JSON object"
+            elif not (isinstance(record.get("text"), str) or isinstance(record.get("wav"), str)):
+                yield index, None, "record needs a 'text' or 'wav' field"
+            else:
+                yield index, record, None
+        index += 1
+
+
+class BatchRunner:
+    """Feed JSONL command records through one :class:`RoboDogBrain`."""
+
+    def __init__(self, brain: Any, out: TextIO, *, stt_workers: int = 1) -> None:
+        self.brain = brain
+        self.out = out
+        self.stt_workers = max(1, int(stt_workers))
+        self.summary = BatchSummary()
+
+    def _emit(self, index: int, record: dict[str, Any] | None, payload: dict[str, Any]) -> None:
+        line: dict[str, Any] = {"index": index}
+        if record is not None and "id" in record:
+            line["id"] = record["id"]
+        line.update(payload)
+        self.out.write(json.dumps(line, ensure_ascii=False) + "\n")
+        self.out.flush()
+        self.summary.records += 1
+        if not payload.get("ok"):
+            self.summary.errors += 1
+
+    def _decide(self, index: int, record: dict[str, Any], text: str, transcribed: bool) -> None:
+        payload: dict[str, Any] = {"ok": True}
+        if transcribed:
+            payload["text"] = text
+        if text:
+            try:
+                kwargs = {k: float(record[k]) for k in _COMMAND_FIELDS if k in record}
+            except (TypeError, ValueError) as exc:
+                self._emit(index, record, {"ok": False, "error": f"invalid numeric field: {exc}"})
+                return
+            dog_id = str(record.get("dog_id", DEFAULT_DOG_ID))
+            try:
+                payload["result"] = self.brain.handle_command(text, dog_id=dog_id, **kwargs)
+            except Exception as exc:
+                # One failing record must not abort the rest of the stream.
+                self._emit(index, record, {"ok": False, "error": str(exc)})
+                return
+        else:
+            payload["result"] = {"action": "NONE", "score": 0.0, "rewarded": False}
+        self._emit(index, record, payload)
+
+    def _finish_transcription(self, index: int, record: dict[str, Any], future: Future[str]) -> None:
+        try:
+            text = future.result()
+        except Exception as exc:
+            self._emit(index, record, {"ok": False, "error": str(exc)})
+            return
+        self.summary.transcribed += 1
+        self._decide(index, record, text, transcribed=True)
+
+    def run(self, lines: Iterable[str]) -> BatchSummary:
+        started = time.perf_counter()
+        pool = ThreadPoolExecutor(self.stt_workers, thread_name_prefix="vct-batch-stt") if self.stt_workers > 1 else None
+        pending: deque[tuple[int, dict[str, Any], Future[str]]] = deque()
+        max_pending = self.stt_workers * 2
+
+        def drain(block: bool) -> None:
+            while pending:
+                if block and len(pending) >= max_pending:
+                    wait([f for _, _, f in pending], return_when=FIRST_COMPLETED)
+                done = [item for item in pending if item[2].done()]
+                if not done:
+                    return
+                for item in done:
+                    pending.remove(item)
+                    self._finish_transcription(*item)
+                block = False
+
+        try:
+            for index, record, error in iter_records(lines):
+                if record is None:
+                    self._emit(index, None, {"ok": False, "error": error})
+                elif "wav" in record and not isinstance(record.get("text"), str):
+                    if pool is None:
+                        try:
+                            text = self.brain.stt.transcribe(wav_path=record["wav"])
+                        except Exception as exc:
+                            self._emit(index, record, {"ok": False, "error": str(exc)})
+                            continue
+                        self.summary.transcribed += 1
+                        self._decide(index, record, text, transcribed=True)
+                    else:
+                        pending.append((index, record, pool.submit(self.brain.stt.transcribe, wav_path=record["wav"])))
+                        drain(block=True)
+                else:
+                    self._decide(index, record, record["text"], transcribed=False)
+                    drain(block=False)
+            while pending:
+                index, record, future = pending.popleft()
+                self._finish_transcription(index, record, future)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
+        self.summary.elapsed_s = time.perf_counter() - started
+        return self.summary
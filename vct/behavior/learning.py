@@ -0,0 +1,132 @@
+"""Online policy learning from simulated interactions."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from .policy import BehaviorPolicy
+
+
+class ReplayBuffer:
+    """Fixed-size ring buffer of ``(features, target)`` transitions.
+
+    Storage is preallocated once, so adding a transition only copies nine
+    floats into the next slot and never allocates.
+    """
+
+    def __init__(self, capacity: int, feature_dim: int = len(BehaviorPolicy.feature_names)) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = int(capacity)
+        self.features = np.zeros((self.capacity, feature_dim), dtype=np.float64)
+        self.targets = np.zeros(self.capacity, dtype=np.float64)
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, features: Sequence[float], target: float) -> None:
+        self.features[self._next] = features
+        self.targets[self._next] = target
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def sample(self, batch_size: int, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+        """Draw ``batch_size`` transitions uniformly with replacement."""
+
+        if self._size == 0:
+            raise ValueError("cannot sample from an empty buffer")
+        idx = rng.integers(0, self._size, size=batch_size)
+        return self.features[idx], self.targets[idx]
+
+
+@dataclass
+class TrainingReport:
+    steps: int
+    updates: int
+    elapsed_s: float
+    steps_per_s: float
+    success_rate: float
+    mean_loss: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return dict(self.__dict__)
+
+
+class OnlineTrainer:
+    """Closed loop: act in :class:`DogEnv`, store outcomes, update the policy.
+
+    Every step runs :meth:`DogEnv.interact`, stores the brain's feature
+    vector with the environment's success flag as the target, and every
+    ``update_every`` steps samples ``batch_size`` transitions for one
+    :meth:`BehaviorPolicy.train_batch` update.  The environment is reset every
+    ``episode_length`` steps so fatigue does not saturate.  Pair the brain
+    with a :class:`~vct.utils.clock.VirtualClock` and a silent TTS engine to
+    train at full speed.
+    """
+
+    def __init__(
+        self,
+        brain: Any,
+        env: Any,
+        commands: Sequence[str],
+        *,
+        buffer_size: int = 10_000,
+        batch_size: int = 64,
+        update_every: int = 16,
+        episode_length: int = 50,
+        seed: int = 0,
+        confidence: float = 0.85,
+        reward_bias: float = 0.5,
+    ) -> None:
+        if not commands:
+            raise ValueError("OnlineTrainer needs at least one command")
+        self.brain = brain
+        self.env = env
+        self.commands = list(commands)
+        self.buffer = ReplayBuffer(buffer_size)
+        self.batch_size = max(1, int(batch_size))
+        self.update_every = max(1, int(update_every))
+        self.episode_length = max(1, int(episode_length))
+        self.confidence = confidence
+        self.reward_bias = reward_bias
+        self._rng = np.random.default_rng(seed)
+
+    def run(self, steps: int) -> TrainingReport:
+        policy: BehaviorPolicy = self.brain.policy
+        successes = 0
+        updates = 0
+        loss_total = 0.0
+        started = time.perf_counter()
+        for step in range(1, steps + 1):
+            command = self.commands[(step - 1) % len(self.commands)]
+            out = self.env.interact(
+                self.brain,
+                command,
+                confidence=self.confidence,
+                reward_bias=self.reward_bias,
+            )
+            success = bool(out["env"]["success"])
+            successes += success
+            self.buffer.add(self.brain.last_features(), 1.0 if success else 0.0)
+            if step % self.update_every == 0:
+                X, y = self.buffer.sample(self.batch_size, self._rng)
+                loss_total += policy.train_batch(X, y)
+                updates += 1
+            if step % self.episode_length == 0:
+                self.env.reset()
+        elapsed = time.perf_counter() - started
+        return TrainingReport(
+            steps=steps,
+            updates=updates,
+            elapsed_s=elapsed,
+            steps_per_s=steps / elapsed if elapsed > 0 else float("inf"),
+            success_rate=successes / steps if steps else 0.0,
+            mean_loss=loss_total / updates if updates else 0.0,
+        )
@@ -5,6 +5,8 @@ import random
 from dataclasses import dataclass, field
 from typing import Dict, Iterable, List, Sequence, Tuple
 
+import numpy as np
+
 
 @dataclass
 class BehaviorInputs:
@@ -44,6 +46,42 @@ class BehaviorInputs:
         return base_features
 
 
+def feature_matrix(
+    stimulus,
+    confidence,
+    reward_bias,
+    mood=0.0,
+    energy_level=0.5,
+    proximity=0.5,
+    threat_level=0.0,
+    social_context=0.5,
+    context_signal=0.5,
+) -> np.ndarray:
+    """Batched counterpart of :meth:`BehaviorInputs.to_feature_vector`.
+
+    Every argument may be a scalar or an array; they are broadcast to a common
+    length and returned as an ``(N, 9)`` matrix in ``feature_names`` order.
+    """
+
+    columns = np.broadcast_arrays(
+        *(
+            np.asarray(value, dtype=np.float64)
+            for value in (
+                stimulus,
+                confidence,
+                reward_bias,
+                (np.asarray(mood, dtype=np.float64) + 1.0) / 2.0,
+                energy_level,
+                proximity,
+                threat_level,
+                social_context,
+                context_signal,
+            )
+        )
+    )
+    return np.clip(np.column_stack([np.atleast_1d(c) for c in columns]), 0.0, 1.0)
+
+
 @dataclass
 class BehaviorVector:
     score: float
@@ -87,6 +125,9 @@ class BehaviorPolicy:
         self.b1: List[float] = [0.0 for _ in range(self.hidden_size)]
         self.W2: List[float] = [random.uniform(-init_bound, init_bound) for _ in range(self.hidden_size)]
         self.b2: float = 0.0
+        # Reused by score_features so its loops do not build range objects.
+        self._input_range = range(self.input_size)
+        self._hidden_range = range(self.hidden_size)
 
         self.default_weights: Dict[str, float] = {
             "stimulus": 0.4,
@@ -165,6 +206,85 @@ class BehaviorPolicy:
                 hidden, output = self._forward(features)
                 self._backpropagate(features, hidden, output, target_clamped)
 
+    def train_batch(self, features: np.ndarray, targets: np.ndarray) -> float:
+        """Apply one mini-batch gradient step; returns the batch log-loss.
+
+        Uses the same network and cross-entropy gradient as :meth:`train`, but
+        averages it over the batch in a single vectorised pass.
+        """
+
+        X = np.asarray(features, dtype=np.float64)
+        y = np.clip(np.asarray(targets, dtype=np.float64), 0.0, 1.0)
+        if X.shape[0] == 0:
+            return 0.0
+        W1 = np.asarray(self.W1)
+        b1 = np.asarray(self.b1)
+        W2 = np.asarray(self.W2)
+
+        hidden = np.tanh(X @ W1.T + b1)
+        activation = hidden @ W2 + self.b2
+        z = np.exp(-np.abs(activation))
+        output = np.where(activation >= 0, 1.0 / (1.0 + z), z / (1.0 + z))
+        error = output - y
+        n = X.shape[0]
+
+        grad_hidden = (1.0 - hidden**2) * np.outer(error, W2)
+        W1 -= self.learning_rate * (grad_hidden.T @ X) / n
+        b1 -= self.learning_rate * grad_hidden.mean(axis=0)
+        W2 -= self.learning_rate * (hidden.T @ error) / n
+        self.b2 -= self.learning_rate * float(error.mean())
+
+        self.W1 = W1.tolist()
+        self.b1 = b1.tolist()
+        self.W2 = W2.tolist()
+        eps = 1e-12
+        return float(-np.mean(y * np.log(output + eps) + (1.0 - y) * np.log(1.0 - output + eps)))
+
+    def score_batch(self, features: np.ndarray) -> np.ndarray:
+        """Score an ``(N, 9)`` feature matrix in one vectorised pass.
+
+        Produces the same values as calling :meth:`decide` row by row.
+        """
+
+        X = np.asarray(features, dtype=np.float64)
+        hidden = np.tanh(X @ np.asarray(self.W1).T + np.asarray(self.b1))
+        activation = hidden @ np.asarray(self.W2) + self.b2
+        z = np.exp(-np.abs(activation))
+        score_nn = np.where(activation >= 0, 1.0 / (1.0 + z), z / (1.0 + z))
+        legacy = np.array([self.legacy_weights.get(name, 0.0) for name in self.feature_names])
+        baseline = np.clip(X @ legacy, 0.0, 1.0)
+        score = (1.0 - self.baseline_mix) * score_nn + self.baseline_mix * baseline
+        return np.clip(score, 0.0, 1.0)
+
+    def score_features(self, features: Sequence[float]) -> float:
+        """Score one feature vector like :meth:`decide` without temporary objects.
+
+        Folds each hidden unit into the output as soon as it is computed
+        instead of collecting the layer in a list; the additions happen in
+        the same order as in :meth:`_forward` and :meth:`_baseline_score`,
+        so the result is bit-for-bit identical.
+        """
+
+        W1, b1, W2 = self.W1, self.b1, self.W2
+        inputs = self._input_range
+        output_activation = self.b2
+        for i in self._hidden_range:
+            activation = b1[i]
+            weights = W1[i]
+            for j in inputs:
+                activation += weights[j] * features[j]
+            output_activation += W2[i] * math.tanh(activation)
+        score_nn = self._sigmoid(output_activation)
+
+        legacy = self.legacy_weights
+        names = self.feature_names
+        baseline = 0.0
+        for j in inputs:
+            baseline += legacy.get(names[j], 0.0) * features[j]
+        baseline = max(0.0, min(1.0, baseline))
+        score = (1.0 - self.baseline_mix) * score_nn + self.baseline_mix * baseline
+        return max(0.0, min(1.0, score))
+
     def decide(self, action: str, inputs: BehaviorInputs) -> BehaviorVector:
         features = inputs.to_feature_vector()
         _, score_nn = self._forward(features)
@@ -0,0 +1,25 @@
+from .suite import (
+    BENCHMARKS,
+    DEFAULT_BASELINE_PATH,
+    DEFAULT_THRESHOLD,
+    BenchmarkResult,
+    Regression,
+    compare,
+    load_baseline,
+    run_benchmark,
+    run_benchmarks,
+    save_baseline,
+)
+
+__all__ = [
+    "BENCHMARKS",
+    "DEFAULT_BASELINE_PATH",
+    "DEFAULT_THRESHOLD",
+    "BenchmarkResult",
+    "Regression",
+    "compare",
+    "load_baseline",
+    "run_benchmark",
+    "run_benchmarks",
+    "save_baseline",
+]
@@ -0,0 +1,57 @@
+"""Command line entry point: ``python -m vct.benchmarks``."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from .suite import (
+    BENCHMARKS,
+    DEFAULT_BASELINE_PATH,
+    DEFAULT_THRESHOLD,
+    compare,
+    load_baseline,
+    run_benchmarks,
+    save_baseline,
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the RoboDog hot-path benchmarks")
+    parser.add_argument("names", nargs="*", help=f"Benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repeats per benchmark")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE_PATH), help="Baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown as a fraction of the baseline (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.names or None, repeat=args.repeat)
+    for result in results.values():
+        print(f"{result.name:<18} median={result.median_s * 1e6:10.2f}us  min={result.min_s * 1e6:10.2f}us  n={result.number}")
+
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    try:
+        baseline = load_baseline(args.baseline)
+    except FileNotFoundError:
+        print(f"No baseline at {args.baseline}; run with --save to create one", file=sys.stderr)
+        return 0
+    regressions = compare(results, baseline, args.threshold)
+    for reg in regressions:
+        print(
+            f"REGRESSION {reg.name}: {reg.baseline_s * 1e6:.2f}us -> {reg.current_s * 1e6:.2f}us (x{reg.ratio:.2f})",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":  # pragma: no cover - entry point
+    sys.exit(main())
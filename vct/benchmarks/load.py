@@ -0,0 +1,149 @@
+"""Concurrent load test for ``/robot/act``: blocking handler vs async handler.
+
+Run with ``python -m vct.benchmarks.load``.  Both apps share the same
+simulate-mode brain on a virtual clock; speech is emulated by a TTS engine
+that blocks for ``speech_delay_s`` per phrase, like a local synthesiser
+would.  Requests are driven in-process through :class:`httpx.ASGITransport`,
+so the numbers measure the server path rather than the network.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from ..engines.tts import NullTTS
+from .suite import _quiet_brain
+
+MODES = ("sync", "async")
+
+
+@dataclass(frozen=True)
+class LoadResult:
+    mode: str
+    requests: int
+    concurrency: int
+    elapsed_s: float
+    requests_per_s: float
+    p50_ms: float
+    p95_ms: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class _BlockingTTS(NullTTS):
+    def __init__(self, delay_s: float) -> None:
+        self.delay_s = delay_s
+
+    def speak(self, text: str) -> None:
+        time.sleep(self.delay_s)
+
+
+class _ActIn(BaseModel):
+    text: str
+    confidence: float = 0.85
+    reward_bias: float = 0.5
+    mood: float = 0.0
+    dog_id: str = "default"
+
+
+def build_app(mode: str, brain: Any) -> FastAPI:
+    """Return an app serving ``/robot/act`` the ``sync`` (legacy) or ``async`` way."""
+
+    app = FastAPI()
+    if mode == "sync":
+        @app.post("/robot/act")
+        def act_sync(inp: _ActIn) -> dict[str, Any]:
+            out = brain.handle_command(inp.text, inp.confidence, inp.reward_bias, inp.mood, dog_id=inp.dog_id)
+            return {"ok": True, "result": out}
+    elif mode == "async":
+        @app.post("/robot/act")
+        async def act_async(inp: _ActIn) -> dict[str, Any]:
+            out = await brain.handle_command_async(inp.text, inp.confidence, inp.reward_bias, inp.mood, dog_id=inp.dog_id)
+            return {"ok": True, "result": out}
+    else:
+        raise ValueError(f"Unknown mode '{mode}', expected one of {MODES}")
+    return app
+
+
+async def run_load(
+    app: FastAPI, *, requests: int = 500, concurrency: int = 50, dogs: int = 16
+) -> tuple[float, list[float]]:
+    """Fire ``requests`` POSTs with at most ``concurrency`` in flight.
+
+    Returns the wall time until the last response and per-request latencies;
+    speech still queued in executors afterwards is not counted.
+    """
+
+    import httpx
+
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://vct") as client:
+        async def one(i: int) -> None:
+            payload = {"text": "сидіти", "confidence": 0.9, "dog_id": f"dog-{i % dogs}"}
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.post("/robot/act", json=payload)
+                latencies.append(time.perf_counter() - started)
+            response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        elapsed = time.perf_counter() - started
+    return elapsed, latencies
+
+
+def measure(mode: str, *, requests: int = 500, concurrency: int = 50, speech_delay_s: float = 0.005) -> LoadResult:
+    brain = _quiet_brain()
+    brain.tts = _BlockingTTS(speech_delay_s)
+    app = build_app(mode, brain)
+    with contextlib.redirect_stdout(io.StringIO()):
+        elapsed, latencies = asyncio.run(run_load(app, requests=requests, concurrency=concurrency))
+    latencies.sort()
+    return LoadResult(
+        mode=mode,
+        requests=requests,
+        concurrency=concurrency,
+        elapsed_s=elapsed,
+        requests_per_s=requests / elapsed if elapsed > 0 else float("inf"),
+        p50_ms=statistics.median(latencies) * 1e3,
+        p95_ms=latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))] * 1e3,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Load test the blocking and async /robot/act handlers")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--speech-delay-ms", type=float, default=5.0, help="Blocking time of each spoken phrase")
+    args = parser.parse_args(argv)
+
+    for mode in MODES:
+        result = measure(
+            mode,
+            requests=args.requests,
+            concurrency=args.concurrency,
+            speech_delay_s=args.speech_delay_ms / 1e3,
+        )
+        print(
+            f"{mode:<6} {result.requests_per_s:9.1f} req/s  "
+            f"p50={result.p50_ms:7.2f}ms  p95={result.p95_ms:7.2f}ms  ({result.requests} requests)"
+        )
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - entry point
+    sys.exit(main())
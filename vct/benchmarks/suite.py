@@ -0,0 +1,203 @@
+"""Micro-benchmarks for the RoboDog hot paths with JSON baselines."""
+
+from __future__ import annotations
+
+import contextlib
+import gc
+import io
+import json
+import logging
+import platform
+import statistics
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+DEFAULT_BASELINE_PATH = Path("benchmarks/baseline.json")
+DEFAULT_THRESHOLD = 0.25
+
+# A benchmark factory performs its (untimed) setup and returns the callable
+# whose per-call latency is measured.
+BenchmarkFactory = Callable[[], Callable[[], Any]]
+BENCHMARKS: dict[str, BenchmarkFactory] = {}
+
+
+def benchmark(name: str) -> Callable[[BenchmarkFactory], BenchmarkFactory]:
+    def register(factory: BenchmarkFactory) -> BenchmarkFactory:
+        BENCHMARKS[name] = factory
+        return factory
+
+    return register
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    number: int
+    repeat: int
+    min_s: float
+    median_s: float
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    baseline_s: float
+    current_s: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_s / self.baseline_s if self.baseline_s > 0 else float("inf")
+
+
+def _quiet_brain(**kwargs: Any) -> Any:
+    from ..robodog.dog_bot_brain import RoboDogBrain
+
+    logging.getLogger("RoboDogBrain").setLevel(logging.WARNING)
+    return RoboDogBrain.for_simulation(**kwargs)
+
+
+@benchmark("load_config")
+def _bench_load_config() -> Callable[[], Any]:
+    from ..configuration import DEFAULT_CONFIG_PATH, load_config
+
+    return lambda: load_config(DEFAULT_CONFIG_PATH)
+
+
+@benchmark("action_from_text")
+def _bench_action_from_text() -> Callable[[], Any]:
+    brain = _quiet_brain()
+    return lambda: brain._action_from_text("Рекс, до мене!")
+
+
+@benchmark("policy_decide")
+def _bench_policy_decide() -> Callable[[], Any]:
+    from ..behavior.policy import BehaviorInputs, BehaviorPolicy
+
+    policy = BehaviorPolicy()
+    inputs = BehaviorInputs(1.0, 0.9, 0.5, mood=0.2, context={"owner": 1.0})
+    return lambda: policy.decide("SIT", inputs)
+
+
+@benchmark("policy_train")
+def _bench_policy_train() -> Callable[[], Any]:
+    from ..behavior.policy import BehaviorInputs, BehaviorPolicy
+
+    policy = BehaviorPolicy()
+    dataset = [(BehaviorInputs(1.0, i / 32, 0.5), float(i % 2)) for i in range(32)]
+    return lambda: policy.train(dataset, epochs=1)
+
+
+@benchmark("handle_command")
+def _bench_handle_command() -> Callable[[], Any]:
+    brain = _quiet_brain()
+    return lambda: brain.handle_command("сидіти", 0.9, 0.5, 0.1)
+
+
+@benchmark("dogenv_step")
+def _bench_dogenv_step() -> Callable[[], Any]:
+    from ..simulation.dog_env import DogEnv
+
+    env = DogEnv(seed=0)
+    return lambda: env.step("SIT", 0.8)
+
+
+@benchmark("api_act")
+def _bench_api_act() -> Callable[[], Any]:
+    from fastapi.testclient import TestClient
+
+    from ..api import app as api_module
+    from ..engines.tts import NullTTS
+
+    logging.getLogger("RoboDogBrain").setLevel(logging.WARNING)
+    api_module.get_runtime().brain.tts = NullTTS()
+    client = TestClient(api_module.app)
+    payload = {"text": "сидіти", "confidence": 0.9, "reward_bias": 0.5, "mood": 0.0}
+    return lambda: client.post("/robot/act", json=payload)
+
+
+def run_benchmark(
+    name: str,
+    *,
+    number: int | None = None,
+    repeat: int = 5,
+    min_time_s: float = 0.05,
+) -> BenchmarkResult:
+    """Measure ``name``; ``number`` calls per repeat is auto-scaled when omitted.
+
+    Like :mod:`timeit`, garbage collection is paused while timing so results
+    do not depend on how many objects the surrounding process holds.
+    """
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn = BENCHMARKS[name]()
+        fn()  # warm-up, also excludes lazy initialisation from the timings
+        gc.collect()
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            if number is None:
+                number = 1
+                while True:
+                    started = time.perf_counter()
+                    for _ in range(number):
+                        fn()
+                    if time.perf_counter() - started >= min_time_s or number >= 1_000_000:
+                        break
+                    number *= 2
+            samples = []
+            for _ in range(max(1, repeat)):
+                started = time.perf_counter()
+                for _ in range(number):
+                    fn()
+                samples.append((time.perf_counter() - started) / number)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+    return BenchmarkResult(name, number, len(samples), min(samples), statistics.median(samples))
+
+
+def run_benchmarks(names: Iterable[str] | None = None, **kwargs: Any) -> dict[str, BenchmarkResult]:
+    selected = list(names) if names else list(BENCHMARKS)
+    unknown = [n for n in selected if n not in BENCHMARKS]
+    if unknown:
+        raise KeyError(f"Unknown benchmarks: {', '.join(unknown)}")
+    return {name: run_benchmark(name, **kwargs) for name in selected}
+
+
+def save_baseline(results: Mapping[str, BenchmarkResult], path: str | Path = DEFAULT_BASELINE_PATH) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "machine": {"python": platform.python_version(), "platform": platform.platform()},
+        "results": {name: asdict(result) for name, result in results.items()},
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def load_baseline(path: str | Path = DEFAULT_BASELINE_PATH) -> dict[str, float]:
+    """Return ``{name: best seconds per call}`` from a saved baseline."""
+
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    return {name: float(entry["min_s"]) for name, entry in data.get("results", {}).items()}
+
+
+def compare(
+    results: Mapping[str, BenchmarkResult],
+    baseline: Mapping[str, float],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Regression]:
+    """Benchmarks more than ``threshold`` (a fraction) slower than the baseline.
+
+    Best-of-repeats timings are compared, as they are the least sensitive to
+    scheduler noise on shared machines.
+    """
+
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is not None and result.min_s > reference * (1.0 + threshold):
+            regressions.append(Regression(name, reference, result.min_s))
+    return regressions
@@ -3,18 +3,68 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import json
+import logging
+import os
 import sys
+from typing import TYPE_CHECKING, Any
 
-from .configuration import overrides_from_iter
-from .robodog.dog_bot_brain import RoboDogBrain
+from . import daemon
 
+if TYPE_CHECKING:
+    from .robodog.dog_bot_brain import RoboDogBrain
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Interact with the RoboDog brain controller")
+# The brain, configuration and batch modules are imported inside the
+# functions that need them so ``--client`` calls start without loading them.
+
+
+def _run_batch(brain: RoboDogBrain, source: str, stt_workers: int) -> None:
+    from .batch import BatchRunner
+
+    out = sys.stdout
+    logging.getLogger("RoboDogBrain").setLevel(logging.WARNING)
+    stream = sys.stdin if source == "-" else open(source, encoding="utf-8")
+    try:
+        # Engines print progress; keep stdout for the JSON lines only.
+        with contextlib.redirect_stdout(sys.stderr):
+            summary = BatchRunner(brain, out, stt_workers=stt_workers).run(stream)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    print(summary.describe(), file=sys.stderr)
+
+
+def _print_traces(traces: list[dict[str, Any]]) -> None:
+    for trace in traces:
+        print(json.dumps(trace, ensure_ascii=False), file=sys.stderr)
+
+
+def _brain_options(args: argparse.Namespace) -> dict[str, Any]:
+    """The options a brain is built with, as compared between client and daemon."""
+
+    return {"config": os.path.realpath(args.config), "simulate": args.simulate, "gpio_pin": args.gpio_pin}
+
+
+def _forward(args: argparse.Namespace) -> dict[str, Any] | None:
+    """Run the request on the daemon; ``None`` when it must run in-process instead."""
+
+    payload: dict[str, Any] = {"wav": os.path.abspath(args.wav)} if args.wav else {"cmd": args.cmd or "сидіти"}
+    payload["brain"] = _brain_options(args)
+    try:
+        reply = daemon.request(payload, args.socket)
+    except daemon.DaemonUnavailable:
+        return None
+    if reply.get("code") == "options_mismatch":
+        print(f"{reply['error']}; running in-process", file=sys.stderr)
+        return None
+    if not reply.get("ok"):
+        raise SystemExit(f"daemon error: {reply.get('error')}")
+    return reply["result"]
+
+
+def _add_brain_options(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--config", default="vct/config.yaml", help="Path to configuration file")
-    parser.add_argument("--wav", help="Run recognition on an audio file")
-    parser.add_argument("--cmd", help="Command text to process")
     parser.add_argument("--gpio-pin", type=int, default=None, help="GPIO pin for reward actuator")
     parser.add_argument("--simulate", action="store_true", help="Run without accessing hardware")
     parser.add_argument(
@@ -28,7 +78,11 @@ def main() -> None:
             "Supports dotted keys, e.g. --set weights.stimulus=0.55"
         ),
     )
-    args = parser.parse_args()
+
+
+def _build_brain(parser: argparse.ArgumentParser, args: argparse.Namespace, **kwargs: Any) -> RoboDogBrain:
+    from .configuration import overrides_from_iter
+    from .robodog.dog_bot_brain import RoboDogBrain
 
     try:
         overrides = overrides_from_iter(args.overrides)
@@ -36,17 +90,164 @@ def main() -> None:
         parser.error(str(exc))
         sys.exit(2)
 
-    brain = RoboDogBrain(
+    return RoboDogBrain(
         cfg_path=args.config,
         gpio_pin=args.gpio_pin,
         simulate=args.simulate,
         config_overrides=overrides,
+        **kwargs,
+    )
+
+
+def _profile(argv: list[str]) -> None:
+    from . import profiling
+    from .utils.clock import SIMULATION_EPOCH, VirtualClock
+
+    parser = argparse.ArgumentParser(
+        prog="python -m vct.cli profile",
+        description="Profile a synthetic workload through the RoboDog brain, stage by stage",
+    )
+    workload = parser.add_mutually_exclusive_group()
+    workload.add_argument(
+        "--wav", action="append", default=[], metavar="FILE", help="Transcribe and run WAV files (repeatable)"
     )
-    if args.wav:
-        result = brain.run_once_from_wav(args.wav)
-    else:
-        result = brain.handle_command(args.cmd or "сидіти")
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    workload.add_argument("--session", action="store_true", help="Drive the commands through a DogEnv session")
+    parser.add_argument(
+        "--commands",
+        default=None,
+        help="Comma-separated command texts (default: every phrase in commands_map)",
+    )
+    parser.add_argument("--iterations", type=int, default=200, help="Commands to run (default: %(default)s)")
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Simulated seconds between commands, so cooldowns behave as in real use (default: %(default)s)",
+    )
+    parser.add_argument("--top", type=int, default=10, help="Rows per stage table (default: %(default)s)")
+    parser.add_argument(
+        "--alloc-samples",
+        type=int,
+        default=20,
+        help="Calls per stage diffed with tracemalloc snapshots (default: %(default)s)",
+    )
+    parser.add_argument("--collapsed", metavar="FILE", help="Write sampled stacks in collapsed (flamegraph) format")
+    parser.add_argument(
+        "--sample-interval-ms",
+        type=float,
+        default=1.0,
+        help="Stack sampling period for --collapsed (default: %(default)s)",
+    )
+    _add_brain_options(parser)
+    args = parser.parse_args(argv)
+
+    # Simulated time keeps cooldowns and pulses from stalling the workload.
+    brain = _build_brain(parser, args, clock=VirtualClock(start=SIMULATION_EPOCH))
+    logging.getLogger("RoboDogBrain").setLevel(logging.WARNING)
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            brain.warm_up()
+            commands = [c.strip() for c in args.commands.split(",")] if args.commands else list(brain.config.commands_map)
+            if args.wav:
+                run = profiling.wav_workload(brain, args.wav, args.iterations, interval_s=args.interval)
+            elif args.session:
+                run = profiling.session_workload(brain, commands, args.iterations, interval_s=args.interval)
+            else:
+                run = profiling.command_workload(brain, commands, args.iterations, interval_s=args.interval)
+            profiler = profiling.StageProfiler(
+                top=args.top,
+                alloc_samples=args.alloc_samples,
+                sample_interval_s=args.sample_interval_ms / 1000.0 if args.collapsed else None,
+            )
+            profiler.attach(brain)
+            try:
+                report = profiler.run(run)
+            finally:
+                profiler.detach()
+    finally:
+        brain.close()
+    print(report.describe())
+    if args.collapsed:
+        written = report.write_collapsed(args.collapsed)
+        print(f"wrote {written} collapsed stacks to {args.collapsed}", file=sys.stderr)
+
+
+def main(argv: list[str] | None = None) -> None:
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ["profile"]:
+        _profile(argv[1:])
+        return
+    parser = argparse.ArgumentParser(description="Interact with the RoboDog brain controller")
+    parser.add_argument("--wav", help="Run recognition on an audio file")
+    parser.add_argument("--cmd", help="Command text to process")
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="Process JSONL command records from FILE ('-' for stdin), one JSON result per line",
+    )
+    parser.add_argument(
+        "--stt-workers",
+        type=int,
+        default=1,
+        help="Threads transcribing wav records in --batch mode (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--traces",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Trace every command and print the N slowest traces to stderr as JSON (with --client: the daemon's)",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Keep a warmed brain resident and answer --client requests on a Unix socket",
+    )
+    parser.add_argument(
+        "--client",
+        action="store_true",
+        help="Send --cmd/--wav to a running --serve daemon, running in-process if none is listening",
+    )
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help="Unix socket of the daemon (default: $VCT_SOCKET, $XDG_RUNTIME_DIR/vct.sock or a temp file)",
+    )
+    _add_brain_options(parser)
+    args = parser.parse_args(argv)
+
+    # The daemon runs with its own configuration, so overrides force in-process
+    # execution; other brain options are checked by the daemon itself.
+    if args.client and not args.batch and not args.overrides:
+        result = _forward(args)
+        if result is not None:
+            print(json.dumps(result, ensure_ascii=False, indent=2))
+            if args.traces:
+                reply = daemon.request({"op": "traces", "limit": args.traces}, args.socket)
+                _print_traces(reply["result"] if reply.get("ok") else [])
+            return
+
+    brain = _build_brain(parser, args)
+    if args.traces:
+        brain.tracer.enabled = True
+    if args.serve:
+        daemon.serve(brain, args.socket, options=_brain_options(args))  # closes the brain on shutdown
+        return
+    try:
+        if args.batch:
+            _run_batch(brain, args.batch, args.stt_workers)
+        else:
+            if args.wav:
+                result = brain.run_once_from_wav(args.wav)
+            else:
+                result = brain.handle_command(args.cmd or "сидіти")
+            print(json.dumps(result, ensure_ascii=False, indent=2))
+        if args.traces:
+            _print_traces([span.to_dict() for span in brain.tracer.slowest(args.traces)])
+    finally:
+        # Flushes buffered ledger records and recordings before exit.
+        brain.close()
 
 
 if __name__ == "__main__":  # pragma: no cover - entry point
@@ -9,7 +9,7 @@ from typing import Any
 import json
 
 import yaml
-from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator, model_validator
 
 DEFAULT_CONFIG_PATH = Path("vct/config.yaml")
 
@@ -46,6 +46,111 @@ class TTSOptions(BaseModel):
     language: str = Field(default="uk", min_length=1)
     voice: str | None = None
     slow: bool = False
+    cache_dir: str | None = None
+    cache_max_mb: float = Field(default=32.0, gt=0.0)
+    prerender: list[str] = Field(default_factory=list)
+    background: bool = False
+    queue_size: int = Field(default=8, ge=1)
+    coalesce: str = Field(default="latest", pattern="^(latest|none)$")
+    max_age_s: float | None = Field(default=None, gt=0.0)
+
+
+class EthicsOptions(BaseModel):
+    """Reward safety limits enforced by :class:`vct.ethics.guard.EthicsGuard`."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    max_session_min: int = Field(default=15, ge=0)
+    min_inter_reward_s: float = Field(default=2.0, ge=0.0)
+    allow_bark_reward: bool = False
+    min_score: float = Field(default=0.6, ge=0.0, le=1.0)
+    burst_rewards: int = Field(default=0, ge=0)
+    burst_window_s: float = Field(default=60.0, gt=0.0)
+    session_idle_s: float = Field(default=300.0, gt=0.0)
+    max_sessions: int = Field(default=10_000, ge=1)
+
+
+class LedgerOptions(BaseModel):
+    """Append-only reward ledger settings; disabled when ``path`` is unset."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    path: str | None = None
+    commit_every: int = Field(default=64, ge=1)
+    commit_interval_s: float = Field(default=1.0, ge=0.0)
+    fsync: bool = False
+    restore_guard: bool = True
+
+
+class HardwareOptions(BaseModel):
+    """Reward dispenser settings."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    pulse_s: float = Field(default=0.4, gt=0.0)
+    non_blocking: bool = False
+
+
+class StateOptions(BaseModel):
+    """Where per-dog guard sessions are stored.
+
+    ``sqlite`` shares cooldowns and session limits between API workers.
+    """
+
+    model_config = ConfigDict(extra="ignore")
+
+    backend: str = Field(default="memory", pattern="^(memory|sqlite)$")
+    path: str | None = None
+    timeout_s: float = Field(default=5.0, gt=0.0)
+
+    @model_validator(mode="after")
+    def check_path(self) -> "StateOptions":
+        if self.backend == "sqlite" and not self.path:
+            raise ValueError("state.path is required for the sqlite backend")
+        return self
+
+
+class MetricsOptions(BaseModel):
+    """In-process metrics exported on ``/metrics``."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    enabled: bool = True
+
+
+class TracingOptions(BaseModel):
+    """Per-command span traces kept in memory and served on ``/traces``."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    enabled: bool = False
+    capacity: int = Field(default=256, ge=1)
+
+
+class AdmissionOptions(BaseModel):
+    """Load shedding in front of the command endpoints, tied to ``latency_budget_ms``."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    enabled: bool = True
+    max_in_flight: int = Field(default=64, ge=1)
+    priority_reserve: int = Field(default=16, ge=0)
+    ewma_alpha: float = Field(default=0.2, gt=0.0, le=1.0)
+    priority_actions: list[str] = Field(default_factory=lambda: ["STOP"])
+
+
+class ApiOptions(BaseModel):
+    """HTTP and WebSocket API limits."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    max_batch_items: int = Field(default=256, ge=1)
+    max_batch_kb: int = Field(default=256, ge=1)
+    ws_queue_size: int = Field(default=32, ge=1)
+    max_audio_kb: int = Field(default=2048, ge=1)
+    stt_workers: int = Field(default=2, ge=1)
+    stt_queue: int = Field(default=4, ge=0)
+    admission: AdmissionOptions = Field(default_factory=AdmissionOptions)
 
 
 class RoboDogConfig(BaseModel):
@@ -54,6 +159,8 @@ class RoboDogConfig(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
     latency_budget_ms: int = Field(default=300, ge=0)
+    # Decide with preallocated feature buffers and precomputed per-action constants.
+    hot_path: bool = False
     reward_cooldown_s: float = Field(default=3.0, ge=0.0)
     weights: dict[str, float] = Field(default_factory=dict)
     commands_map: dict[str, str] = Field(default_factory=dict)
@@ -61,6 +168,13 @@ class RoboDogConfig(BaseModel):
     mood_initial: str = Field(default="CALM")
     behavior_defaults: BehaviorDefaults = Field(default_factory=BehaviorDefaults)
     tts: TTSOptions = Field(default_factory=TTSOptions)
+    ethics: EthicsOptions = Field(default_factory=EthicsOptions)
+    ledger: LedgerOptions = Field(default_factory=LedgerOptions)
+    hardware: HardwareOptions = Field(default_factory=HardwareOptions)
+    api: ApiOptions = Field(default_factory=ApiOptions)
+    metrics: MetricsOptions = Field(default_factory=MetricsOptions)
+    tracing: TracingOptions = Field(default_factory=TracingOptions)
+    state: StateOptions = Field(default_factory=StateOptions)
 
     @field_validator("weights", mode="after")
     @classmethod
@@ -0,0 +1,193 @@
+"""Resident brain served over a Unix domain socket.
+
+Starting the CLI loads the configuration, the matcher, the policy and the
+speech engines, which costs far more than deciding a single command.  The
+daemon keeps one warmed :class:`~vct.robodog.dog_bot_brain.RoboDogBrain`
+alive and answers requests from ``python -m vct.cli --client``.
+
+The protocol is one JSON object per line in each direction.  A request holds
+either ``cmd`` (command text) or ``wav`` (an absolute path readable by the
+daemon) plus an optional ``dog_id`` and ``brain`` (the options the client
+would build its brain with); ``{"op": "ping"}`` checks that the daemon is
+alive and ``{"op": "traces", "limit": N}`` returns the slowest recorded
+command traces.  Every reply is ``{"ok": true, "result": ...}`` or
+``{"ok": false, "error": ...}``; a request whose ``brain`` options differ
+from the daemon's is refused with ``"code": "options_mismatch"``.  Connections are handled on their own
+threads, while calls into the brain are serialised by a lock.
+
+This module imports only the standard library at the top, so the client
+side stays cheap to start.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+DEFAULT_TIMEOUT_S = 30.0
+
+
+class DaemonUnavailable(ConnectionError):
+    """No daemon is listening on the socket."""
+
+
+class OptionsMismatch(ValueError):
+    """The request was made for a brain configured differently from the daemon's."""
+
+
+def default_socket_path() -> Path:
+    """``VCT_SOCKET``, else ``$XDG_RUNTIME_DIR/vct.sock``, else a per-user file in the temp dir."""
+
+    explicit = os.getenv("VCT_SOCKET")
+    if explicit:
+        return Path(explicit)
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "vct.sock"
+    return Path(tempfile.gettempdir()) / f"vct-{os.getuid()}.sock"
+
+
+def request(
+    payload: dict[str, Any], socket_path: str | Path | None = None, *, timeout_s: float = DEFAULT_TIMEOUT_S
+) -> dict[str, Any]:
+    """Send one request and return the daemon's reply.
+
+    Raises :class:`DaemonUnavailable` when nothing accepts the connection.
+    """
+
+    path = str(socket_path or default_socket_path())
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout_s)
+    try:
+        try:
+            sock.connect(path)
+        except (FileNotFoundError, ConnectionRefusedError) as exc:
+            raise DaemonUnavailable(f"no daemon listening on {path}") from exc
+        sock.sendall(json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+    finally:
+        sock.close()
+    if not line:
+        raise DaemonUnavailable(f"daemon on {path} closed the connection")
+    return json.loads(line)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: BrainServer
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            reply = self.server.dispatch(line)
+            self.wfile.write(json.dumps(reply, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class BrainServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Answer CLI requests with a resident brain."""
+
+    daemon_threads = True
+
+    def __init__(self, brain: Any, socket_path: str | Path, *, options: Mapping[str, Any] | None = None) -> None:
+        self.brain = brain
+        self.socket_path = Path(socket_path)
+        # Options the brain was built with; requests naming other options are refused.
+        self.options = dict(options) if options is not None else None
+        self._brain_lock = threading.Lock()
+        _claim_socket_path(self.socket_path)
+        super().__init__(str(self.socket_path), _Handler)
+        os.chmod(self.socket_path, 0o600)
+
+    def dispatch(self, line: bytes) -> dict[str, Any]:
+        try:
+            payload = json.loads(line)
+            if not isinstance(payload, dict):
+                raise ValueError("request must be a JSON object")
+            return {"ok": True, "result": self.execute(payload)}
+        except OptionsMismatch as exc:
+            return {"ok": False, "error": str(exc), "code": "options_mismatch"}
+        except Exception as exc:
+            return {"ok": False, "error": str(exc)}
+
+    def execute(self, payload: dict[str, Any]) -> Any:
+        op = payload.get("op")
+        if op == "ping":
+            return {"pid": os.getpid()}
+        if op == "traces":
+            tracer = self.brain.tracer
+            if not tracer.enabled:
+                raise ValueError("tracing is disabled on the daemon")
+            return [span.to_dict() for span in tracer.slowest(int(payload.get("limit", 10)))]
+        requested = payload.get("brain")
+        if self.options is not None and requested is not None and requested != self.options:
+            raise OptionsMismatch(f"daemon runs with {self.options}, request asked for {requested}")
+        kwargs = {"dog_id": str(payload["dog_id"])} if "dog_id" in payload else {}
+        if isinstance(payload.get("wav"), str):
+            with self._brain_lock:
+                return self.brain.run_once_from_wav(payload["wav"], **kwargs)
+        if isinstance(payload.get("cmd"), str):
+            with self._brain_lock:
+                return self.brain.handle_command(payload["cmd"], **kwargs)
+        raise ValueError("request needs a 'cmd' or 'wav' field")
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+
+def _claim_socket_path(path: Path) -> None:
+    """Remove a socket left behind by a dead daemon; refuse if one is still alive."""
+
+    try:
+        mode = path.lstat().st_mode
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return
+    if not stat.S_ISSOCK(mode):
+        raise RuntimeError(f"{path} exists and is not a socket; refusing to replace it")
+    try:
+        request({"op": "ping"}, path, timeout_s=1.0)
+    except (DaemonUnavailable, OSError, ValueError):
+        path.unlink()
+        return
+    raise RuntimeError(f"A daemon is already listening on {path}")
+
+
+def serve(
+    brain: Any, socket_path: str | Path | None = None, *, options: Mapping[str, Any] | None = None
+) -> None:
+    """Warm ``brain`` up and serve requests until SIGINT or SIGTERM."""
+
+    try:
+        brain.warm_up()
+        server = BrainServer(brain, socket_path or default_socket_path(), options=options)
+    except BaseException:
+        # The brain is handed over to serve(), so release its state and workers here too.
+        brain.close()
+        raise
+
+    def stop(signum: int, frame: Any) -> None:
+        # shutdown() waits for serve_forever(), which runs on this thread.
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    previous = signal.signal(signal.SIGTERM, stop)
+    print(f"vct daemon listening on {server.socket_path}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+        server.server_close()
+        brain.close()
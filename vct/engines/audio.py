@@ -0,0 +1,181 @@
+"""In-process audio loading for the speech-to-text engines.
+
+Whisper accepts either a path (which it decodes by spawning ``ffmpeg``) or a
+mono ``float32`` array sampled at 16 kHz.  Decoding PCM WAV ourselves avoids
+the fork/exec and pipe copy per clip and lets callers pass in-memory uploads
+without touching the filesystem.
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Union
+
+import numpy as np
+
+TARGET_SAMPLE_RATE = 16_000
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+AudioSource = Union[str, Path, bytes, bytearray, memoryview, BinaryIO, np.ndarray]
+
+
+class AudioDecodeError(ValueError):
+    """Raised when an audio payload is not a supported WAV stream."""
+
+
+@dataclass(frozen=True)
+class WavFormat:
+    """Subset of the ``fmt `` chunk needed to decode samples."""
+
+    format_tag: int
+    channels: int
+    sample_rate: int
+    bits_per_sample: int
+
+    @property
+    def sample_width(self) -> int:
+        return self.bits_per_sample // 8
+
+
+def _parse_chunks(buf: memoryview) -> tuple[WavFormat, memoryview]:
+    if len(buf) < 12 or bytes(buf[0:4]) != b"RIFF" or bytes(buf[8:12]) != b"WAVE":
+        raise AudioDecodeError("Not a RIFF/WAVE stream")
+
+    fmt: WavFormat | None = None
+    offset = 12
+    size = len(buf)
+    while offset + 8 <= size:
+        chunk_id = bytes(buf[offset : offset + 4])
+        (chunk_size,) = struct.unpack_from("<I", buf, offset + 4)
+        body_start = offset + 8
+        body_end = min(body_start + chunk_size, size)
+        if chunk_id == b"fmt ":
+            if chunk_size < 16:
+                raise AudioDecodeError("Truncated fmt chunk")
+            tag, channels, rate, _, _, bits = struct.unpack_from("<HHIIHH", buf, body_start)
+            if tag == _WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40:
+                # The real format tag is the first two bytes of the sub-format GUID.
+                (tag,) = struct.unpack_from("<H", buf, body_start + 24)
+            fmt = WavFormat(tag, channels, rate, bits)
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise AudioDecodeError("data chunk precedes fmt chunk")
+            return fmt, buf[body_start:body_end]
+        # Chunks are word aligned; odd sizes carry a pad byte.
+        offset = body_start + chunk_size + (chunk_size & 1)
+    raise AudioDecodeError("WAV stream has no data chunk")
+
+
+def _samples_to_float(fmt: WavFormat, data: memoryview) -> np.ndarray:
+    width = fmt.sample_width
+    if fmt.channels < 1 or width < 1:
+        raise AudioDecodeError(f"Invalid WAV header: {fmt}")
+    frame = width * fmt.channels
+    usable = len(data) - len(data) % frame
+
+    if fmt.format_tag == _WAVE_FORMAT_IEEE_FLOAT:
+        if width not in (4, 8):
+            raise AudioDecodeError(f"Unsupported float sample width: {width * 8} bits")
+        dtype = np.dtype("<f4" if width == 4 else "<f8")
+        samples = np.frombuffer(data[:usable], dtype=dtype).astype(np.float32)
+    elif fmt.format_tag == _WAVE_FORMAT_PCM:
+        if width == 1:
+            raw = np.frombuffer(data[:usable], dtype=np.uint8)
+            samples = (raw.astype(np.float32) - 128.0) / 128.0
+        elif width == 2:
+            raw = np.frombuffer(data[:usable], dtype="<i2")
+            samples = raw.astype(np.float32) / 32768.0
+        elif width == 3:
+            raw = np.frombuffer(data[:usable], dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+            value = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+            value = np.where(value & 0x800000, value - 0x1000000, value)
+            samples = value.astype(np.float32) / 8388608.0
+        elif width == 4:
+            raw = np.frombuffer(data[:usable], dtype="<i4")
+            samples = (raw.astype(np.float64) / 2147483648.0).astype(np.float32)
+        else:
+            raise AudioDecodeError(f"Unsupported PCM sample width: {width * 8} bits")
+    else:
+        raise AudioDecodeError(f"Unsupported WAV format tag: 0x{fmt.format_tag:04x}")
+
+    if fmt.channels > 1:
+        samples = samples.reshape(-1, fmt.channels).mean(axis=1, dtype=np.float32)
+    return samples
+
+
+def resample(samples: np.ndarray, source_rate: int, target_rate: int = TARGET_SAMPLE_RATE) -> np.ndarray:
+    """Linearly resample ``samples`` from ``source_rate`` to ``target_rate``."""
+
+    if source_rate <= 0 or target_rate <= 0:
+        raise AudioDecodeError("Sample rates must be positive")
+    if source_rate == target_rate or samples.size == 0:
+        return np.ascontiguousarray(samples, dtype=np.float32)
+    target_len = max(1, int(round(samples.size * target_rate / source_rate)))
+    positions = np.arange(target_len, dtype=np.float64) * (source_rate / target_rate)
+    source_idx = np.arange(samples.size, dtype=np.float64)
+    return np.interp(positions, source_idx, samples).astype(np.float32)
+
+
+def decode_wav(buffer: bytes | bytearray | memoryview, target_rate: int = TARGET_SAMPLE_RATE) -> np.ndarray:
+    """Decode an in-memory WAV payload into mono ``float32`` samples."""
+
+    view = memoryview(buffer).cast("B")
+    fmt, data = _parse_chunks(view)
+    samples = _samples_to_float(fmt, data)
+    return resample(samples, fmt.sample_rate, target_rate)
+
+
+def decode_pcm(
+    buffer: bytes | bytearray | memoryview,
+    sample_rate: int,
+    channels: int = 1,
+    sample_width: int = 2,
+    target_rate: int = TARGET_SAMPLE_RATE,
+) -> np.ndarray:
+    """Decode headerless little-endian integer PCM (e.g. ``audio/L16``)."""
+
+    fmt = WavFormat(_WAVE_FORMAT_PCM, channels, sample_rate, sample_width * 8)
+    samples = _samples_to_float(fmt, memoryview(buffer).cast("B"))
+    return resample(samples, sample_rate, target_rate)
+
+
+def load_audio(source: AudioSource, target_rate: int = TARGET_SAMPLE_RATE) -> np.ndarray:
+    """Load ``source`` into a mono ``float32`` array at ``target_rate``.
+
+    Paths are memory-mapped so the kernel pages the file in directly; bytes-like
+    objects and binary file objects are decoded without any disk round-trip.
+    Arrays are taken as already-decoded samples at ``target_rate``.
+    """
+
+    if isinstance(source, np.ndarray):
+        # Already decoded, e.g. by decode_pcm; assumed to be at target_rate.
+        return np.ascontiguousarray(source, dtype=np.float32).reshape(-1)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return decode_wav(source, target_rate)
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        with path.open("rb") as handle:
+            if path.stat().st_size == 0:
+                raise AudioDecodeError(f"Empty audio file: {path}")
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                # ``decode_wav`` copies samples out while converting to float32, so
+                # the mapping can be closed as soon as it returns.
+                with memoryview(mapped) as view:
+                    try:
+                        return decode_wav(view, target_rate)
+                    except (AudioDecodeError, struct.error) as exc:
+                        # The traceback pins slices of ``view``; re-raise only once
+                        # it is gone so the mapping can actually be closed.
+                        error = AudioDecodeError(f"{path}: {exc}")
+        raise error
+
+    if isinstance(source, io.IOBase) or hasattr(source, "read"):
+        return decode_wav(source.read(), target_rate)
+    raise TypeError(f"Unsupported audio source type: {type(source).__name__}")
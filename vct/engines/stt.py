@@ -5,17 +5,35 @@ from __future__ import annotations
 import threading
 import warnings
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+from ..utils.metrics import STAGE_SECONDS
+from .audio import TARGET_SAMPLE_RATE, load_audio
+
+_STT_SECONDS = STAGE_SECONDS.labels("stt")
+
+AudioBytes = Union[bytes, bytearray, memoryview, np.ndarray]
 
 
 class STTEngineBase:
     """Abstract base class for speech-to-text engines."""
 
-    def transcribe(self, wav_path: Optional[Path] = None, use_mic: bool = False) -> str:
-        """Convert speech to text from either a WAV file or microphone input."""
+    def transcribe(
+        self,
+        wav_path: Optional[Path] = None,
+        use_mic: bool = False,
+        *,
+        audio: Optional[AudioBytes] = None,
+    ) -> str:
+        """Convert speech to text from a WAV file, in-memory WAV bytes, decoded samples or the microphone."""
 
         raise NotImplementedError
 
+    def warm_up(self) -> None:
+        """Load models ahead of the first request; a no-op by default."""
+
 
 class WhisperSTT(STTEngineBase):
     """Wrapper around the OpenAI Whisper model for speech recognition."""
@@ -47,13 +65,31 @@ class WhisperSTT(STTEngineBase):
                     self._model = self._model_loader(self.model_name, self.device)
         return self._model
 
-    def transcribe(self, wav_path: Optional[Path] = None, use_mic: bool = False) -> str:
+    def warm_up(self) -> None:
+        self._ensure_model()
+
+    def transcribe(
+        self,
+        wav_path: Optional[Path] = None,
+        use_mic: bool = False,
+        *,
+        audio: Optional[AudioBytes] = None,
+    ) -> str:
         if use_mic:
             raise NotImplementedError("Microphone transcription is not implemented for WhisperSTT")
-        if not wav_path:
+        if audio is not None:
+            source = audio
+        elif wav_path:
+            source = wav_path
+        else:
             return ""
-        model = self._ensure_model()
-        result = model.transcribe(str(wav_path))
+        with _STT_SECONDS.time():
+            # Decode in-process so Whisper receives samples instead of spawning ffmpeg.
+            samples = load_audio(source, TARGET_SAMPLE_RATE)
+            if samples.size == 0:
+                return ""
+            model = self._ensure_model()
+            result = model.transcribe(samples)
         if isinstance(result, dict):
             text = result.get("text", "")
         else:
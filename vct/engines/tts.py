@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import itertools
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple, Union
+
+from ..utils.metrics import STAGE_SECONDS
+from .tts_cache import PhraseAudioCache
+
+_TTS_SECONDS = STAGE_SECONDS.labels("tts")
 
 
 class TTSEngineBase:
@@ -19,56 +29,153 @@ class TTSEngineBase:
 
         return True
 
+    def prerender(self, phrases: Iterable[str]) -> int:
+        """Synthesise ``phrases`` ahead of time; returns the number rendered."""
+
+        return 0
+
+    def enqueue(self, text: str, key: Optional[Hashable] = None) -> None:
+        """Speak ``text`` on behalf of ``key`` (e.g. a dog id).
+
+        Synchronous engines simply speak; :class:`BackgroundTTS` uses the key
+        to coalesce superseded utterances.
+        """
+
+        with _TTS_SECONDS.time():
+            self.speak(text)
+
+    def close(self) -> None:
+        """Release background resources held by the engine."""
+
+
+def _default_player() -> Optional[Callable[[str], None]]:
+    try:  # pragma: no cover - depends on optional dependency
+        from playsound import playsound  # type: ignore
+
+        return playsound
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+
 
 class Pyttsx3TTS(TTSEngineBase):
-    """Local TTS backend relying on the ``pyttsx3`` library."""
+    """Local TTS backend relying on the ``pyttsx3`` library.
+
+    With a :class:`PhraseAudioCache` and an audio player available, phrases are
+    rendered to WAV once via ``save_to_file`` and replayed from the cache.
+    """
 
-    def __init__(self) -> None:
+    provider = "pyttsx3"
+
+    def __init__(
+        self,
+        *,
+        cache: Optional[PhraseAudioCache] = None,
+        engine_factory: Optional[Callable[[], Any]] = None,
+        player: Optional[Callable[[str], None]] = None,
+    ) -> None:
         try:  # pragma: no cover - depends on optional dependency
-            import pyttsx3  # type: ignore
+            if engine_factory is None:
+                import pyttsx3  # type: ignore
 
-            self.engine = pyttsx3.init()
+                engine_factory = pyttsx3.init
+            self.engine = engine_factory()
         except Exception:  # pragma: no cover - graceful degradation
             self.engine = None
+        self.cache = cache
+        self._player = player if player is not None else (_default_player() if cache else None)
 
     def is_usable(self) -> bool:
         return self.engine is not None
 
+    def _cached_path(self, text: str) -> Path:
+        assert self.cache is not None  # for mypy
+        key = PhraseAudioCache.make_key(text, "", None, False, self.provider)
+
+        def render(path: Path) -> None:
+            self.engine.save_to_file(text, str(path))
+            self.engine.runAndWait()
+
+        return self.cache.get_or_render(key, render, ".wav")
+
+    def prerender(self, phrases: Iterable[str]) -> int:
+        if self.engine is None or self.cache is None:
+            return 0
+        count = 0
+        for phrase in phrases:
+            self._cached_path(phrase)
+            count += 1
+        return count
+
     def speak(self, text: str) -> None:
         if self.engine is None:
             print(f"[TTS] {text}")
+        elif self.cache is not None and self._player is not None:
+            self._player(str(self._cached_path(text)))
         else:  # pragma: no cover - depends on audio stack
             self.engine.say(text)
             self.engine.runAndWait()
 
 
 class GTTSTTS(TTSEngineBase):
-    """Cloud TTS backend using the `gTTS` API with multiple locales."""
+    """Cloud TTS backend using the `gTTS` API with multiple locales.
+
+    When a :class:`PhraseAudioCache` is supplied, repeated phrases are played
+    straight from the cache without another synthesis round-trip.
+    """
+
+    provider = "gtts"
 
     def __init__(
         self,
         language: str = "en",
         voice: Optional[str] = None,
         slow: bool = False,
+        *,
+        cache: Optional[PhraseAudioCache] = None,
+        gtts_factory: Optional[Callable[..., Any]] = None,
+        player: Optional[Callable[[str], None]] = None,
     ) -> None:
         self.language = language
         self.voice = voice or "com"
         self.slow = slow
-        self._gtts_cls = None
-        self._playsound = None
+        self.cache = cache
+        self._gtts_cls = gtts_factory
+        self._playsound = player
         self._error: Optional[str] = None
-        try:  # pragma: no cover - depends on optional dependency
-            from gtts import gTTS  # type: ignore
-            from playsound import playsound  # type: ignore
+        if self._gtts_cls is None or self._playsound is None:
+            try:  # pragma: no cover - depends on optional dependency
+                from gtts import gTTS  # type: ignore
+                from playsound import playsound  # type: ignore
 
-            self._gtts_cls = gTTS
-            self._playsound = playsound
-        except Exception as exc:  # pragma: no cover - optional dependency
-            self._error = str(exc)
+                self._gtts_cls = self._gtts_cls or gTTS
+                self._playsound = self._playsound or playsound
+            except Exception as exc:  # pragma: no cover - optional dependency
+                self._error = str(exc)
 
     def is_usable(self) -> bool:
         return self._gtts_cls is not None and self._playsound is not None
 
+    def _cached_path(self, text: str) -> Path:
+        assert self.cache is not None  # for mypy
+        assert self._gtts_cls is not None  # for mypy
+        key = PhraseAudioCache.make_key(text, self.language, self.voice, self.slow, self.provider)
+
+        def render(path: Path) -> None:
+            tts = self._gtts_cls(text=text, lang=self.language, tld=self.voice, slow=self.slow)
+            with path.open("wb") as handle:
+                tts.write_to_fp(handle)
+
+        return self.cache.get_or_render(key, render, ".mp3")
+
+    def prerender(self, phrases: Iterable[str]) -> int:
+        if self.cache is None or not self.is_usable():
+            return 0
+        count = 0
+        for phrase in phrases:
+            self._cached_path(phrase)
+            count += 1
+        return count
+
     def speak(self, text: str) -> None:
         if not self.is_usable():
             if self._error:
@@ -79,6 +186,10 @@ class GTTSTTS(TTSEngineBase):
 
         assert self._gtts_cls is not None  # for mypy
         assert self._playsound is not None  # for mypy
+        if self.cache is not None:
+            self._playsound(str(self._cached_path(text)))
+            return
+
         with NamedTemporaryFile(delete=False, suffix=".mp3") as tmp_file:
             tmp_path = Path(tmp_file.name)
             tts = self._gtts_cls(text=text, lang=self.language, tld=self.voice, slow=self.slow)
@@ -100,6 +211,197 @@ class PrintTTS(TTSEngineBase):
         print(f"[TTS] {text}")
 
 
+class NullTTS(TTSEngineBase):
+    """Engine that discards all speech, for batch simulations and benchmarks."""
+
+    def speak(self, text: str) -> None:
+        return None
+
+
+@dataclass
+class TTSQueueStats:
+    """Snapshot of :class:`BackgroundTTS` queue health."""
+
+    depth: int
+    enqueued: int
+    played: int
+    dropped: int
+    coalesced: int
+    last_lag_s: float
+    max_lag_s: float
+    mean_lag_s: float
+
+
+@dataclass
+class _PrerenderJob:
+    """Phrases to render on the :class:`BackgroundTTS` worker thread."""
+
+    phrases: Tuple[str, ...]
+    done: "Future[int]" = field(default_factory=Future)
+
+
+class BackgroundTTS(TTSEngineBase):
+    """Plays utterances from a bounded queue on a dedicated worker thread.
+
+    The wrapped engine instance stays alive for the lifetime of the worker so
+    ``speak`` returns immediately instead of blocking on ``runAndWait`` or
+    ``playsound``.  With ``coalesce="latest"`` a pending utterance is replaced
+    by a newer one for the same key, so only the freshest feedback per dog is
+    played; utterances enqueued without a key are never coalesced.  When the
+    queue is full the oldest pending utterance is dropped, as are utterances
+    older than ``max_age_s`` by the time they reach the front of the queue.
+    Prerendering is also handed to the worker, so no other thread ever
+    touches the engine.
+    """
+
+    COALESCE_POLICIES = ("latest", "none")
+
+    def __init__(
+        self,
+        engine: TTSEngineBase,
+        *,
+        max_queue: int = 8,
+        coalesce: str = "latest",
+        max_age_s: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if coalesce not in self.COALESCE_POLICIES:
+            raise ValueError(f"Unknown coalesce policy '{coalesce}', expected one of {self.COALESCE_POLICIES}")
+        self.engine = engine
+        self.max_queue = max(1, int(max_queue))
+        self.coalesce = coalesce
+        self.max_age_s = max_age_s
+        self._clock = clock
+        self._pending: "OrderedDict[Hashable, Tuple[str, float]]" = OrderedDict()
+        self._jobs: "deque[_PrerenderJob]" = deque()
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._enqueued = 0
+        self._played = 0
+        self._dropped = 0
+        self._coalesced = 0
+        self._last_lag = 0.0
+        self._max_lag = 0.0
+        self._lag_total = 0.0
+        self._thread = threading.Thread(target=self._run, name="vct-tts", daemon=True)
+        self._thread.start()
+
+    def is_usable(self) -> bool:
+        return self.engine.is_usable()
+
+    def prerender(self, phrases: Iterable[str]) -> int:
+        """Render ``phrases`` on the worker thread and wait for the result."""
+
+        job = _PrerenderJob(tuple(phrases))
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("BackgroundTTS is closed")
+            self._jobs.append(job)
+            self._cond.notify()
+        return job.done.result()
+
+    def speak(self, text: str) -> None:
+        self.enqueue(text)
+
+    def enqueue(self, text: str, key: Optional[Hashable] = None) -> None:
+        now = self._clock()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("BackgroundTTS is closed")
+            self._enqueued += 1
+            if self.coalesce == "latest" and key is not None:
+                slot: Hashable = ("key", key)
+                if slot in self._pending:
+                    del self._pending[slot]
+                    self._coalesced += 1
+            else:
+                slot = ("seq", next(self._seq))
+            while len(self._pending) >= self.max_queue:
+                self._pending.popitem(last=False)
+                self._dropped += 1
+            self._pending[slot] = (text, now)
+            self._cond.notify()
+
+    def _next_utterance(self) -> Union[Tuple[str, float], _PrerenderJob, None]:
+        with self._cond:
+            while True:
+                while not self._pending and not self._jobs and not self._closed:
+                    self._cond.wait()
+                if self._jobs:
+                    self._busy = True
+                    return self._jobs.popleft()
+                if not self._pending:
+                    return None
+                _, (text, enqueued_at) = self._pending.popitem(last=False)
+                lag = self._clock() - enqueued_at
+                if self.max_age_s is not None and lag > self.max_age_s:
+                    self._dropped += 1
+                    self._cond.notify_all()
+                    continue
+                self._busy = True
+                self._last_lag = lag
+                self._max_lag = max(self._max_lag, lag)
+                self._lag_total += lag
+                return text, lag
+
+    def _run(self) -> None:
+        while True:
+            item = self._next_utterance()
+            if item is None:
+                return
+            if isinstance(item, _PrerenderJob):
+                self._prerender(item)
+                continue
+            try:
+                with _TTS_SECONDS.time():
+                    self.engine.speak(item[0])
+            except Exception as exc:  # pragma: no cover - depends on audio stack
+                print(f"[TTS:error] {exc}")
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._played += 1
+                    self._cond.notify_all()
+
+    def _prerender(self, job: _PrerenderJob) -> None:
+        try:
+            job.done.set_result(self.engine.prerender(job.phrases))
+        except Exception as exc:
+            job.done.set_exception(exc)
+        finally:
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+
+    def stats(self) -> TTSQueueStats:
+        with self._cond:
+            return TTSQueueStats(
+                depth=len(self._pending),
+                enqueued=self._enqueued,
+                played=self._played,
+                dropped=self._dropped,
+                coalesced=self._coalesced,
+                last_lag_s=self._last_lag,
+                max_lag_s=self._max_lag,
+                mean_lag_s=self._lag_total / self._played if self._played else 0.0,
+            )
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until every pending utterance has been played or dropped."""
+
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        self.engine.close()
+
+
 @dataclass
 class TTSConfig:
     """Configuration data for the TTS factory."""
@@ -108,42 +410,82 @@ class TTSConfig:
     language: str = "en"
     voice: Optional[str] = None
     slow: bool = False
+    cache_dir: Optional[str] = None
+    cache_max_mb: float = 32.0
+    prerender: Tuple[str, ...] = field(default_factory=tuple)
+    background: bool = False
+    queue_size: int = 8
+    coalesce: str = "latest"
+    max_age_s: Optional[float] = None
 
     @classmethod
     def from_mapping(cls, cfg: Optional[Dict[str, Any]]) -> "TTSConfig":
         if not cfg:
             return cls()
+        cache_dir = cfg.get("cache_dir")
         return cls(
             provider=str(cfg.get("provider", "auto")).lower(),
             language=str(cfg.get("language", "en")),
             voice=cfg.get("voice"),
             slow=bool(cfg.get("slow", False)),
+            cache_dir=str(cache_dir) if cache_dir else None,
+            cache_max_mb=float(cfg.get("cache_max_mb", 32.0)),
+            prerender=tuple(str(p) for p in (cfg.get("prerender") or ())),
+            background=bool(cfg.get("background", False)),
+            queue_size=int(cfg.get("queue_size", 8)),
+            coalesce=str(cfg.get("coalesce", "latest")).lower(),
+            max_age_s=float(cfg["max_age_s"]) if cfg.get("max_age_s") is not None else None,
         )
 
 
-def create_tts_engine(cfg: Optional[Dict[str, Any]] = None) -> TTSEngineBase:
-    """Factory that returns the most appropriate TTS engine."""
-
-    options = TTSConfig.from_mapping(cfg)
+def _select_engine(options: TTSConfig, cache: Optional[PhraseAudioCache]) -> TTSEngineBase:
     provider = options.provider
 
     if provider in {"print", "console"}:
         return PrintTTS()
+    if provider in {"none", "silent"}:
+        return NullTTS()
     if provider == "pyttsx3":
-        engine = Pyttsx3TTS()
+        engine = Pyttsx3TTS(cache=cache)
         return engine if engine.is_usable() else PrintTTS()
     if provider == "gtts":
-        engine = GTTSTTS(language=options.language, voice=options.voice, slow=options.slow)
+        engine = GTTSTTS(language=options.language, voice=options.voice, slow=options.slow, cache=cache)
         return engine if engine.is_usable() else PrintTTS()
 
     if provider == "auto":
-        gtts_engine = GTTSTTS(language=options.language, voice=options.voice, slow=options.slow)
+        gtts_engine = GTTSTTS(
+            language=options.language, voice=options.voice, slow=options.slow, cache=cache
+        )
         if gtts_engine.is_usable():
             return gtts_engine
-        pytt_engine = Pyttsx3TTS()
+        pytt_engine = Pyttsx3TTS(cache=cache)
         if pytt_engine.is_usable():
             return pytt_engine
         return PrintTTS()
 
     # Unknown provider - gracefully fall back to printing output.
     return PrintTTS()
+
+
+def create_tts_engine(cfg: Optional[Dict[str, Any]] = None, *, prerender: bool = True) -> TTSEngineBase:
+    """Factory that returns the most appropriate TTS engine.
+
+    ``prerender=False`` skips rendering the configured phrases so a caller can
+    do it later, e.g. during a background warm-up.
+    """
+
+    options = TTSConfig.from_mapping(cfg)
+    cache = None
+    if options.cache_dir:
+        cache = PhraseAudioCache(options.cache_dir, max_bytes=int(options.cache_max_mb * 1024 * 1024))
+    engine = _select_engine(options, cache)
+    if prerender and options.prerender:
+        engine.prerender(options.prerender)
+    if options.background:
+        return BackgroundTTS(
+            engine,
+            max_queue=options.queue_size,
+            coalesce=options.coalesce,
+            max_age_s=options.max_age_s,
+        )
+    return engine
@@ -0,0 +1,120 @@
+"""Persistent cache of synthesised phrase audio for the TTS engines."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional
+
+
+class PhraseAudioCache:
+    """Size-bounded on-disk cache of rendered utterances.
+
+    Entries are keyed by everything that influences the rendered audio
+    (text, language, voice, speed and provider) and evicted in least recently
+    used order once ``max_bytes`` is exceeded.  The index is rebuilt from the
+    directory on start-up so rendered phrases survive restarts.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int = 32 * 1024 * 1024) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max(0, int(max_bytes))
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple[Path, int]]" = OrderedDict()
+        self._total_bytes = 0
+        self._load_index()
+
+    @staticmethod
+    def make_key(
+        text: str,
+        language: str,
+        voice: Optional[str],
+        slow: bool,
+        provider: str,
+    ) -> str:
+        raw = "\x1f".join((provider, language, voice or "", "1" if slow else "0", text))
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def _load_index(self) -> None:
+        files = []
+        for path in self.directory.iterdir():
+            if path.is_file() and not path.name.startswith("."):
+                stat = path.stat()
+                files.append((stat.st_mtime, path, stat.st_size))
+        for _, path, size in sorted(files):
+            self._entries[path.stem] = (path, size)
+            self._total_bytes += size
+        self._evict()
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            _, (path, size) = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def get(self, key: str) -> Optional[Path]:
+        """Return the cached file for ``key`` and mark it recently used."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if not entry[0].exists():
+                del self._entries[key]
+                self._total_bytes -= entry[1]
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def get_or_render(self, key: str, render: Callable[[Path], None], suffix: str) -> Path:
+        """Return the cached file for ``key``, calling ``render`` on a miss.
+
+        ``render`` receives a temporary path in the cache directory; the file
+        is atomically moved into place once rendering succeeds.
+        """
+
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        target = self.directory / f"{key}{suffix}"
+        tmp_path = self.directory / f".{key}.{threading.get_ident()}.tmp{suffix}"
+        try:
+            render(tmp_path)
+            os.replace(tmp_path, target)
+        finally:
+            try:
+                tmp_path.unlink()
+            except FileNotFoundError:
+                pass
+
+        size = target.stat().st_size
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous[1]
+            self._entries[key] = (target, size)
+            self._total_bytes += size
+            self._evict()
+        return target
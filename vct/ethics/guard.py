@@ -1,22 +1,201 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
 from dataclasses import dataclass
 
+from ..utils.clock import SYSTEM_CLOCK, Clock
+from ..utils.metrics import GUARD_DECISIONS
+from .state import DogSession, MemoryStateBackend, StateBackend, StateTransaction
+
+DEFAULT_DOG_ID = "default"
+
+
 @dataclass
 class EthicsConfig:
     max_session_min: int = 15
     min_inter_reward_s: float = 2.0
     allow_bark_reward: bool = False
+    min_score: float = 0.6
+    # Token bucket per (dog, action): at most ``burst_rewards`` rewards, refilled
+    # evenly over ``burst_window_s``.  ``0`` disables the bucket.
+    burst_rewards: int = 0
+    burst_window_s: float = 60.0
+    # Sessions idle for longer than this restart and become eligible for eviction.
+    session_idle_s: float = 300.0
+    max_sessions: int = 10_000
+
+
+@dataclass(frozen=True)
+class GuardDecision:
+    allowed: bool
+    reason: str
+
+
+ALLOWED = GuardDecision(True, "ok")
+DENY_BARK = GuardDecision(False, "bark_blocked")
+DENY_SESSION = GuardDecision(False, "session_limit")
+DENY_COOLDOWN = GuardDecision(False, "cooldown")
+DENY_RATE = GuardDecision(False, "rate_limited")
+DENY_SCORE = GuardDecision(False, "low_score")
+NOT_REWARDABLE = GuardDecision(False, "not_rewardable")
+
 
 class EthicsGuard:
-    def __init__(self, cfg: EthicsConfig | None = None):
+    """Reward safety rules applied per dog session.
+
+    Each dog gets a compact session record holding its last reward time, the
+    session start and a token bucket per action, so checks are O(1) regardless
+    of how many dogs one process serves.  Records live in a
+    :class:`~vct.ethics.state.StateBackend` ordered by last activity; idle
+    sessions are evicted as new traffic arrives and the total is capped at
+    ``max_sessions``.
+
+    Every public method runs in one backend transaction; use
+    :meth:`try_reward` to check and book a reward atomically when several
+    threads, or with :class:`~vct.ethics.state.SQLiteStateBackend` several
+    processes, share the state.
+    """
+
+    def __init__(
+        self,
+        cfg: EthicsConfig | None = None,
+        clock: Clock = SYSTEM_CLOCK,
+        backend: StateBackend | None = None,
+    ):
         self.cfg = cfg or EthicsConfig()
-        self._last_reward_ts = 0.0
+        self.clock = clock
+        self.backend = backend or MemoryStateBackend()
+
+    @property
+    def session_count(self) -> int:
+        return self.backend.count()
+
+    def _session(self, txn: StateTransaction, dog_id: str, now_ts: float) -> DogSession:
+        session = txn.load(dog_id)
+        if session is None:
+            session = DogSession(now_ts)
+            txn.save(dog_id, session)
+            txn.evict(now_ts - self.cfg.session_idle_s, self.cfg.max_sessions)
+        elif now_ts - session.last_seen_ts > self.cfg.session_idle_s:
+            session.started_ts = now_ts
+        session.last_seen_ts = max(session.last_seen_ts, now_ts)
+        return session
 
-    def can_reward(self, now_ts: float, action: str, score: float, cooldown_s: float) -> bool:
+    def _tokens(self, session: DogSession, action: str, now_ts: float) -> list[float]:
+        capacity = float(self.cfg.burst_rewards)
+        bucket = session.buckets.get(action)
+        if bucket is None:
+            bucket = [capacity, now_ts]
+            session.buckets[action] = bucket
+        elif now_ts > bucket[1]:
+            refill = (now_ts - bucket[1]) * capacity / max(self.cfg.burst_window_s, 1e-9)
+            bucket[0] = min(capacity, bucket[0] + refill)
+            bucket[1] = now_ts
+        return bucket
+
+    def _evaluate(
+        self, session: DogSession, now_ts: float, action: str, score: float, cooldown_s: float
+    ) -> GuardDecision:
+        if self.cfg.max_session_min > 0 and now_ts - session.started_ts > self.cfg.max_session_min * 60.0:
+            return DENY_SESSION
+        if now_ts - session.last_reward_ts < max(cooldown_s, self.cfg.min_inter_reward_s):
+            return DENY_COOLDOWN
+        if self.cfg.burst_rewards > 0 and self._tokens(session, action, now_ts)[0] < 1.0:
+            return DENY_RATE
+        if score < self.cfg.min_score:
+            return DENY_SCORE
+        return ALLOWED
+
+    def _note(self, session: DogSession, ts: float, action: str | None) -> None:
+        session.last_reward_ts = ts
+        if action is not None and self.cfg.burst_rewards > 0:
+            bucket = self._tokens(session, action, ts)
+            bucket[0] = max(0.0, bucket[0] - 1.0)
+
+    def evaluate(
+        self,
+        now_ts: float | None,
+        action: str,
+        score: float,
+        cooldown_s: float,
+        dog_id: str = DEFAULT_DOG_ID,
+    ) -> GuardDecision:
+        """Return whether ``dog_id`` may be rewarded for ``action`` and why.
+
+        ``now_ts=None`` reads the current time from the guard's clock.
+        """
+
+        if now_ts is None:
+            now_ts = self.clock.time()
         if action == "BARK" and not self.cfg.allow_bark_reward:
-            return False
-        if now_ts - self._last_reward_ts < max(cooldown_s, self.cfg.min_inter_reward_s):
-            return False
-        return score >= 0.6
+            return DENY_BARK
+        with self.backend.transaction() as txn:
+            session = self._session(txn, dog_id, now_ts)
+            decision = self._evaluate(session, now_ts, action, score, cooldown_s)
+            txn.save(dog_id, session)
+        return decision
+
+    def can_reward(
+        self,
+        now_ts: float | None,
+        action: str,
+        score: float,
+        cooldown_s: float,
+        dog_id: str = DEFAULT_DOG_ID,
+    ) -> bool:
+        return self.evaluate(now_ts, action, score, cooldown_s, dog_id).allowed
+
+    def note_reward(
+        self,
+        ts: float | None = None,
+        action: str | None = None,
+        dog_id: str = DEFAULT_DOG_ID,
+    ) -> None:
+        if ts is None:
+            ts = self.clock.time()
+        with self.backend.transaction() as txn:
+            session = self._session(txn, dog_id, ts)
+            self._note(session, ts, action)
+            txn.save(dog_id, session)
+
+    def try_reward(
+        self,
+        now_ts: float | None,
+        action: str,
+        score: float,
+        cooldown_s: float,
+        dog_id: str = DEFAULT_DOG_ID,
+    ) -> GuardDecision:
+        """Evaluate and, if allowed, record the reward in one transaction."""
+
+        if now_ts is None:
+            now_ts = self.clock.time()
+        if action == "BARK" and not self.cfg.allow_bark_reward:
+            decision = DENY_BARK
+        else:
+            with self.backend.transaction() as txn:
+                session = self._session(txn, dog_id, now_ts)
+                decision = self._evaluate(session, now_ts, action, score, cooldown_s)
+                if decision.allowed:
+                    self._note(session, now_ts, action)
+                txn.save(dog_id, session)
+        GUARD_DECISIONS.labels(decision.reason).inc()
+        return decision
+
+    def restore(self, rewards: Iterable[tuple[float, str, str]]) -> int:
+        """Replay ``(ts, action, dog_id)`` rewards in time order, e.g. from the ledger."""
+
+        count = 0
+        with self.backend.transaction() as txn:
+            for ts, action, dog_id in rewards:
+                session = self._session(txn, dog_id, ts)
+                self._note(session, ts, action)
+                txn.save(dog_id, session)
+                count += 1
+        return count
+
+    def end_session(self, dog_id: str) -> None:
+        """Forget all state kept for ``dog_id``."""
 
-    def note_reward(self, ts: float) -> None:
-        self._last_reward_ts = ts
\ No newline at end of file
+        with self.backend.transaction() as txn:
+            txn.delete(dog_id)
@@ -0,0 +1,262 @@
+"""Append-only binary ledger of reward decisions.
+
+Every decision made by :class:`vct.robodog.dog_bot_brain.RoboDogBrain` is
+stored as a fixed-size 64 byte record so the file can be memory-mapped and
+read as a NumPy structured array.  Aggregating a day of events is then a
+handful of vectorised operations instead of parsing log lines.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+MAGIC = b"VCTLEDG\x01"
+HEADER = struct.Struct("<8sII")
+RECORD_DTYPE = np.dtype(
+    [
+        ("ts", "<f8"),
+        ("score", "<f4"),
+        ("rewarded", "u1"),
+        ("reason", "u1"),
+        ("_pad", "V2"),
+        ("dog", "S32"),
+        ("action", "S16"),
+    ]
+)
+RECORD = struct.Struct("<dfBB2x32s16s")
+assert RECORD.size == RECORD_DTYPE.itemsize == 64
+
+REASON_CODES: dict[str, int] = {
+    "ok": 0,
+    "bark_blocked": 1,
+    "session_limit": 2,
+    "cooldown": 3,
+    "rate_limited": 4,
+    "low_score": 5,
+    "not_rewardable": 6,
+}
+REASON_NAMES = {code: name for name, code in REASON_CODES.items()}
+_UNKNOWN_REASON = 255
+
+
+@dataclass(frozen=True)
+class LedgerEvent:
+    ts: float
+    dog_id: str
+    action: str
+    score: float
+    rewarded: bool
+    reason: str
+
+
+def _encode(value: str, size: int) -> bytes:
+    raw = value.encode("utf-8")
+    if len(raw) <= size:
+        return raw
+    # Truncate on a character boundary so the stored prefix stays valid UTF-8.
+    return raw[:size].decode("utf-8", errors="ignore").encode("utf-8")
+
+
+class RewardLedger:
+    """Group-committing writer for the reward ledger.
+
+    Records are buffered and written in one ``write`` call once
+    ``commit_every`` records have accumulated or ``commit_interval_s`` has
+    elapsed since the previous commit, whichever happens first.  A daemon
+    thread commits due records even when no further append arrives.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        commit_every: int = 64,
+        commit_interval_s: float = 1.0,
+        fsync: bool = False,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.commit_every = max(1, int(commit_every))
+        self.commit_interval_s = float(commit_interval_s)
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._buffer = bytearray()
+        self._pending = 0
+        self._last_commit = time.monotonic()
+        self._file = self.path.open("ab")
+        if self._file.tell() == 0:
+            self._file.write(HEADER.pack(MAGIC, RECORD.size, 0))
+            self._file.flush()
+        else:
+            _check_header(self.path)
+            # Drop a partially written trailing record left by a crash.
+            excess = (self._file.tell() - HEADER.size) % RECORD.size
+            if excess:
+                self._file.truncate(self._file.tell() - excess)
+                self._file.seek(0, os.SEEK_END)
+        self._stop = threading.Event()
+        self._flusher: threading.Thread | None = None
+        if self.commit_interval_s > 0:
+            self._flusher = threading.Thread(target=self._flush_periodically, name="vct-ledger", daemon=True)
+            self._flusher.start()
+
+    def append(
+        self,
+        ts: float,
+        dog_id: str,
+        action: str,
+        score: float,
+        rewarded: bool,
+        reason: str,
+    ) -> None:
+        record = RECORD.pack(
+            float(ts),
+            float(score),
+            1 if rewarded else 0,
+            REASON_CODES.get(reason, _UNKNOWN_REASON),
+            _encode(dog_id, 32),
+            _encode(action, 16),
+        )
+        with self._lock:
+            self._buffer += record
+            self._pending += 1
+            if (
+                self._pending >= self.commit_every
+                or time.monotonic() - self._last_commit >= self.commit_interval_s
+            ):
+                self._commit_locked()
+
+    def _commit_locked(self) -> None:
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self._buffer.clear()
+            self._pending = 0
+        self._last_commit = time.monotonic()
+
+    def _flush_periodically(self) -> None:
+        while not self._stop.wait(self.commit_interval_s):
+            with self._lock:
+                if self._file.closed:
+                    return
+                if self._buffer and time.monotonic() - self._last_commit >= self.commit_interval_s:
+                    self._commit_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._commit_locked()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join()
+        with self._lock:
+            if self._file.closed:
+                return
+            self._commit_locked()
+            self._file.close()
+
+    def __enter__(self) -> "RewardLedger":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def _check_header(path: Path) -> None:
+    with path.open("rb") as handle:
+        header = handle.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise ValueError(f"Truncated ledger header: {path}")
+    magic, record_size, _ = HEADER.unpack(header)
+    if magic != MAGIC or record_size != RECORD.size:
+        raise ValueError(f"Not a reward ledger or unsupported version: {path}")
+
+
+def read_ledger(path: str | Path) -> np.ndarray:
+    """Memory-map the ledger at ``path`` as a structured array of records."""
+
+    path = Path(path)
+    _check_header(path)
+    count = (path.stat().st_size - HEADER.size) // RECORD.size
+    if count <= 0:
+        return np.empty(0, dtype=RECORD_DTYPE)
+    return np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER.size, shape=(count,))
+
+
+def _window(records: np.ndarray, since: float | None, until: float | None) -> np.ndarray:
+    if since is None and until is None:
+        return records
+    mask = np.ones(records.shape[0], dtype=bool)
+    if since is not None:
+        mask &= records["ts"] >= since
+    if until is not None:
+        mask &= records["ts"] < until
+    return records[mask]
+
+
+def replay(
+    path: str | Path,
+    *,
+    since: float | None = None,
+    until: float | None = None,
+) -> Iterator[LedgerEvent]:
+    """Yield ledger events in write order, optionally limited to a time window."""
+
+    for row in _window(read_ledger(path), since, until):
+        yield LedgerEvent(
+            ts=float(row["ts"]),
+            dog_id=row["dog"].decode("utf-8"),
+            action=row["action"].decode("utf-8"),
+            score=float(row["score"]),
+            rewarded=bool(row["rewarded"]),
+            reason=REASON_NAMES.get(int(row["reason"]), "unknown"),
+        )
+
+
+def aggregate(
+    records: np.ndarray,
+    *,
+    since: float | None = None,
+    until: float | None = None,
+) -> dict[str, dict[str, float]]:
+    """Summarise decisions per action: count, rewards and mean score."""
+
+    records = _window(records, since, until)
+    summary: dict[str, dict[str, float]] = {}
+    if records.shape[0] == 0:
+        return summary
+    actions, inverse = np.unique(records["action"], return_inverse=True)
+    counts = np.bincount(inverse, minlength=actions.shape[0])
+    rewards = np.bincount(inverse, weights=records["rewarded"], minlength=actions.shape[0])
+    score_sums = np.bincount(inverse, weights=records["score"], minlength=actions.shape[0])
+    for idx, action in enumerate(actions):
+        summary[action.decode("utf-8")] = {
+            "decisions": int(counts[idx]),
+            "rewards": int(rewards[idx]),
+            "mean_score": float(score_sums[idx] / counts[idx]),
+        }
+    return summary
+
+
+def rewarded_events(records: np.ndarray, *, since: float | None = None) -> Iterable[tuple[float, str, str]]:
+    """Return ``(ts, action, dog_id)`` for rewarded records in time order."""
+
+    records = _window(records, since, None)
+    rewarded = records[records["rewarded"] == 1]
+    order = np.argsort(rewarded["ts"], kind="stable")
+    return [
+        (float(row["ts"]), row["action"].decode("utf-8"), row["dog"].decode("utf-8"))
+        for row in rewarded[order]
+    ]
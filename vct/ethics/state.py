@@ -0,0 +1,217 @@
+"""Storage backends for per-dog guard sessions.
+
+:class:`~vct.ethics.guard.EthicsGuard` keeps its rules in code and its
+per-dog state (session start, last activity, last reward and token buckets)
+in a backend.  Every check-and-book runs inside one backend transaction:
+
+* :class:`MemoryStateBackend` — an LRU dict behind a re-entrant lock, for a
+  single process;
+* :class:`SQLiteStateBackend` — a table in a local SQLite file in WAL mode.
+  Transactions use ``BEGIN IMMEDIATE``, so concurrent API workers serialise
+  on the database write lock and a reward is booked by exactly one of them.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Mapping
+
+BACKENDS = ("memory", "sqlite")
+
+
+class DogSession:
+    __slots__ = ("started_ts", "last_seen_ts", "last_reward_ts", "buckets")
+
+    def __init__(self, now_ts: float) -> None:
+        self.started_ts = now_ts
+        self.last_seen_ts = now_ts
+        self.last_reward_ts = 0.0
+        # action -> [tokens, last_refill_ts]
+        self.buckets: dict[str, list[float]] = {}
+
+
+class StateTransaction:
+    """Operations available inside :meth:`StateBackend.transaction`."""
+
+    def load(self, dog_id: str) -> DogSession | None:  # pragma: no cover - interface
+        raise NotImplementedError
+
+    def save(self, dog_id: str, session: DogSession) -> None:  # pragma: no cover - interface
+        raise NotImplementedError
+
+    def delete(self, dog_id: str) -> None:  # pragma: no cover - interface
+        raise NotImplementedError
+
+    def evict(self, idle_cutoff_ts: float, max_sessions: int) -> None:
+        """Drop sessions last seen before ``idle_cutoff_ts``, then the oldest beyond ``max_sessions``."""
+
+        raise NotImplementedError  # pragma: no cover - interface
+
+
+class StateBackend:
+    def transaction(self) -> Any:  # pragma: no cover - interface
+        """Context manager yielding a :class:`StateTransaction` under an exclusive lock."""
+
+        raise NotImplementedError
+
+    def count(self) -> int:  # pragma: no cover - interface
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release connections or files held by the backend."""
+
+
+class MemoryStateBackend(StateBackend, StateTransaction):
+    """Process-local sessions in an LRU ordered by last activity."""
+
+    def __init__(self) -> None:
+        self._sessions: OrderedDict[str, DogSession] = OrderedDict()
+        self._lock = threading.RLock()
+
+    @contextmanager
+    def transaction(self) -> Iterator[MemoryStateBackend]:
+        with self._lock:
+            yield self
+
+    def count(self) -> int:
+        return len(self._sessions)
+
+    def load(self, dog_id: str) -> DogSession | None:
+        return self._sessions.get(dog_id)
+
+    def save(self, dog_id: str, session: DogSession) -> None:
+        self._sessions[dog_id] = session
+        self._sessions.move_to_end(dog_id)
+
+    def delete(self, dog_id: str) -> None:
+        self._sessions.pop(dog_id, None)
+
+    def evict(self, idle_cutoff_ts: float, max_sessions: int) -> None:
+        sessions = self._sessions
+        while sessions:
+            oldest = next(iter(sessions.values()))
+            if oldest.last_seen_ts >= idle_cutoff_ts and len(sessions) <= max_sessions:
+                break
+            sessions.popitem(last=False)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dog_sessions (
+    dog_id TEXT PRIMARY KEY,
+    started_ts REAL NOT NULL,
+    last_seen_ts REAL NOT NULL,
+    last_reward_ts REAL NOT NULL,
+    buckets TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS dog_sessions_last_seen ON dog_sessions (last_seen_ts);
+"""
+
+
+class _SQLiteTransaction(StateTransaction):
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def load(self, dog_id: str) -> DogSession | None:
+        row = self.conn.execute(
+            "SELECT started_ts, last_seen_ts, last_reward_ts, buckets FROM dog_sessions WHERE dog_id = ?",
+            (dog_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        session = DogSession(row[0])
+        session.last_seen_ts = row[1]
+        session.last_reward_ts = row[2]
+        session.buckets = json.loads(row[3])
+        return session
+
+    def save(self, dog_id: str, session: DogSession) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO dog_sessions VALUES (?, ?, ?, ?, ?)",
+            (dog_id, session.started_ts, session.last_seen_ts, session.last_reward_ts, json.dumps(session.buckets)),
+        )
+
+    def delete(self, dog_id: str) -> None:
+        self.conn.execute("DELETE FROM dog_sessions WHERE dog_id = ?", (dog_id,))
+
+    def evict(self, idle_cutoff_ts: float, max_sessions: int) -> None:
+        self.conn.execute("DELETE FROM dog_sessions WHERE last_seen_ts < ?", (idle_cutoff_ts,))
+        (count,) = self.conn.execute("SELECT COUNT(*) FROM dog_sessions").fetchone()
+        if count > max_sessions:
+            self.conn.execute(
+                "DELETE FROM dog_sessions WHERE dog_id IN "
+                "(SELECT dog_id FROM dog_sessions ORDER BY last_seen_ts LIMIT ?)",
+                (count - max_sessions,),
+            )
+
+
+class SQLiteStateBackend(StateBackend):
+    """Sessions shared by every process that opens the same SQLite file.
+
+    Each thread gets its own connection; ``timeout_s`` bounds how long a
+    transaction waits for another process holding the write lock.
+    """
+
+    def __init__(self, path: str | Path, *, timeout_s: float = 5.0) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.timeout_s = timeout_s
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        conn = self._connection()
+        conn.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout_s, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[_SQLiteTransaction]:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield _SQLiteTransaction(conn)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def count(self) -> int:
+        return int(self._connection().execute("SELECT COUNT(*) FROM dog_sessions").fetchone()[0])
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+
+def create_state_backend(options: Mapping[str, Any] | None = None) -> StateBackend:
+    """Build the backend named by ``options["backend"]`` (default ``memory``)."""
+
+    options = dict(options or {})
+    kind = str(options.get("backend", "memory")).lower()
+    if kind == "memory":
+        return MemoryStateBackend()
+    if kind == "sqlite":
+        path = options.get("path")
+        if not path:
+            raise ValueError("The sqlite state backend needs a 'path'")
+        return SQLiteStateBackend(path, timeout_s=float(options.get("timeout_s", 5.0)))
+    raise ValueError(f"Unknown state backend '{kind}', expected one of {BACKENDS}")
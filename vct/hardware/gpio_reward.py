@@ -1,13 +1,23 @@
-import time
+from ..utils.clock import SYSTEM_CLOCK, Clock
 class RewardActuatorBase:
     def trigger(self, seconds: float = 0.5) -> None: raise NotImplementedError
+    def on(self) -> None: raise NotImplementedError
+    def off(self) -> None: raise NotImplementedError
 
 class SimulatedActuator(RewardActuatorBase):
+    def __init__(self, clock: Clock = SYSTEM_CLOCK) -> None:
+        self.is_on = False; self.clock = clock
     def trigger(self, seconds: float = 0.5) -> None:
-        print(f"[REWARD] Simulated dispenser {seconds:.2f}s"); time.sleep(min(seconds, 0.05))
+        print(f"[REWARD] Simulated dispenser {seconds:.2f}s"); self.clock.sleep(min(seconds, 0.05))
+    def on(self) -> None:
+        self.is_on = True; print("[REWARD] Simulated dispenser on")
+    def off(self) -> None:
+        self.is_on = False
 
 class GPIOActuator(RewardActuatorBase):
-    def __init__(self, pin: int):
+    def __init__(self, pin: int, clock: Clock = SYSTEM_CLOCK):
+        self.pin = pin; self.clock = clock
+        self._fallback = SimulatedActuator(clock)
         try:
             from gpiozero import OutputDevice  # type: ignore
             self.device = OutputDevice(pin); self.available = True
@@ -15,5 +25,13 @@ class GPIOActuator(RewardActuatorBase):
             self.device = None; self.available = False
     def trigger(self, seconds: float = 0.5) -> None:
         if not self.available or self.device is None:
-            SimulatedActuator().trigger(seconds); return
-        self.device.on(); time.sleep(seconds); self.device.off()
\ No newline at end of file
+            self._fallback.trigger(seconds); return
+        self.device.on(); self.clock.sleep(seconds); self.device.off()
+    def on(self) -> None:
+        if not self.available or self.device is None:
+            self._fallback.on(); return
+        self.device.on()
+    def off(self) -> None:
+        if not self.available or self.device is None:
+            self._fallback.off(); return
+        self.device.off()
@@ -0,0 +1,239 @@
+"""Non-blocking pulse scheduling for reward dispensers."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+from ..utils.clock import SYSTEM_CLOCK, Clock, VirtualClock
+from .gpio_reward import RewardActuatorBase
+
+_ON = 1
+_OFF = 0
+
+
+@dataclass
+class PulseStats:
+    """Edge timing statistics for one channel (or all channels combined)."""
+
+    pulses: int = 0
+    merged: int = 0
+    edges: int = 0
+    total_jitter_s: float = 0.0
+    max_jitter_s: float = 0.0
+
+    @property
+    def mean_jitter_s(self) -> float:
+        return self.total_jitter_s / self.edges if self.edges else 0.0
+
+
+class _Channel:
+    __slots__ = ("actuator", "off_deadline", "stats")
+
+    def __init__(self, actuator: RewardActuatorBase) -> None:
+        self.actuator = actuator
+        # Deadline of the pending OFF edge while the output is (about to be) on.
+        self.off_deadline: Optional[float] = None
+        self.stats = PulseStats()
+
+
+class ScheduledActuator(RewardActuatorBase):
+    """Actuator proxy whose ``trigger`` hands the pulse to a :class:`PulseScheduler`."""
+
+    def __init__(self, scheduler: "PulseScheduler", name: str) -> None:
+        self.scheduler = scheduler
+        self.name = name
+
+    def trigger(self, seconds: float = 0.5) -> None:
+        self.scheduler.pulse(self.name, seconds)
+
+    def on(self) -> None:
+        # An endless pulse: the channel stays on until off() cancels it.
+        self.scheduler.pulse(self.name, math.inf)
+
+    def off(self) -> None:
+        self.scheduler.cancel(self.name)
+
+
+class PulseScheduler:
+    """Owns a set of actuators and drives their on/off edges from one thread.
+
+    ``pulse`` only pushes edges onto a heap and returns immediately; the timer
+    thread sleeps until the next deadline and switches the outputs.  A pulse
+    requested while a channel is already on extends the pending OFF edge
+    instead of toggling the output, so overlapping requests merge into one
+    continuous pulse.  The difference between each scheduled and actual edge
+    time is accumulated as jitter per channel.
+
+    With a :class:`~vct.utils.clock.VirtualClock` no thread is started; due
+    edges fire whenever the clock advances (or :meth:`run_pending` is called).
+    """
+
+    def __init__(self, clock: Clock = SYSTEM_CLOCK) -> None:
+        self._clock = clock.monotonic
+        self._channels: dict[str, _Channel] = {}
+        self._heap: list[tuple[float, int, str, int]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        if clock.realtime:
+            self._thread = threading.Thread(target=self._run, name="vct-pulses", daemon=True)
+            self._thread.start()
+        elif isinstance(clock, VirtualClock):
+            clock.add_listener(self.run_pending)
+
+    def register(self, name: str, actuator: RewardActuatorBase) -> ScheduledActuator:
+        with self._cond:
+            if name in self._channels:
+                raise ValueError(f"Actuator channel '{name}' is already registered")
+            self._channels[name] = _Channel(actuator)
+        return ScheduledActuator(self, name)
+
+    @property
+    def channels(self) -> tuple[str, ...]:
+        return tuple(self._channels)
+
+    def pulse(self, name: str, seconds: float) -> None:
+        """Switch ``name`` on now and off ``seconds`` later without blocking."""
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("PulseScheduler is closed")
+            channel = self._channels[name]
+            now = self._clock()
+            deadline = now + max(0.0, seconds)
+            channel.stats.pulses += 1
+            if channel.off_deadline is not None:
+                channel.stats.merged += 1
+                if deadline <= channel.off_deadline:
+                    return
+            else:
+                heapq.heappush(self._heap, (now, next(self._seq), name, _ON))
+            channel.off_deadline = deadline
+            if deadline != math.inf:
+                # An endless pulse has no OFF edge until cancel() adds one.
+                heapq.heappush(self._heap, (deadline, next(self._seq), name, _OFF))
+            self._cond.notify()
+        if self._thread is None:
+            self.run_pending()
+
+    def cancel(self, name: str) -> None:
+        """Switch ``name`` off at the next opportunity."""
+
+        with self._cond:
+            channel = self._channels[name]
+            if channel.off_deadline is None:
+                return
+            now = self._clock()
+            channel.off_deadline = now
+            heapq.heappush(self._heap, (now, next(self._seq), name, _OFF))
+            self._cond.notify()
+        if self._thread is None:
+            self.run_pending()
+
+    def is_on(self, name: str) -> bool:
+        with self._cond:
+            return self._channels[name].off_deadline is not None
+
+    def _pop_due(self, block: bool = True) -> Optional[tuple[float, str, int, _Channel]]:
+        with self._cond:
+            while True:
+                if (self._closed or not block) and not self._heap:
+                    return None
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                deadline, _, name, edge = self._heap[0]
+                delay = deadline - self._clock()
+                if delay > 0 and not self._closed:
+                    if not block:
+                        return None
+                    # Condition.wait overflows on timeouts beyond the platform's time_t.
+                    self._cond.wait(min(delay, threading.TIMEOUT_MAX))
+                    continue
+                heapq.heappop(self._heap)
+                channel = self._channels[name]
+                if edge == _OFF:
+                    if channel.off_deadline is None or deadline != channel.off_deadline:
+                        continue  # superseded by a merged, longer pulse
+                    channel.off_deadline = None
+                return deadline, name, edge, channel
+
+    def _run(self) -> None:
+        while True:
+            item = self._pop_due()
+            if item is None:
+                return
+            self._fire(*item)
+
+    def run_pending(self) -> int:
+        """Fire every edge that is already due; returns the number fired."""
+
+        fired = 0
+        while True:
+            item = self._pop_due(block=False)
+            if item is None:
+                return fired
+            self._fire(*item)
+            fired += 1
+
+    def _fire(self, deadline: float, name: str, edge: int, channel: _Channel) -> None:
+        try:
+            if edge == _ON:
+                channel.actuator.on()
+            else:
+                channel.actuator.off()
+        except Exception as exc:  # pragma: no cover - hardware dependent
+            print(f"[REWARD:error] {name}: {exc}")
+        jitter = max(0.0, self._clock() - deadline)
+        with self._cond:
+            stats = channel.stats
+            stats.edges += 1
+            stats.total_jitter_s += jitter
+            stats.max_jitter_s = max(stats.max_jitter_s, jitter)
+            self._cond.notify_all()
+
+    def stats(self, name: Optional[str] = None) -> PulseStats:
+        with self._cond:
+            if name is not None:
+                src = self._channels[name].stats
+                return PulseStats(src.pulses, src.merged, src.edges, src.total_jitter_s, src.max_jitter_s)
+            total = PulseStats()
+            for channel in self._channels.values():
+                s = channel.stats
+                total.pulses += s.pulses
+                total.merged += s.merged
+                total.edges += s.edges
+                total.total_jitter_s += s.total_jitter_s
+                total.max_jitter_s = max(total.max_jitter_s, s.max_jitter_s)
+            return total
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until every channel is off and no edges are pending."""
+
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._heap and all(c.off_deadline is None for c in self._channels.values()),
+                timeout,
+            )
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Switch all outputs off and stop the timer thread."""
+
+        with self._cond:
+            now = self._clock()
+            for name, channel in self._channels.items():
+                if channel.off_deadline is not None:
+                    channel.off_deadline = now
+                    heapq.heappush(self._heap, (now, next(self._seq), name, _OFF))
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        else:
+            self.run_pending()
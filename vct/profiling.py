@@ -0,0 +1,329 @@
+"""Per-stage CPU and allocation profiling of the command pipeline.
+
+:class:`StageProfiler` wraps the entry points of each pipeline stage on a
+live :class:`~vct.robodog.dog_bot_brain.RoboDogBrain` — transcription,
+command matching, the policy, the reward guard, the actuator and speech —
+and runs a workload through it.  Every stage gets its own ``cProfile``
+profile (time spent outside the stages lands in ``other``), its call count,
+wall time and tracemalloc peak, and for the first ``alloc_samples`` calls a
+snapshot diff showing the lines whose allocations outlive the call.
+
+With ``sample_interval_s`` the workload's Python stack is also sampled on a
+CPU-time timer signal (main thread, Unix only) and :meth:`ProfileReport.write_collapsed` writes it in the
+collapsed format read by ``flamegraph.pl`` and speedscope, with the stage
+as the root frame.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import functools
+import os
+import signal
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+STAGES = ("stt", "matching", "policy", "guard", "actuator", "tts")
+OTHER = "other"
+
+# (stage, owner attribute on the brain or None for the brain itself, method name)
+_ENTRY_POINTS = (
+    ("stt", "stt", "transcribe"),
+    ("matching", None, "_action_from_text"),
+    ("policy", "policy", "decide"),
+    ("policy", "policy", "score_features"),  # hot-path mode
+    ("guard", None, "_reserve_reward"),
+    ("actuator", None, "_pulse"),
+    ("tts", "tts", "enqueue"),
+)
+_IGNORED_FILES = frozenset((tracemalloc.__file__, __file__))
+
+
+def _location(filename: str, lineno: int, name: str | None = None) -> str:
+    try:
+        filename = os.path.relpath(filename)
+    except ValueError:  # pragma: no cover - different drive on Windows
+        pass
+    return f"{filename}:{lineno}" + (f"({name})" if name else "")
+
+
+@dataclass(frozen=True)
+class HotFunction:
+    location: str
+    calls: int
+    tottime_s: float
+    cumtime_s: float
+
+
+@dataclass(frozen=True)
+class AllocationSite:
+    location: str
+    size_bytes: int
+    count: int
+
+
+@dataclass
+class StageReport:
+    name: str
+    calls: int = 0
+    seconds: float = 0.0
+    peak_bytes: int = 0
+    hot: list[HotFunction] = field(default_factory=list)
+    allocations: list[AllocationSite] = field(default_factory=list)
+
+    @property
+    def mean_ms(self) -> float:
+        return self.seconds * 1000.0 / self.calls if self.calls else 0.0
+
+
+@dataclass
+class ProfileReport:
+    elapsed_s: float
+    stages: dict[str, StageReport]
+    alloc_samples: int
+    overhead_s: float = 0.0
+    stacks: dict[str, int] = field(default_factory=dict)
+
+    def describe(self) -> str:
+        lines = [
+            f"profiled {self.elapsed_s * 1000.0:.1f} ms (+{self.overhead_s * 1000.0:.1f} ms profiler bookkeeping)",
+            f"{'stage':<10} {'calls':>7} {'total ms':>10} {'mean ms':>9} {'peak KiB':>9}",
+        ]
+        for stage in self.stages.values():
+            lines.append(
+                f"{stage.name:<10} {stage.calls:>7} {stage.seconds * 1000.0:>10.2f} "
+                f"{stage.mean_ms:>9.3f} {stage.peak_bytes / 1024.0:>9.1f}"
+            )
+        for stage in self.stages.values():
+            if stage.hot:
+                lines.append("")
+                lines.append(f"== {stage.name}: hot functions ==")
+                lines.append(f"  {'tottime ms':>10} {'cumtime ms':>10} {'calls':>7}  function")
+                for fn in stage.hot:
+                    lines.append(
+                        f"  {fn.tottime_s * 1000.0:>10.3f} {fn.cumtime_s * 1000.0:>10.3f} {fn.calls:>7}  {fn.location}"
+                    )
+            if stage.allocations:
+                lines.append(f"== {stage.name}: retained allocations (first {self.alloc_samples} calls) ==")
+                for site in stage.allocations:
+                    lines.append(f"  {site.size_bytes / 1024.0:>+9.2f} KiB {site.count:>6} blocks  {site.location}")
+        return "\n".join(lines)
+
+    def write_collapsed(self, path: str | Path) -> int:
+        """Write sampled stacks as ``frame;frame;... count`` lines; returns the line count."""
+
+        with open(path, "w", encoding="utf-8") as fh:
+            for stack, count in sorted(self.stacks.items()):
+                fh.write(f"{stack} {count}\n")
+        return len(self.stacks)
+
+
+class StageProfiler:
+    """Attribute CPU time and allocations of a workload to pipeline stages."""
+
+    def __init__(self, *, top: int = 10, alloc_samples: int = 20, sample_interval_s: float | None = None) -> None:
+        self.top = top
+        self.alloc_samples = alloc_samples
+        self.sample_interval_s = sample_interval_s
+        names = STAGES + (OTHER,)
+        self._profiles = {name: cProfile.Profile() for name in names}
+        self._reports = {name: StageReport(name) for name in names}
+        # stage -> (filename, lineno) -> retained bytes / blocks
+        self._sites: dict[str, Counter[tuple[str, int]]] = {name: Counter() for name in STAGES}
+        self._blocks: dict[str, Counter[tuple[str, int]]] = {name: Counter() for name in STAGES}
+        self._stack = [OTHER]
+        self._overhead_s = 0.0
+        self._patched: list[tuple[Any, str]] = []
+
+    def attach(self, brain: Any) -> None:
+        """Wrap the stage entry points of ``brain`` (instance attributes only)."""
+
+        for stage, owner_name, method in _ENTRY_POINTS:
+            owner = brain if owner_name is None else getattr(brain, owner_name)
+            setattr(owner, method, self._wrap(stage, getattr(owner, method)))
+            self._patched.append((owner, method))
+
+    def detach(self) -> None:
+        for owner, method in self._patched:
+            owner.__dict__.pop(method, None)
+        self._patched.clear()
+
+    def _wrap(self, stage: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            token = self._enter(stage)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._exit(stage, token)
+
+        return wrapper
+
+    def _enter(self, stage: str) -> tuple[Any, int, float]:
+        entered = time.perf_counter()
+        self._profiles[self._stack[-1]].disable()
+        self._stack.append(stage)
+        before = tracemalloc.take_snapshot() if self._reports[stage].calls < self.alloc_samples else None
+        start_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        self._profiles[stage].enable()
+        now = time.perf_counter()
+        self._overhead_s += now - entered
+        return before, start_bytes, now
+
+    def _exit(self, stage: str, token: tuple[Any, int, float]) -> None:
+        before, start_bytes, started = token
+        exited = time.perf_counter()
+        elapsed = exited - started
+        self._profiles[stage].disable()
+        peak = tracemalloc.get_traced_memory()[1] - start_bytes
+        report = self._reports[stage]
+        report.calls += 1
+        report.seconds += elapsed
+        report.peak_bytes = max(report.peak_bytes, peak)
+        if before is not None:
+            for diff in tracemalloc.take_snapshot().compare_to(before, "lineno"):
+                frame = diff.traceback[0]
+                if diff.size_diff > 0 and frame.filename not in _IGNORED_FILES:
+                    where = (frame.filename, frame.lineno)
+                    self._sites[stage][where] += diff.size_diff
+                    self._blocks[stage][where] += max(diff.count_diff, 0)
+        self._stack.pop()
+        self._profiles[self._stack[-1]].enable()
+        self._overhead_s += time.perf_counter() - exited
+
+    def run(self, workload: Callable[[], Any]) -> ProfileReport:
+        """Run ``workload`` on this thread and collect the per-stage report."""
+
+        sampler = None
+        if self.sample_interval_s:
+            sampler = _StackSampler(self, self.sample_interval_s, StageProfiler.run.__code__)
+            sampler.start()
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        started = time.perf_counter()
+        profile = self._profiles[OTHER]
+        profile.enable()
+        try:
+            workload()
+        finally:
+            profile.disable()
+            elapsed = time.perf_counter() - started
+            if not was_tracing:
+                tracemalloc.stop()
+            if sampler is not None:
+                sampler.stop()
+        other = self._reports[OTHER]
+        other.calls = 1
+        elapsed -= self._overhead_s
+        other.seconds = max(0.0, elapsed - sum(self._reports[s].seconds for s in STAGES))
+        for name, report in self._reports.items():
+            report.hot = self._hot_functions(self._profiles[name])
+            if name in self._sites:
+                report.allocations = [
+                    AllocationSite(_location(*where), size, self._blocks[name][where])
+                    for where, size in self._sites[name].most_common(self.top)
+                ]
+        stages = {name: report for name, report in self._reports.items() if report.calls}
+        return ProfileReport(
+            elapsed, stages, self.alloc_samples, self._overhead_s, dict(sampler.stacks) if sampler else {}
+        )
+
+    def _hot_functions(self, profile: cProfile.Profile) -> list[HotFunction]:
+        profile.create_stats()
+        rows = profile.stats  # type: ignore[attr-defined]
+        # The stage wrappers themselves are bookkeeping, not workload.
+        ranked = sorted(
+            (item for item in rows.items() if item[0][0] != __file__), key=lambda item: item[1][2], reverse=True
+        )
+        hot = []
+        for (filename, lineno, name), (_, calls, tottime, cumtime, _) in ranked[: self.top]:
+            if filename == "~":  # built-in functions have no source location
+                where = name
+            else:
+                where = _location(filename, lineno, name)
+            hot.append(HotFunction(where, calls, tottime, cumtime))
+        return hot
+
+
+class _StackSampler:
+    """Sample the workload's stack on a CPU-time (``ITIMER_PROF``) timer signal.
+
+    The handler runs on the main thread between bytecodes, so samples are
+    not biased towards the points where the workload releases the GIL, as
+    they would be with a sampling thread.  Unix only.
+    """
+
+    def __init__(self, profiler: StageProfiler, interval_s: float, root_code: Any) -> None:
+        if not hasattr(signal, "setitimer"):
+            raise RuntimeError("Stack sampling needs signal.setitimer (Unix)")
+        self.profiler = profiler
+        self.interval_s = interval_s
+        self.root_code = root_code
+        self.stacks: Counter[str] = Counter()
+        self._previous: Any = None
+
+    def start(self) -> None:
+        self._previous = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval_s, self.interval_s)
+
+    def stop(self) -> None:
+        signal.setitimer(signal.ITIMER_PROF, 0.0, 0.0)
+        signal.signal(signal.SIGPROF, self._previous)
+
+    def _sample(self, signum: int, frame: FrameType | None) -> None:
+        names: list[str] = []
+        while frame is not None and frame.f_code is not self.root_code:
+            code = frame.f_code
+            if code.co_filename == __file__ and code.co_name != "run":
+                if code.co_name in ("_enter", "_exit"):
+                    return  # profiler bookkeeping, not workload
+            else:
+                module = Path(code.co_filename).stem
+                names.append(f"{module}.{getattr(code, 'co_qualname', code.co_name)}")
+            frame = frame.f_back
+        if names:
+            names.append(self.profiler._stack[-1])
+            self.stacks[";".join(reversed(names))] += 1
+
+
+def command_workload(
+    brain: Any, commands: Sequence[str], iterations: int, *, interval_s: float = 1.0
+) -> Callable[[], None]:
+    """Cycle ``commands`` through ``handle_command``, ``interval_s`` apart on the brain's clock."""
+
+    def run() -> None:
+        for i in range(iterations):
+            brain.handle_command(commands[i % len(commands)])
+            brain.clock.sleep(interval_s)
+
+    return run
+
+
+def wav_workload(brain: Any, wav_paths: Sequence[str], iterations: int, *, interval_s: float = 1.0) -> Callable[[], None]:
+    """Cycle WAV files through ``run_once_from_wav``."""
+
+    def run() -> None:
+        for i in range(iterations):
+            brain.run_once_from_wav(wav_paths[i % len(wav_paths)])
+            brain.clock.sleep(interval_s)
+
+    return run
+
+
+def session_workload(
+    brain: Any, commands: Sequence[str], iterations: int, *, interval_s: float = 1.0, seed: int = 42
+) -> Callable[[], None]:
+    """One :class:`~vct.simulation.dog_env.DogEnv` session of ``iterations`` steps."""
+
+    from .simulation.dog_env import DogEnv
+
+    env = DogEnv(seed=seed)
+    return lambda: env.run_session(brain, commands, steps=iterations, interval_s=interval_s)
@@ -2,20 +2,47 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import threading
 import time
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Executor
+from functools import partial
 from pathlib import Path
 from typing import Any
 
-from ..behavior.policy import BehaviorInputs, BehaviorPolicy
+import numpy as np
+
+from ..behavior.policy import BehaviorInputs, BehaviorPolicy, feature_matrix
 from ..configuration import DEFAULT_CONFIG_PATH, RoboDogConfig, load_config
+from ..engines.audio import decode_pcm
 from ..engines.stt import WhisperSTT
-from ..engines.tts import PrintTTS, create_tts_engine
-from ..ethics.guard import EthicsGuard
+from ..engines.tts import NullTTS, PrintTTS, create_tts_engine
+from ..ethics.guard import (
+    DEFAULT_DOG_ID,
+    NOT_REWARDABLE,
+    EthicsConfig,
+    EthicsGuard,
+    GuardDecision,
+)
+from ..ethics.ledger import RewardLedger, read_ledger, rewarded_events
+from ..ethics.state import MemoryStateBackend, create_state_backend
 from ..hardware.gpio_reward import GPIOActuator, SimulatedActuator
+from ..hardware.scheduler import PulseScheduler
+from ..utils.clock import SIMULATION_EPOCH, SYSTEM_CLOCK, Clock, VirtualClock
 from ..utils.logging import get_logger
+from ..utils.metrics import DECISIONS, REWARDS, STAGE_SECONDS
+from ..utils.tracing import Tracer
 
 log = get_logger("RoboDogBrain")
+_DECIDE_SECONDS = STAGE_SECONDS.labels("decide")
+_ACTUATOR_SECONDS = STAGE_SECONDS.labels("actuator")
+
+
+def _log_effect_error(future: asyncio.Future[Any]) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        log.error("Side effect failed: %s", future.exception())
 
 
 class RoboDogBrain:
@@ -28,6 +55,10 @@ class RoboDogBrain:
         simulate: bool = False,
         *,
         config_overrides: Mapping[str, Any] | None = None,
+        scheduler: PulseScheduler | None = None,
+        clock: Clock | None = None,
+        recorder: Any = None,
+        defer_warmup: bool = False,
     ) -> None:
         if isinstance(cfg_path, RoboDogConfig):
             self.config = cfg_path
@@ -39,18 +70,49 @@ class RoboDogBrain:
         # compatibility with earlier integrations.
         self.cfg = self.config.model_dump()
 
+        # Every time-dependent component shares this clock so simulations can
+        # swap in a VirtualClock and skip through cooldowns instantly.
+        self.clock = clock or SYSTEM_CLOCK
+        # Optional EpisodeRecorder capturing live decisions (no env feedback).
+        self.recorder = recorder
+        # Inputs behind the most recent decision, used by online learning.
+        self.last_inputs: BehaviorInputs | None = None
+        # Span trees of recent commands; every call is a no-op while disabled.
+        self.tracer = Tracer(self.config.tracing.capacity, enabled=self.config.tracing.enabled)
         self.stt = WhisperSTT()
         if simulate:
             self.tts = PrintTTS()
         else:
-            self.tts = create_tts_engine(self.config.tts.model_dump())
+            # With defer_warmup the phrase cache is filled later by warm_up().
+            self.tts = create_tts_engine(self.config.tts.model_dump(), prerender=not defer_warmup)
 
         self.policy = BehaviorPolicy(self.config.weights)
         self.reward_map: dict[str, bool] = dict(self.config.reward_triggers)
         self.cooldown_s = float(self.config.reward_cooldown_s)
         self.simulate = simulate
-        self.actuator = SimulatedActuator() if (simulate or gpio_pin is None) else GPIOActuator(gpio_pin)
-        self.guard = EthicsGuard()
+        if simulate or gpio_pin is None:
+            actuator = SimulatedActuator(self.clock)
+        else:
+            actuator = GPIOActuator(gpio_pin, self.clock)
+        self._owns_scheduler = scheduler is None and self.config.hardware.non_blocking
+        if self._owns_scheduler:
+            scheduler = PulseScheduler(self.clock)
+        self.scheduler = scheduler
+        if scheduler is not None:
+            # Pulses are handed to the shared timer thread so rewards never block.
+            channel = f"gpio{gpio_pin}" if gpio_pin is not None else f"dispenser{len(scheduler.channels)}"
+            self.actuator = scheduler.register(channel, actuator)
+        else:
+            self.actuator = actuator
+        self.pulse_s = float(self.config.hardware.pulse_s)
+        self.guard = EthicsGuard(
+            EthicsConfig(**self.config.ethics.model_dump()),
+            clock=self.clock,
+            backend=create_state_backend(self.config.state.model_dump()),
+        )
+        self.ledger: RewardLedger | None = None
+        if self.config.ledger.path:
+            self._open_ledger(Path(self.config.ledger.path))
 
         defaults = self.config.behavior_defaults
         self.behavior_defaults = {
@@ -60,6 +122,128 @@ class RoboDogBrain:
             "social_context": float(defaults.social_context),
         }
         self.behavior_context = {k: float(v) for k, v in defaults.context.items()}
+        self.hot_path = bool(self.config.hot_path)
+        self._init_hot_path()
+
+    @classmethod
+    def for_simulation(
+        cls,
+        cfg_path: str | Path | RoboDogConfig | None = None,
+        *,
+        config_overrides: Mapping[str, Any] | None = None,
+        clock: Clock | None = None,
+        **kwargs: Any,
+    ) -> RoboDogBrain:
+        """Build a silent brain on virtual time for simulations, benchmarks and tests.
+
+        Rewards go to a simulated dispenser, speech is discarded and the clock
+        starts at :data:`~vct.utils.clock.SIMULATION_EPOCH` unless given.
+        """
+
+        brain = cls(
+            cfg_path,
+            simulate=True,
+            config_overrides=config_overrides,
+            clock=clock or VirtualClock(start=SIMULATION_EPOCH),
+            **kwargs,
+        )
+        brain.tts = NullTTS()
+        return brain
+
+    def _init_hot_path(self) -> None:
+        """Precompute what :meth:`decide` would rebuild on every hot-path call.
+
+        The context signal depends only on the action, the constant features
+        are clamped once, and feedback phrases are pre-formatted for every
+        score with two decimals.  Feature buffers are per thread.
+        """
+
+        actions = {*self.config.commands_map.values(), "NONE"}
+        self._refresh_hot_path()
+        self._hot_local = threading.local()
+        self._feedback_phrases = {
+            (action, rewarded): [
+                f"Дія: {action} score={k / 100:.2f}" + (" — ✅ винагорода" if rewarded else "") for k in range(101)
+            ]
+            for action in actions
+            for rewarded in (False, True)
+        }
+
+    def _refresh_hot_path(self) -> None:
+        """Recompute the context signals and constant features from the current mappings.
+
+        Copies of the mappings are kept so :meth:`_hot_features` can notice
+        when a caller replaced or edited them in place.
+        """
+
+        self._hot_sources = (
+            dict(self.reward_map),
+            dict(self.behavior_context),
+            dict(self.behavior_defaults),
+        )
+        actions = {*self.config.commands_map.values(), "NONE"}
+        self._context_signals = {action: self._context_signal(action) for action in actions}
+        clamp = BehaviorInputs._clamp
+        self._proximity_feature = clamp(self.behavior_defaults["proximity"])
+        self._threat_feature = clamp(self.behavior_defaults["threat_level"])
+        self._social_feature = clamp(self.behavior_defaults["social_context"])
+
+    def _open_ledger(self, path: Path) -> None:
+        options = self.config.ledger
+        if options.restore_guard and path.exists():
+            ethics = self.config.ethics
+            horizon = max(ethics.session_idle_s, ethics.max_session_min * 60.0, self.cooldown_s)
+            restored = self.guard.restore(rewarded_events(read_ledger(path), since=self.clock.time() - horizon))
+            log.info("Restored %d rewards from ledger %s", restored, path)
+        self.ledger = RewardLedger(
+            path,
+            commit_every=options.commit_every,
+            commit_interval_s=options.commit_interval_s,
+            fsync=options.fsync,
+        )
+
+    def close(self) -> None:
+        """Flush the reward ledger and stop background engines and timers."""
+
+        if self.ledger is not None:
+            self.ledger.close()
+        if self.recorder is not None:
+            self.recorder.flush()
+        if self._owns_scheduler and self.scheduler is not None:
+            self.scheduler.close()
+        self.guard.backend.close()
+        self.tts.close()
+
+    def warm_up(self) -> dict[str, float]:
+        """Exercise the matcher, policy, TTS cache and STT model once.
+
+        Returns seconds spent per stage.  A missing STT backend is logged and
+        skipped, as text commands keep working without it.
+        """
+
+        timings: dict[str, float] = {}
+        started = time.perf_counter()
+        for phrase in self.config.commands_map:
+            self._action_from_text(phrase)
+        timings["matcher"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        action = next(iter(self.config.commands_map.values()), "NONE")
+        self.policy.decide(action, BehaviorInputs(1.0, 0.85, 0.5, context=dict(self.behavior_context)))
+        self.score_batch([action])
+        timings["policy"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        self.tts.prerender(self.config.tts.prerender)
+        timings["tts"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        try:
+            self.stt.warm_up()
+        except Exception as exc:  # optional dependency (whisper) may be absent
+            log.warning("STT warm-up skipped: %s", exc)
+        timings["stt"] = time.perf_counter() - started
+        return timings
 
     def _action_from_text(self, text: str) -> str:
         mapping = self.config.commands_map
@@ -69,56 +253,392 @@ class RoboDogBrain:
                 return value
         return "NONE"
 
-    def _maybe_reward(self, action: str, score: float) -> bool:
+    def _context_signal(self, action: str) -> float:
+        context = dict(self.behavior_context)
+        context["action_known"] = 1.0 if action != "NONE" else 0.0
+        context["reward_available"] = 1.0 if self.reward_map.get(action, False) else 0.0
+        return BehaviorInputs(0.0, 0.0, 0.0, context=context).context_signal()
+
+    def score_batch(
+        self,
+        texts: Sequence[str],
+        confidence: Any = 0.85,
+        reward_bias: Any = 0.5,
+        mood: Any = 0.0,
+        energy_level: Any = None,
+    ) -> tuple[list[str], np.ndarray]:
+        """Match and score many commands at once without side effects.
+
+        Numeric arguments may be scalars or arrays aligned with ``texts``.
+        Returns the matched actions and their policy scores; rewards, speech
+        and the ledger are left to the caller.
+        """
+
+        matched: dict[str, str] = {}
+        signals: dict[str, float] = {}
+        actions: list[str] = []
+        for text in texts:
+            action = matched.get(text)
+            if action is None:
+                action = matched[text] = self._action_from_text(text)
+                if action not in signals:
+                    signals[action] = self._context_signal(action)
+            actions.append(action)
+        known = np.array([a != "NONE" for a in actions], dtype=np.float64)
+        context_signal = np.array([signals[a] for a in actions], dtype=np.float64)
+        features = feature_matrix(
+            known,
+            confidence,
+            reward_bias,
+            mood,
+            self.behavior_defaults["energy_level"] if energy_level is None else energy_level,
+            self.behavior_defaults["proximity"],
+            self.behavior_defaults["threat_level"],
+            self.behavior_defaults["social_context"],
+            context_signal,
+        )
+        return actions, self.policy.score_batch(features)
+
+    def _reserve_reward(self, action: str, score: float, dog_id: str = DEFAULT_DOG_ID) -> bool:
+        """Decide on a reward and book it with the guard in one atomic step.
+
+        Actuation is left to the caller so it can run off the event loop.
+        """
+
+        now = self.clock.time()
         if not self.reward_map.get(action, False):
-            return False
-        now = time.time()
-        if not self.guard.can_reward(now, action, score, self.cooldown_s):
-            return False
-        self.actuator.trigger(0.4)
-        self.guard.note_reward(now)
-        return True
+            decision: GuardDecision = NOT_REWARDABLE
+        else:
+            decision = self.guard.try_reward(now, action, score, self.cooldown_s, dog_id)
+        if self.ledger is not None:
+            self.ledger.append(now, dog_id, action, score, decision.allowed, decision.reason)
+        return decision.allowed
 
-    def handle_command(
+    def _decision_blocks(self) -> bool:
+        """Whether :meth:`decide` may wait on I/O: a shared state backend's lock or a ledger write."""
+
+        return self.ledger is not None or not isinstance(self.guard.backend, MemoryStateBackend)
+
+    def decide(
         self,
         text: str,
         confidence: float = 0.85,
         reward_bias: float = 0.5,
         mood: float | None = None,
         energy_level: float | None = None,
-    ) -> dict[str, Any]:
-        action = self._action_from_text(text)
-        context = dict(self.behavior_context)
-        context["action_known"] = 1.0 if action != "NONE" else 0.0
-        context["reward_available"] = 1.0 if self.reward_map.get(action, False) else 0.0
-        resolved_mood = 0.0 if mood is None else mood
-        resolved_energy = (
-            self.behavior_defaults["energy_level"]
-            if energy_level is None
-            else energy_level
-        )
-        inputs = BehaviorInputs(
-            stimulus=1.0 if action != "NONE" else 0.0,
-            confidence=confidence,
-            reward_bias=reward_bias,
-            mood=resolved_mood,
-            energy_level=resolved_energy,
-            proximity=self.behavior_defaults["proximity"],
-            threat_level=self.behavior_defaults["threat_level"],
-            social_context=self.behavior_defaults["social_context"],
-            context=context,
+        *,
+        dog_id: str = DEFAULT_DOG_ID,
+    ) -> tuple[dict[str, Any], str]:
+        """Run the CPU-only part of a command: matching, policy and guard.
+
+        Returns the result and the feedback phrase; the blocking side effects
+        (dispensing and speech) are applied by :meth:`handle_command` or
+        :meth:`handle_command_async`.
+        """
+
+        started = time.perf_counter()
+        tracer = self.tracer
+        with tracer.span("matching"):
+            action = self._action_from_text(text)
+        if self.hot_path:
+            resolved_mood = 0.0 if mood is None else mood
+            resolved_energy = self.behavior_defaults["energy_level"] if energy_level is None else energy_level
+            with tracer.span("features"):
+                features = self._hot_features(action, confidence, reward_bias, resolved_mood, resolved_energy)
+            with tracer.span("policy"):
+                score = self.policy.score_features(features)
+            decided = self._conclude(
+                text, action, score, dog_id, confidence, reward_bias, resolved_mood, resolved_energy
+            )
+            _DECIDE_SECONDS.observe(time.perf_counter() - started)
+            return decided
+        with tracer.span("features"):
+            context = dict(self.behavior_context)
+            context["action_known"] = 1.0 if action != "NONE" else 0.0
+            context["reward_available"] = 1.0 if self.reward_map.get(action, False) else 0.0
+            resolved_mood = 0.0 if mood is None else mood
+            resolved_energy = (
+                self.behavior_defaults["energy_level"]
+                if energy_level is None
+                else energy_level
+            )
+            inputs = BehaviorInputs(
+                stimulus=1.0 if action != "NONE" else 0.0,
+                confidence=confidence,
+                reward_bias=reward_bias,
+                mood=resolved_mood,
+                energy_level=resolved_energy,
+                proximity=self.behavior_defaults["proximity"],
+                threat_level=self.behavior_defaults["threat_level"],
+                social_context=self.behavior_defaults["social_context"],
+                context=context,
+            )
+        self.last_inputs = inputs
+        with tracer.span("policy"):
+            vector = self.policy.decide(action, inputs)
+        decided = self._conclude(
+            text, vector.action, vector.score, dog_id, confidence, reward_bias, resolved_mood, resolved_energy
         )
-        vector = self.policy.decide(action, inputs)
-        rewarded = self._maybe_reward(vector.action, vector.score)
-        feedback = f"Дія: {vector.action} score={vector.score:.2f}" + (" — ✅ винагорода" if rewarded else "")
-        self.tts.speak(feedback)
+        _DECIDE_SECONDS.observe(time.perf_counter() - started)
+        return decided
+
+    def _hot_features(
+        self, action: str, confidence: float, reward_bias: float, mood: float, energy_level: float
+    ) -> list[float]:
+        """Fill this thread's feature buffer exactly as ``BehaviorInputs.to_feature_vector`` would."""
+
+        rewards, context, defaults = self._hot_sources
+        # Comparing a handful of keys allocates nothing; rebuilding only happens after an edit.
+        if (
+            rewards != self.reward_map
+            or context != self.behavior_context
+            or defaults != self.behavior_defaults
+        ):
+            self._refresh_hot_path()
+        features = getattr(self._hot_local, "features", None)
+        if features is None:
+            features = self._hot_local.features = [0.0] * len(BehaviorPolicy.feature_names)
+        context_signal = self._context_signals.get(action)
+        if context_signal is None:
+            context_signal = self._context_signals[action] = self._context_signal(action)
+        features[0] = 1.0 if action != "NONE" else 0.0
+        features[1] = max(0.0, min(1.0, confidence))
+        features[2] = max(0.0, min(1.0, reward_bias))
+        features[3] = max(0.0, min(1.0, (mood + 1.0) / 2.0))
+        features[4] = max(0.0, min(1.0, energy_level))
+        features[5] = self._proximity_feature
+        features[6] = self._threat_feature
+        features[7] = self._social_feature
+        features[8] = context_signal
+        return features
+
+    def last_features(self) -> list[float] | None:
+        """Feature vector behind the most recent decision (on this thread in hot-path mode)."""
+
+        if self.hot_path:
+            features = getattr(self._hot_local, "features", None)
+            return list(features) if features is not None else None
+        return self.last_inputs.to_feature_vector() if self.last_inputs is not None else None
+
+    def _feedback(self, action: str, score: float, rewarded: bool) -> str:
+        if self.hot_path:
+            phrases = self._feedback_phrases.get((action, rewarded))
+            if phrases is not None:
+                # round() and ":.2f" both round the exact binary value correctly.
+                return phrases[int(round(score, 2) * 100.0 + 0.5)]
+        return f"Дія: {action} score={score:.2f}" + (" — ✅ винагорода" if rewarded else "")
+
+    def _conclude(
+        self,
+        text: str,
+        action: str,
+        score: float,
+        dog_id: str,
+        confidence: float,
+        reward_bias: float,
+        mood: float,
+        energy_level: float,
+    ) -> tuple[dict[str, Any], str]:
+        with self.tracer.span("guard"):
+            rewarded = self._reserve_reward(action, score, dog_id)
+        DECISIONS.labels(action).inc()
+        feedback = self._feedback(action, score, rewarded)
         log.info(feedback)
-        return {"action": vector.action, "score": vector.score, "rewarded": rewarded}
+        result = {"action": action, "score": score, "rewarded": rewarded}
+        if self.recorder is not None:
+            self.recorder.record(
+                text, result, confidence=confidence, reward_bias=reward_bias, mood=mood, energy_level=energy_level
+            )
+        return result, feedback
+
+    def decide_batch(
+        self,
+        texts: Sequence[str],
+        confidence: Any = 0.85,
+        reward_bias: Any = 0.5,
+        mood: Any = 0.0,
+        dog_ids: Sequence[str] | None = None,
+    ) -> list[tuple[dict[str, Any], str]]:
+        """Vectorised :meth:`decide` for many commands.
+
+        All commands are scored by one :meth:`score_batch` call; rewards are
+        then booked with the guard in input order, so two commands for the
+        same dog in one batch obey its cooldown exactly as sequential calls
+        would.
+        """
+
+        started = time.perf_counter()
+        n = len(texts)
+        actions, scores = self.score_batch(texts, confidence, reward_bias, mood)
+        confidences = np.broadcast_to(np.asarray(confidence, dtype=np.float64), (n,))
+        biases = np.broadcast_to(np.asarray(reward_bias, dtype=np.float64), (n,))
+        moods = np.broadcast_to(np.asarray(mood, dtype=np.float64), (n,))
+        ids = list(dog_ids) if dog_ids is not None else [DEFAULT_DOG_ID] * n
+        energy = float(self.behavior_defaults["energy_level"])
+        decided = [
+            self._conclude(
+                texts[i],
+                actions[i],
+                float(scores[i]),
+                ids[i],
+                float(confidences[i]),
+                float(biases[i]),
+                float(moods[i]),
+                energy,
+            )
+            for i in range(n)
+        ]
+        _DECIDE_SECONDS.observe(time.perf_counter() - started)
+        return decided
+
+    def _pulse(self, action: str) -> None:
+        with self.tracer.span("actuator"), _ACTUATOR_SECONDS.time():
+            self.actuator.trigger(self.pulse_s)
+        REWARDS.labels(action).inc()
+
+    def _apply_effects(self, result: Mapping[str, Any], feedback: str, dog_id: str) -> None:
+        if result["rewarded"]:
+            self._pulse(result["action"])
+        with self.tracer.span("tts"):
+            self.tts.enqueue(feedback, key=dog_id)
+
+    def handle_command(
+        self,
+        text: str,
+        confidence: float = 0.85,
+        reward_bias: float = 0.5,
+        mood: float | None = None,
+        energy_level: float | None = None,
+        *,
+        dog_id: str = DEFAULT_DOG_ID,
+    ) -> dict[str, Any]:
+        with self.tracer.trace("handle_command") as span:
+            result, feedback = self.decide(text, confidence, reward_bias, mood, energy_level, dog_id=dog_id)
+            self._apply_effects(result, feedback, dog_id)
+            if span is not None:
+                span.attrs.update(text=text, dog_id=dog_id, action=result["action"], rewarded=result["rewarded"])
+        return result
+
+    async def handle_command_async(
+        self,
+        text: str,
+        confidence: float = 0.85,
+        reward_bias: float = 0.5,
+        mood: float | None = None,
+        energy_level: float | None = None,
+        *,
+        dog_id: str = DEFAULT_DOG_ID,
+        executor: Executor | None = None,
+    ) -> dict[str, Any]:
+        """Event-loop friendly :meth:`handle_command`.
+
+        The decision runs inline when it is CPU-only; with a shared state
+        backend or a ledger it may block, so it runs in ``executor`` too.
+        Dispensing is awaited in ``executor`` and speech is queued there
+        without holding up the response.
+        """
+
+        with self.tracer.trace("handle_command_async") as span:
+            loop = asyncio.get_running_loop()
+            if self._decision_blocks():
+                decide = partial(self.decide, text, confidence, reward_bias, mood, energy_level, dog_id=dog_id)
+                if span is not None:
+                    decide = partial(contextvars.copy_context().run, decide)
+                result, feedback = await loop.run_in_executor(executor, decide)
+            else:
+                result, feedback = self.decide(text, confidence, reward_bias, mood, energy_level, dog_id=dog_id)
+            if result["rewarded"]:
+                if span is None:
+                    await loop.run_in_executor(executor, self._pulse, result["action"])
+                else:
+                    # Run in a copy of this context so the actuator span joins the trace.
+                    await loop.run_in_executor(executor, contextvars.copy_context().run, self._pulse, result["action"])
+            if span is not None:
+                span.attrs.update(text=text, dog_id=dog_id, action=result["action"], rewarded=result["rewarded"])
+        speech = loop.run_in_executor(executor, self.tts.enqueue, feedback, dog_id)
+        speech.add_done_callback(_log_effect_error)
+        return result
+
+    async def handle_batch_async(
+        self,
+        texts: Sequence[str],
+        confidence: Any = 0.85,
+        reward_bias: Any = 0.5,
+        mood: Any = 0.0,
+        dog_ids: Sequence[str] | None = None,
+        *,
+        executor: Executor | None = None,
+    ) -> list[dict[str, Any]]:
+        """Event-loop friendly :meth:`decide_batch` with side effects applied.
+
+        Dispensing for the whole batch is awaited as one executor job; speech
+        is queued afterwards without holding up the response.  As in
+        :meth:`handle_command_async`, decisions that may block run in
+        ``executor``.
+        """
+
+        loop = asyncio.get_running_loop()
+        if self._decision_blocks():
+            decided = await loop.run_in_executor(
+                executor, partial(self.decide_batch, texts, confidence, reward_bias, mood, dog_ids)
+            )
+        else:
+            decided = self.decide_batch(texts, confidence, reward_bias, mood, dog_ids)
+        ids = list(dog_ids) if dog_ids is not None else [DEFAULT_DOG_ID] * len(decided)
+        rewarded = [result["action"] for result, _ in decided if result["rewarded"]]
+        if rewarded:
+            await loop.run_in_executor(executor, self._pulse_many, rewarded)
+        phrases = [(feedback, dog_id) for (_, feedback), dog_id in zip(decided, ids)]
+        speech = loop.run_in_executor(executor, self._speak_many, phrases)
+        speech.add_done_callback(_log_effect_error)
+        return [result for result, _ in decided]
+
+    def _pulse_many(self, actions: Sequence[str]) -> None:
+        for action in actions:
+            self._pulse(action)
+
+    def _speak_many(self, phrases: Sequence[tuple[str, str]]) -> None:
+        for feedback, dog_id in phrases:
+            self.tts.enqueue(feedback, key=dog_id)
+
+    def transcribe_audio(
+        self,
+        audio: bytes | bytearray | memoryview,
+        *,
+        sample_rate: int | None = None,
+        channels: int = 1,
+    ) -> str:
+        """Transcribe an in-memory upload: WAV, or 16-bit PCM when ``sample_rate`` is given."""
+
+        if sample_rate is not None:
+            return self.stt.transcribe(audio=decode_pcm(audio, sample_rate, channels))
+        return self.stt.transcribe(audio=audio)
+
+    def run_once_from_audio(
+        self,
+        audio: bytes | bytearray | memoryview,
+        *,
+        sample_rate: int | None = None,
+        channels: int = 1,
+        dog_id: str = DEFAULT_DOG_ID,
+    ) -> dict[str, Any]:
+        with self.tracer.trace("run_once_from_audio"):
+            with self.tracer.span("stt"):
+                text = self.transcribe_audio(audio, sample_rate=sample_rate, channels=channels)
+            return self._handle_transcript(text, dog_id)
+
+    def run_once_from_wav(self, wav_path: str, *, dog_id: str = DEFAULT_DOG_ID) -> dict[str, Any]:
+        with self.tracer.trace("run_once_from_wav") as span:
+            if span is not None:
+                span.attrs["wav"] = wav_path
+            with self.tracer.span("stt"):
+                text = self.stt.transcribe(wav_path=wav_path)
+            return self._handle_transcript(text, dog_id)
 
-    def run_once_from_wav(self, wav_path: str) -> dict[str, Any]:
-        text = self.stt.transcribe(wav_path=wav_path)
+    def _handle_transcript(self, text: str, dog_id: str) -> dict[str, Any]:
         if not text:
-            self.tts.speak("Команду не розпізнано")
+            with self.tracer.span("tts"):
+                self.tts.enqueue("Команду не розпізнано", key=dog_id)
             return {"action": "NONE", "score": 0.0, "rewarded": False}
-        return self.handle_command(text)
+        return self.handle_command(text, dog_id=dog_id)
 
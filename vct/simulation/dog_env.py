@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 import random
 from typing import Any, Dict
 
+from ..utils.clock import SYSTEM_CLOCK, Clock
+
 
 def _clamp(value: float, low: float, high: float) -> float:
     return max(low, min(high, value))
@@ -34,9 +37,11 @@ class DogEnv:
     behavioural policies without hardware in the loop.
     """
 
-    def __init__(self, seed: int = 42):
+    def __init__(self, seed: int = 42, recorder: Any = None):
         self._rng = random.Random(seed)
         self.s = EnvState()
+        # Optional :class:`vct.simulation.recorder.EpisodeRecorder` fed by ``interact``.
+        self.recorder = recorder
 
     def observe(self) -> EnvState:
         """Return the current environment state."""
@@ -86,12 +91,66 @@ class DogEnv:
         updating the simulator state with the returned decision.
         """
 
+        mood = self.s.mood
+        energy_level = _clamp(1.0 - self.s.fatigue, 0.0, 1.0)
         brain_output = brain.handle_command(
             command,
             confidence=confidence,
             reward_bias=reward_bias,
-            mood=self.s.mood,
-            energy_level=_clamp(1.0 - self.s.fatigue, 0.0, 1.0),
+            mood=mood,
+            energy_level=energy_level,
         )
         env_feedback = self.step(brain_output["action"], brain_output["score"])
+        if self.recorder is not None:
+            self.recorder.record(
+                command,
+                brain_output,
+                env_feedback,
+                confidence=confidence,
+                reward_bias=reward_bias,
+                mood=mood,
+                energy_level=energy_level,
+            )
         return {"brain": brain_output, "env": env_feedback}
+
+    def run_session(
+        self,
+        brain: Any,
+        commands: Sequence[str],
+        *,
+        steps: int,
+        interval_s: float = 1.0,
+        clock: Clock | None = None,
+        confidence: float = 0.85,
+        reward_bias: float = 0.5,
+    ) -> dict[str, Any]:
+        """Run ``steps`` interactions cycling through ``commands``.
+
+        Commands are spaced ``interval_s`` apart on ``clock`` (the brain's clock
+        by default).  With a :class:`~vct.utils.clock.VirtualClock` the waits
+        elapse instantly while cooldowns still see the simulated time.
+        """
+
+        if not commands:
+            raise ValueError("run_session needs at least one command")
+        clock = clock or getattr(brain, "clock", SYSTEM_CLOCK)
+        started = clock.monotonic()
+        rewards = 0
+        successes = 0
+        for i in range(steps):
+            out = self.interact(
+                brain,
+                commands[i % len(commands)],
+                confidence=confidence,
+                reward_bias=reward_bias,
+            )
+            rewards += bool(out["brain"].get("rewarded", False))
+            successes += bool(out["env"]["success"])
+            clock.sleep(interval_s)
+        return {
+            "steps": steps,
+            "rewards": rewards,
+            "successes": successes,
+            "elapsed_s": clock.monotonic() - started,
+            **self.s.to_dict(),
+        }
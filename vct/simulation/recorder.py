@@ -0,0 +1,281 @@
+"""Columnar recording and replay of brain/environment interactions.
+
+Steps are buffered column by column and flushed in fixed-size chunks.  Each
+chunk is a directory of typed ``.npy`` columns (memory-mappable) or, with
+``compress=True``, a single ``.npz`` archive compressed with zlib.  String
+columns (commands and actions) are dictionary encoded into ``uint16`` codes
+with the dictionary stored in ``manifest.json``.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+NUMERIC_COLUMNS: dict[str, str] = {
+    # Inputs keep full precision so replay feeds the brain identical values.
+    "confidence": "<f8",
+    "reward_bias": "<f8",
+    "mood_in": "<f8",
+    "energy_level": "<f8",
+    "score": "<f8",
+    "rewarded": "u1",
+    "success": "i1",  # -1 when no environment feedback was recorded
+    "fatigue": "<f4",
+    "mood": "<f4",
+    "reward_hist": "<f4",
+}
+CATEGORICAL_COLUMNS = ("command", "action")
+COLUMNS = CATEGORICAL_COLUMNS + tuple(NUMERIC_COLUMNS)
+MANIFEST = "manifest.json"
+
+
+class EpisodeRecorder:
+    """Append interaction steps to a chunked columnar store in ``directory``."""
+
+    def __init__(self, directory: str | Path, *, chunk_size: int = 4096, compress: bool = False) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.chunk_size = max(1, int(chunk_size))
+        self.compress = compress
+        manifest = _read_manifest(self.directory)
+        self._chunks: list[dict[str, Any]] = manifest["chunks"]
+        self._dictionaries: dict[str, list[str]] = manifest["dictionaries"]
+        self._codes = {
+            name: {value: idx for idx, value in enumerate(values)}
+            for name, values in self._dictionaries.items()
+        }
+        self._buffer: dict[str, list[Any]] = {name: [] for name in COLUMNS}
+
+    def __len__(self) -> int:
+        return sum(chunk["rows"] for chunk in self._chunks) + len(self._buffer["score"])
+
+    def _code(self, column: str, value: str) -> int:
+        codes = self._codes[column]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+            if code > np.iinfo(np.uint16).max:
+                raise ValueError(f"Too many distinct values in column '{column}'")
+            self._dictionaries[column].append(value)
+        return code
+
+    def record(
+        self,
+        command: str,
+        brain_output: Mapping[str, Any],
+        env_output: Mapping[str, Any] | None = None,
+        *,
+        confidence: float = math.nan,
+        reward_bias: float = math.nan,
+        mood: float = math.nan,
+        energy_level: float = math.nan,
+    ) -> None:
+        """Append one step; ``env_output`` is omitted for live sessions."""
+
+        buf = self._buffer
+        env = env_output or {}
+        buf["command"].append(self._code("command", command))
+        buf["action"].append(self._code("action", str(brain_output.get("action", "NONE"))))
+        buf["confidence"].append(confidence)
+        buf["reward_bias"].append(reward_bias)
+        buf["mood_in"].append(mood)
+        buf["energy_level"].append(energy_level)
+        buf["score"].append(float(brain_output.get("score", math.nan)))
+        buf["rewarded"].append(1 if brain_output.get("rewarded") else 0)
+        buf["success"].append(int(bool(env["success"])) if "success" in env else -1)
+        buf["fatigue"].append(env.get("fatigue", math.nan))
+        buf["mood"].append(env.get("mood", math.nan))
+        buf["reward_hist"].append(env.get("reward_hist", math.nan))
+        if len(buf["score"]) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        rows = len(self._buffer["score"])
+        if rows == 0:
+            return
+        arrays = {name: np.asarray(self._buffer[name], dtype=dtype) for name, dtype in NUMERIC_COLUMNS.items()}
+        for name in CATEGORICAL_COLUMNS:
+            arrays[name] = np.asarray(self._buffer[name], dtype="<u2")
+        name = f"chunk-{len(self._chunks):06d}"
+        if self.compress:
+            np.savez_compressed(self.directory / f"{name}.npz", **arrays)
+            entry = {"name": f"{name}.npz", "rows": rows, "format": "npz"}
+        else:
+            chunk_dir = self.directory / name
+            chunk_dir.mkdir(exist_ok=True)
+            for column, array in arrays.items():
+                np.save(chunk_dir / f"{column}.npy", array)
+            entry = {"name": name, "rows": rows, "format": "npy"}
+        self._chunks.append(entry)
+        self._buffer = {column: [] for column in COLUMNS}
+        self._write_manifest()
+
+    def _write_manifest(self) -> None:
+        tmp = self.directory / f"{MANIFEST}.tmp"
+        tmp.write_text(
+            json.dumps({"chunks": self._chunks, "dictionaries": self._dictionaries}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        tmp.replace(self.directory / MANIFEST)
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "EpisodeRecorder":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def _read_manifest(directory: Path) -> dict[str, Any]:
+    path = directory / MANIFEST
+    if not path.exists():
+        return {"chunks": [], "dictionaries": {name: [] for name in CATEGORICAL_COLUMNS}}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+class EpisodeReader:
+    """Read a recording produced by :class:`EpisodeRecorder`.
+
+    Uncompressed chunks are memory-mapped, so filtering and aggregation only
+    page in the columns that are actually touched.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        manifest = _read_manifest(self.directory)
+        self.chunks: list[dict[str, Any]] = manifest["chunks"]
+        self.dictionaries: dict[str, list[str]] = manifest["dictionaries"]
+        self._cache: dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return sum(chunk["rows"] for chunk in self.chunks)
+
+    def _chunk_column(self, chunk: Mapping[str, Any], name: str) -> np.ndarray:
+        if chunk["format"] == "npz":
+            with np.load(self.directory / chunk["name"]) as archive:
+                if name in archive.files:
+                    return archive[name]
+        else:
+            path = self.directory / chunk["name"] / f"{name}.npy"
+            if path.exists():
+                return np.load(path, mmap_mode="r")
+        # Columns added after the chunk was written read as "not recorded".
+        return np.full(chunk["rows"], np.nan, dtype=NUMERIC_COLUMNS[name])
+
+    def column(self, name: str) -> np.ndarray:
+        """Return the raw column (codes for categorical columns)."""
+
+        if name not in COLUMNS:
+            raise KeyError(f"Unknown column '{name}'")
+        if name not in self._cache:
+            parts = [self._chunk_column(chunk, name) for chunk in self.chunks]
+            if len(parts) == 1:
+                self._cache[name] = parts[0]
+            elif parts:
+                self._cache[name] = np.concatenate(parts)
+            else:
+                self._cache[name] = np.empty(0, dtype=NUMERIC_COLUMNS.get(name, "<u2"))
+        return self._cache[name]
+
+    def labels(self, name: str) -> list[str]:
+        """Decode a categorical column into strings."""
+
+        values = self.dictionaries[name]
+        return [values[code] for code in self.column(name)]
+
+    def mask(self, **equals: Any) -> np.ndarray:
+        """Boolean row mask where every ``column=value`` condition holds."""
+
+        result = np.ones(len(self), dtype=bool)
+        for name, value in equals.items():
+            if name in CATEGORICAL_COLUMNS:
+                codes = self.dictionaries[name]
+                if value not in codes:
+                    return np.zeros(len(self), dtype=bool)
+                result &= self.column(name) == codes.index(value)
+            else:
+                result &= self.column(name) == value
+        return result
+
+    def aggregate(self, by: str = "action") -> dict[str, dict[str, float]]:
+        """Per-value step count, reward rate, success rate and mean score."""
+
+        codes = self.column(by)
+        names = self.dictionaries[by]
+        score = self.column("score")
+        rewarded = self.column("rewarded")
+        success = self.column("success")
+        summary: dict[str, dict[str, float]] = {}
+        for code in np.unique(codes):
+            rows = codes == code
+            env_rows = rows & (success >= 0)
+            summary[names[int(code)]] = {
+                "steps": int(rows.sum()),
+                "reward_rate": float(rewarded[rows].mean()),
+                "success_rate": float(success[env_rows].mean()) if env_rows.any() else math.nan,
+                "mean_score": float(score[rows].mean()),
+            }
+        return summary
+
+    def iter_steps(self) -> Iterator[dict[str, Any]]:
+        columns = {name: self.column(name) for name in COLUMNS}
+        for idx in range(len(self)):
+            row = {name: columns[name][idx].item() for name in NUMERIC_COLUMNS}
+            for name in CATEGORICAL_COLUMNS:
+                row[name] = self.dictionaries[name][int(columns[name][idx])]
+            yield row
+
+
+@dataclass
+class ReplayReport:
+    steps: int = 0
+    action_mismatches: int = 0
+    reward_mismatches: int = 0
+    max_score_delta: float = 0.0
+    mismatched_rows: list[int] = field(default_factory=list)
+
+    @property
+    def identical(self) -> bool:
+        return not self.mismatched_rows
+
+
+def replay(reader: EpisodeReader, brain: Any, *, tolerance: float = 1e-9) -> ReplayReport:
+    """Feed recorded commands back through ``brain`` and compare decisions.
+
+    Recorded inputs (confidence, reward bias, mood and energy level) are
+    reused where they were captured.  Reward outcomes depend on guard timing and are counted
+    separately from action/score regressions.
+    """
+
+    report = ReplayReport()
+    for idx, step in enumerate(reader.iter_steps()):
+        kwargs = {}
+        for source, target in (
+            ("confidence", "confidence"),
+            ("reward_bias", "reward_bias"),
+            ("mood_in", "mood"),
+            ("energy_level", "energy_level"),
+        ):
+            if not math.isnan(step[source]):
+                kwargs[target] = step[source]
+        out = brain.handle_command(step["command"], **kwargs)
+        delta = abs(float(out["score"]) - step["score"])
+        report.steps += 1
+        report.max_score_delta = max(report.max_score_delta, delta)
+        mismatch = out["action"] != step["action"] or delta > tolerance
+        if out["action"] != step["action"]:
+            report.action_mismatches += 1
+        if bool(out["rewarded"]) != bool(step["rewarded"]):
+            report.reward_mismatches += 1
+        if mismatch:
+            report.mismatched_rows.append(idx)
+    return report
@@ -0,0 +1,209 @@
+"""Parallel policy evaluation over :class:`~vct.simulation.dog_env.DogEnv` episodes."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import logging
+import math
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from ..ethics.guard import EthicsGuard
+from ..robodog.dog_bot_brain import RoboDogBrain
+from .dog_env import DogEnv
+
+_worker_brain: RoboDogBrain | None = None
+
+
+@dataclass(frozen=True)
+class EpisodeMetrics:
+    episode: int
+    seed: int
+    steps: int
+    successes: int
+    rewards: int
+    success_rate: float
+    final_mood: float
+    final_fatigue: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class MetricSummary:
+    mean: float
+    std: float
+    ci_low: float
+    ci_high: float
+
+
+@dataclass
+class RolloutSummary:
+    episodes: list[EpisodeMetrics]
+    metrics: dict[str, MetricSummary]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "episodes": len(self.episodes),
+            "metrics": {name: asdict(summary) for name, summary in self.metrics.items()},
+        }
+
+
+SUMMARY_FIELDS = ("success_rate", "rewards", "final_mood", "final_fatigue")
+
+
+def episode_seed(base_seed: int, episode: int) -> int:
+    """Derive an independent, stable seed for ``episode`` from ``base_seed``."""
+
+    return int(np.random.SeedSequence(base_seed, spawn_key=(episode,)).generate_state(1)[0])
+
+
+def summarise(episodes: Sequence[EpisodeMetrics], z: float = 1.96) -> dict[str, MetricSummary]:
+    """Mean, sample standard deviation and normal-approximation CI per metric."""
+
+    summary: dict[str, MetricSummary] = {}
+    n = len(episodes)
+    for name in SUMMARY_FIELDS:
+        values = np.array([getattr(e, name) for e in episodes], dtype=np.float64)
+        if n == 0:
+            summary[name] = MetricSummary(math.nan, math.nan, math.nan, math.nan)
+            continue
+        mean = float(values.mean())
+        std = float(values.std(ddof=1)) if n > 1 else 0.0
+        half = z * std / math.sqrt(n)
+        summary[name] = MetricSummary(mean, std, mean - half, mean + half)
+    return summary
+
+
+def _init_worker(cfg_path: str | None, overrides: Mapping[str, Any] | None) -> None:
+    global _worker_brain
+    logging.getLogger("RoboDogBrain").setLevel(logging.WARNING)
+    _worker_brain = RoboDogBrain.for_simulation(cfg_path, config_overrides=overrides)
+
+
+def _run_episode(
+    brain: RoboDogBrain,
+    episode: int,
+    seed: int,
+    commands: Sequence[str],
+    steps: int,
+    interval_s: float,
+    confidence: float,
+    reward_bias: float,
+) -> EpisodeMetrics:
+    # Fresh guard state per episode keeps results independent of scheduling.
+    brain.guard = EthicsGuard(brain.guard.cfg, clock=brain.clock)
+    env = DogEnv(seed=seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        out = env.run_session(
+            brain,
+            commands,
+            steps=steps,
+            interval_s=interval_s,
+            confidence=confidence,
+            reward_bias=reward_bias,
+        )
+    return EpisodeMetrics(
+        episode=episode,
+        seed=seed,
+        steps=steps,
+        successes=out["successes"],
+        rewards=out["rewards"],
+        success_rate=out["successes"] / steps if steps else 0.0,
+        final_mood=out["mood"],
+        final_fatigue=out["fatigue"],
+    )
+
+
+def _run_chunk(
+    episodes: Sequence[tuple[int, int]],
+    commands: Sequence[str],
+    steps: int,
+    interval_s: float,
+    confidence: float,
+    reward_bias: float,
+) -> list[EpisodeMetrics]:
+    assert _worker_brain is not None, "worker initialiser did not run"
+    return [
+        _run_episode(_worker_brain, ep, seed, commands, steps, interval_s, confidence, reward_bias)
+        for ep, seed in episodes
+    ]
+
+
+class RolloutRunner:
+    """Evaluate the configured brain over many simulated episodes.
+
+    Episodes are sharded across a process pool; each worker keeps one
+    simulate-mode :class:`RoboDogBrain` on a virtual clock.  Episode ``i``
+    is always seeded with :func:`episode_seed` ``(base_seed, i)``, so the
+    per-episode metrics are identical for any number of workers.
+    """
+
+    def __init__(
+        self,
+        commands: Sequence[str],
+        *,
+        steps_per_episode: int = 50,
+        interval_s: float = 1.0,
+        cfg_path: str | Path | None = None,
+        config_overrides: Mapping[str, Any] | None = None,
+        workers: int = 1,
+        base_seed: int = 0,
+        chunk_size: int = 8,
+        confidence: float = 0.85,
+        reward_bias: float = 0.5,
+    ) -> None:
+        if not commands:
+            raise ValueError("RolloutRunner needs at least one command")
+        self.commands = list(commands)
+        self.steps_per_episode = int(steps_per_episode)
+        self.interval_s = float(interval_s)
+        self.cfg_path = str(cfg_path) if cfg_path else None
+        self.config_overrides = dict(config_overrides or {})
+        self.workers = max(1, int(workers))
+        self.base_seed = int(base_seed)
+        self.chunk_size = max(1, int(chunk_size))
+        self.confidence = confidence
+        self.reward_bias = reward_bias
+
+    def _args(self) -> tuple[Any, ...]:
+        return (self.commands, self.steps_per_episode, self.interval_s, self.confidence, self.reward_bias)
+
+    def iter_episodes(self, episodes: int) -> Iterator[EpisodeMetrics]:
+        """Yield per-episode metrics as soon as they are available.
+
+        With several workers, episodes arrive in completion order.
+        """
+
+        plan = [(ep, episode_seed(self.base_seed, ep)) for ep in range(episodes)]
+        if self.workers == 1:
+            brain = RoboDogBrain.for_simulation(self.cfg_path, config_overrides=self.config_overrides)
+            previous = logging.getLogger("RoboDogBrain").level
+            logging.getLogger("RoboDogBrain").setLevel(logging.WARNING)
+            try:
+                for ep, seed in plan:
+                    yield _run_episode(brain, ep, seed, *self._args())
+            finally:
+                logging.getLogger("RoboDogBrain").setLevel(previous)
+            return
+
+        chunks = [plan[i : i + self.chunk_size] for i in range(0, len(plan), self.chunk_size)]
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.cfg_path, self.config_overrides),
+        ) as pool:
+            futures = [pool.submit(_run_chunk, chunk, *self._args()) for chunk in chunks]
+            for future in as_completed(futures):
+                yield from future.result()
+
+    def run(self, episodes: int) -> RolloutSummary:
+        results = sorted(self.iter_episodes(episodes), key=lambda m: m.episode)
+        return RolloutSummary(episodes=results, metrics=summarise(results))
@@ -0,0 +1,85 @@
+"""Injectable time sources for the brain, guard, actuators and simulator."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+
+class Clock:
+    """Minimal clock interface: wall time, monotonic time and sleeping."""
+
+    #: ``False`` for clocks that only move when told to (see :class:`VirtualClock`).
+    realtime = True
+
+    def time(self) -> float:  # pragma: no cover - interface
+        raise NotImplementedError
+
+    def monotonic(self) -> float:  # pragma: no cover - interface
+        raise NotImplementedError
+
+    def sleep(self, seconds: float) -> None:  # pragma: no cover - interface
+        raise NotImplementedError
+
+
+class SystemClock(Clock):
+    """Clock backed by the ``time`` module."""
+
+    def time(self) -> float:
+        return time.time()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class VirtualClock(Clock):
+    """Clock that advances instantly when slept on.
+
+    ``sleep`` and :meth:`advance` move time forward without waiting, so a
+    simulated session covering an hour of cooldowns completes in milliseconds.
+    Listeners are notified after every advance, which lets timer-driven
+    components such as :class:`vct.hardware.scheduler.PulseScheduler` fire
+    the edges that have become due.
+    """
+
+    realtime = False
+
+    def __init__(self, start: float = 0.0) -> None:
+        self._now = float(start)
+        self._lock = threading.Lock()
+        self._listeners: list[Callable[[], None]] = []
+
+    def time(self) -> float:
+        return self._now
+
+    def monotonic(self) -> float:
+        return self._now
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        self._listeners.append(callback)
+
+    def advance(self, seconds: float) -> float:
+        if seconds < 0:
+            raise ValueError("VirtualClock cannot move backwards")
+        with self._lock:
+            self._now += seconds
+            now = self._now
+        for callback in list(self._listeners):
+            callback()
+        return now
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            self.advance(seconds)
+
+
+SYSTEM_CLOCK = SystemClock()
+
+# Simulated time starts well past any cooldown so the first reward of a
+# simulated session is judged the same way however the session is run.
+SIMULATION_EPOCH = 1_000_000.0
@@ -0,0 +1,158 @@
+"""In-process metrics exported through :mod:`prometheus_client`.
+
+Counters, gauges and histograms are registered once (usually at import) in
+:data:`REGISTRY` and updated from the hot path.  Storage, per-series locking
+and the text exposition come from ``prometheus_client``; this module adds a
+registry-wide ``enabled`` switch and caches labelled series.  Every update
+first checks the flag, so a disabled registry costs a single attribute
+lookup per call.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+import prometheus_client
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, generate_latest
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+
+class _Series:
+    """One labelled series; updates are dropped while the registry is disabled."""
+
+    __slots__ = ("_registry", "_child")
+
+    def __init__(self, registry: MetricsRegistry, child: Any) -> None:
+        self._registry = registry
+        self._child = child
+
+    def inc(self, amount: float = 1.0) -> None:
+        if self._registry.enabled:
+            self._child.inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        if self._registry.enabled:
+            self._child.dec(amount)
+
+    def set(self, value: float) -> None:
+        if self._registry.enabled:
+            self._child.set(value)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the value from ``function`` at exposition time."""
+
+        self._child.set_function(function)
+
+    def observe(self, value: float) -> None:
+        if self._registry.enabled:
+            self._child.observe(value)
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+
+class _Metric:
+    def __init__(self, registry: MetricsRegistry, metric: Any, name: str, labelnames: Sequence[str]) -> None:
+        self._registry = registry
+        self._metric = metric
+        self.name = name
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], _Series] = {}
+
+    def labels(self, *values: str, **kwargs: str) -> _Series:
+        """Return the series for the given label values, creating it once."""
+
+        key = values if values else tuple(str(kwargs[n]) for n in self.labelnames)
+        series = self._children.get(key)
+        if series is None:
+            key = tuple(str(v) for v in key)
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            child = self._metric.labels(*key) if self.labelnames else self._metric
+            series = self._children.setdefault(key, _Series(self._registry, child))
+        return series
+
+
+class Counter(_Metric):
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+
+class Gauge(_Metric):
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self.labels().set_function(function)
+
+
+class Histogram(_Metric):
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def time(self) -> Any:
+        return self.labels().time()
+
+
+class MetricsRegistry:
+    """Named collection of metrics rendered in Prometheus text format."""
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._collectors = CollectorRegistry(auto_describe=True)
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register(
+        self, cls: type[_Metric], factory: Any, name: str, help: str, labelnames: Sequence[str], **kwargs: Any
+    ) -> Any:
+        metric = self._metrics.get(name)
+        if metric is None:
+            collector = factory(name, help, tuple(labelnames), registry=self._collectors, **kwargs)
+            metric = self._metrics[name] = cls(self, collector, name, labelnames)
+        elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+            raise ValueError(f"Metric {name} is already registered with a different type or labels")
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, prometheus_client.Counter, name, help, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, prometheus_client.Gauge, name, help, labelnames)
+
+    def histogram(
+        self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram, prometheus_client.Histogram, name, help, labelnames, buckets=tuple(buckets))
+
+    def get(self, name: str) -> _Metric | None:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        return generate_latest(self._collectors).decode("utf-8")
+
+
+REGISTRY = MetricsRegistry()
+
+# Shared series used across the brain, engines, guard and actuator.
+STAGE_SECONDS = REGISTRY.histogram(
+    "vct_stage_seconds", "Time spent per processing stage", ("stage",)
+)
+DECISIONS = REGISTRY.counter("vct_decisions_total", "Commands decided by the brain", ("action",))
+GUARD_DECISIONS = REGISTRY.counter("vct_guard_decisions_total", "Reward guard outcomes", ("reason",))
+REWARDS = REGISTRY.counter("vct_rewards_total", "Rewards dispensed", ("action",))
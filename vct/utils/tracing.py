@@ -0,0 +1,137 @@
+"""Per-command trace spans kept in an in-memory ring buffer.
+
+A :class:`Tracer` opens a root span per command with :meth:`Tracer.trace`;
+code running inside it adds child spans with :meth:`Tracer.span`.  The
+current span lives in a :class:`contextvars.ContextVar`, so spans nest
+across function calls and follow work handed to an executor through
+:func:`contextvars.copy_context`.  Finished traces are kept in a bounded
+deque and :meth:`Tracer.slowest` returns the longest ones.
+
+When the tracer is disabled, or no trace is open, every call returns a
+shared no-op context manager without allocating, so the instrumentation
+can stay on the hot path.
+"""
+
+from __future__ import annotations
+
+import heapq
+import time
+from collections import deque
+from collections.abc import Callable
+from contextvars import ContextVar, Token
+from typing import Any
+
+_CURRENT: ContextVar[Span | None] = ContextVar("vct_current_span", default=None)
+
+
+class Span:
+    __slots__ = ("name", "started", "ended", "attrs", "children")
+
+    def __init__(self, name: str, started: float) -> None:
+        self.name = name
+        self.started = started
+        self.ended: float | None = None
+        self.attrs: dict[str, Any] = {}
+        self.children: list[Span] = []
+
+    @property
+    def duration_s(self) -> float:
+        return (self.ended if self.ended is not None else self.started) - self.started
+
+    def to_dict(self, origin: float | None = None) -> dict[str, Any]:
+        """Nested JSON-friendly form; offsets are relative to ``origin`` (the root's start)."""
+
+        origin = self.started if origin is None else origin
+        data: dict[str, Any] = {
+            "name": self.name,
+            "offset_ms": (self.started - origin) * 1000.0,
+            "duration_ms": self.duration_s * 1000.0,
+        }
+        if self.attrs:
+            data["attrs"] = dict(self.attrs)
+        if self.children:
+            data["children"] = [child.to_dict(origin) for child in list(self.children)]
+        return data
+
+
+class _NoopScope:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NOOP = _NoopScope()
+
+
+class _SpanScope:
+    __slots__ = ("tracer", "span", "parent", "token")
+
+    def __init__(self, tracer: Tracer, span: Span, parent: Span | None) -> None:
+        self.tracer = tracer
+        self.span = span
+        self.parent = parent
+        self.token: Token[Span | None] | None = None
+
+    def __enter__(self) -> Span:
+        if self.parent is not None:
+            self.parent.children.append(self.span)
+        self.token = _CURRENT.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        span = self.span
+        span.ended = self.tracer._clock()
+        if exc_type is not None:
+            span.attrs["error"] = exc_type.__name__
+        if self.token is not None:
+            _CURRENT.reset(self.token)
+        if self.parent is None:
+            self.tracer._finished.append(span)
+
+
+class Tracer:
+    """Record per-command span trees; a no-op unless :attr:`enabled`."""
+
+    def __init__(
+        self, capacity: int = 256, *, enabled: bool = False, clock: Callable[[], float] = time.perf_counter
+    ) -> None:
+        self.enabled = enabled
+        self._clock = clock
+        self._finished: deque[Span] = deque(maxlen=max(1, int(capacity)))
+
+    def trace(self, name: str) -> Any:
+        """Open a root span, or a child span when a trace is already open."""
+
+        if not self.enabled:
+            return _NOOP
+        return _SpanScope(self, Span(name, self._clock()), _CURRENT.get())
+
+    def span(self, name: str) -> Any:
+        """Open a child span of the current one; a no-op outside a trace."""
+
+        parent = _CURRENT.get()
+        if parent is None:
+            return _NOOP
+        return _SpanScope(self, Span(name, self._clock()), parent)
+
+    def annotate(self, key: str, value: Any) -> None:
+        """Attach ``key=value`` to the current span, if any."""
+
+        span = _CURRENT.get()
+        if span is not None:
+            span.attrs[key] = value
+
+    def slowest(self, limit: int = 10) -> list[Span]:
+        """The ``limit`` longest finished traces, slowest first."""
+
+        return heapq.nlargest(max(0, int(limit)), list(self._finished), key=lambda span: span.duration_s)
+
+    def __len__(self) -> int:
+        return len(self._finished)
+
+    def clear(self) -> None:
+        self._finished.clear()